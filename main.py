@@ -1,21 +1,28 @@
 import importlib
+import json
 import logging
 import os
+import sys
+import time
 from pathlib import Path
 
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import RedirectResponse
 from dotenv import load_dotenv
 from src.auth import require_user_id
+from src.circuit_breaker import circuit_breakers
+from src.instrumentation import route_from_scope, route_histograms, start_recording, stop_recording
+from src.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, render_metrics, requests_in_flight, requests_total
 
 # Load Env
 load_dotenv()
 
 logger = logging.getLogger(__name__)
+timing_logger = logging.getLogger("hatchup.timing")
 BASE_DIR = Path(__file__).resolve().parent
 STATIC_DIR = BASE_DIR / "static"
 TEMPLATES_DIR = BASE_DIR / "templates"
@@ -31,23 +38,80 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Requests slower than this are logged at WARNING instead of INFO.
+SLOW_REQUEST_MS = float(os.environ.get("HATCHUP_SLOW_REQUEST_MS", "2000") or 2000)
+
+
+@app.middleware("http")
+async def record_request_timing(request: Request, call_next):
+    # Streaming responses (e.g. the Revenue Wedge event stream) are timed up to their first byte.
+    recorder, token = start_recording(request.scope)
+    status_code = 500
+    requests_in_flight.inc()
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+    finally:
+        requests_in_flight.dec()
+        total_ms = recorder.elapsed_ms()
+        stop_recording(token)
+        route = route_from_scope(request.scope)
+        route_histograms.observe(request.method, route, total_ms)
+        requests_total.inc(method=request.method, route=route, status=status_code)
+        timing_logger.log(
+            logging.WARNING if total_ms >= SLOW_REQUEST_MS else logging.INFO,
+            "request %s",
+            json.dumps(
+                {
+                    "method": request.method,
+                    "route": route,
+                    "status": status_code,
+                    "total_ms": round(total_ms, 1),
+                    "spans": {name: round(total, 1) for name, (total, _count) in recorder.totals().items()},
+                    "breakdown": recorder.breakdown(),
+                    **({"dropped_spans": recorder.dropped} if recorder.dropped else {}),
+                }
+            ),
+        )
+    response.headers["Server-Timing"] = recorder.server_timing(total_ms)
+    return response
+
+
 # Static Files & Templates
 app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
 templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
 
 unavailable_routers = []
+# Set HATCHUP_IMPORT_PROFILE=1 to log per-router import cost at startup and expose it on /healthz.
+# For a per-module breakdown run `python -X importtime -c "import main"`.
+IMPORT_PROFILE = os.environ.get("HATCHUP_IMPORT_PROFILE", "").strip().lower() in {"1", "true", "yes", "on"}
+router_import_timings = []
 
 
 def include_router_safely(module_name: str) -> None:
+    loaded_before = set(sys.modules) if IMPORT_PROFILE else set()
+    started = time.perf_counter()
     try:
         module = importlib.import_module(module_name)
         app.include_router(module.router)
     except Exception as exc:
         unavailable_routers.append({"module": module_name, "error": str(exc)})
         logger.exception("Failed to include router %s", module_name)
+    finally:
+        if IMPORT_PROFILE:
+            new_packages = {name.split(".")[0] for name in set(sys.modules) - loaded_before}
+            router_import_timings.append(
+                {
+                    "module": module_name,
+                    "import_ms": round((time.perf_counter() - started) * 1000, 1),
+                    "new_modules": len(set(sys.modules) - loaded_before),
+                    "new_packages": sorted(new_packages),
+                }
+            )
 
 
 for router_module in (
+    "routers.admin",
     "routers.auth",
     "routers.analyze",
     "routers.chat",
@@ -57,6 +121,16 @@ for router_module in (
 ):
     include_router_safely(router_module)
 
+if IMPORT_PROFILE:
+    for timing in sorted(router_import_timings, key=lambda item: item["import_ms"], reverse=True):
+        logger.warning(
+            "import profile: %s took %.1f ms (%s new modules: %s)",
+            timing["module"],
+            timing["import_ms"],
+            timing["new_modules"],
+            ", ".join(timing["new_packages"][:12]),
+        )
+
 
 def base_template_context(request: Request, mode: str = "vc"):
     return {
@@ -167,5 +241,17 @@ async def healthz():
         {
             "status": "ok",
             "unavailable_routers": unavailable_routers,
+            "circuits": circuit_breakers.snapshot(),
+            **({"import_timings": router_import_timings} if IMPORT_PROFILE else {}),
         }
     )
+
+
+@app.get("/healthz/timings")
+async def healthz_timings():
+    return JSONResponse({"routes": route_histograms.snapshot()})
+
+
+@app.get("/metrics")
+async def metrics():
+    return PlainTextResponse(render_metrics(), media_type=METRICS_CONTENT_TYPE)
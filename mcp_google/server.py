@@ -1,7 +1,12 @@
 
 from mcp.server import FastMCP
+import asyncio
 import os
+import threading
+import time
+from collections import OrderedDict
 import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 from pathlib import Path
 import sys
@@ -15,19 +20,57 @@ mcp = FastMCP("Google Search MCP")
 
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
 SEARCH_ENGINE_ID = os.getenv("SEARCH_ENGINE_ID")  # your custom search engine ID
+SEARCH_URL = "https://www.googleapis.com/customsearch/v1"
+REQUEST_TIMEOUT = (3.05, 8)  # (connect, read) seconds
+RESULT_CACHE_TTL_SECONDS = 300
+RESULT_CACHE_SIZE = 256
+MAX_BATCH_QUERIES = 20
+BATCH_CONCURRENCY = 8
+
+# One pooled session for the life of the server, so repeat searches reuse the TLS connection.
+session = requests.Session()
+session.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=16))
+
+_result_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _cache_get(key):
+    with _cache_lock:
+        entry = _result_cache.get(key)
+        if not entry:
+            return None
+        if time.monotonic() > entry[0]:
+            _result_cache.pop(key, None)
+            return None
+        _result_cache.move_to_end(key)
+        return entry[1]
+
+
+def _cache_set(key, value):
+    with _cache_lock:
+        _result_cache[key] = (time.monotonic() + RESULT_CACHE_TTL_SECONDS, value)
+        _result_cache.move_to_end(key)
+        while len(_result_cache) > RESULT_CACHE_SIZE:
+            _result_cache.popitem(last=False)
+
+
+def _search(query: str, num_results: int):
+    key = (query.strip().lower(), num_results)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
 
-@mcp.tool()
-def google_search(query: str, num_results: int = 5):
-    """Search Google using the Custom Search API."""
-    url = f"https://www.googleapis.com/customsearch/v1"
     params = {
         "key": GOOGLE_API_KEY,
         "cx": SEARCH_ENGINE_ID,
         "q": query,
         "num": num_results
     }
-
-    response = requests.get(url, params=params)
+    try:
+        response = session.get(SEARCH_URL, params=params, timeout=REQUEST_TIMEOUT)
+    except requests.RequestException as e:
+        return {"error": str(e)}
     if response.status_code != 200:
         return {"error": response.text}
 
@@ -40,6 +83,31 @@ def google_search(query: str, num_results: int = 5):
         }
         for item in data.get("items", [])
     ]
+    _cache_set(key, results)
+    return results
+
+
+@mcp.tool()
+async def google_search(query: str, num_results: int = 5):
+    """Search Google using the Custom Search API."""
+    # Run the blocking request off the event loop so concurrent tool calls are not serialized.
+    return await asyncio.to_thread(_search, query, num_results)
+
+
+@mcp.tool()
+async def google_search_batch(queries: list[str], num_results: int = 5):
+    """Run several Google searches concurrently and return the results keyed by query."""
+    unique = list(dict.fromkeys(query for query in queries if query and query.strip()))
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+    async def run(query):
+        async with semaphore:
+            return await asyncio.to_thread(_search, query, num_results)
+
+    accepted = unique[:MAX_BATCH_QUERIES]
+    results = dict(zip(accepted, await asyncio.gather(*(run(query) for query in accepted))))
+    for query in unique[MAX_BATCH_QUERIES:]:
+        results[query] = {"error": f"Batch is limited to {MAX_BATCH_QUERIES} queries."}
     return results
 
 if __name__ == "__main__":
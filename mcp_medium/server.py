@@ -1,20 +1,62 @@
 from mcp.server import FastMCP
+import asyncio
+import threading
+import time
+from collections import OrderedDict
 import requests
+from requests.adapters import HTTPAdapter
 import sys
 from bs4 import BeautifulSoup
 
 mcp = FastMCP("Medium MCP")
 
-@mcp.tool()
-def search_medium(query: str, num_results: int = 5):
-    """
-    Search Medium for articles related to a query.
-    """
-    print(f"[Medium MCP] Searching Medium for: {query}", file=sys.stderr)
-    url = f"https://medium.com/search?q={query.replace(' ', '%20')}"
-    headers = {"User-Agent": "Mozilla/5.0"}
+SEARCH_URL = "https://medium.com/search"
+REQUEST_TIMEOUT = (3.05, 8)  # (connect, read) seconds
+RESULT_CACHE_TTL_SECONDS = 300
+RESULT_CACHE_SIZE = 256
+MAX_BATCH_QUERIES = 20
+BATCH_CONCURRENCY = 4
+
+# One pooled session for the life of the server, so repeat searches reuse the TLS connection.
+session = requests.Session()
+session.headers.update({"User-Agent": "Mozilla/5.0"})
+session.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=16))
+
+_result_cache = OrderedDict()
+_cache_lock = threading.Lock()
 
-    response = requests.get(url, headers=headers)
+
+def _cache_get(key):
+    with _cache_lock:
+        entry = _result_cache.get(key)
+        if not entry:
+            return None
+        if time.monotonic() > entry[0]:
+            _result_cache.pop(key, None)
+            return None
+        _result_cache.move_to_end(key)
+        return entry[1]
+
+
+def _cache_set(key, value):
+    with _cache_lock:
+        _result_cache[key] = (time.monotonic() + RESULT_CACHE_TTL_SECONDS, value)
+        _result_cache.move_to_end(key)
+        while len(_result_cache) > RESULT_CACHE_SIZE:
+            _result_cache.popitem(last=False)
+
+
+def _search(query: str, num_results: int):
+    key = (query.strip().lower(), num_results)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+
+    print(f"[Medium MCP] Searching Medium for: {query}", file=sys.stderr)
+    try:
+        response = session.get(SEARCH_URL, params={"q": query}, timeout=REQUEST_TIMEOUT)
+    except requests.RequestException as e:
+        return {"error": f"Failed to fetch Medium results. {e}"}
     if response.status_code != 200:
         return {"error": f"Failed to fetch Medium results. {response.status_code}"}
 
@@ -28,8 +70,37 @@ def search_medium(query: str, num_results: int = 5):
             href = href.split("?source")[0]
         articles.append({"title": title, "link": href})
 
+    _cache_set(key, articles)
     return articles
 
+
+@mcp.tool()
+async def search_medium(query: str, num_results: int = 5):
+    """
+    Search Medium for articles related to a query.
+    """
+    # Fetch and parse off the event loop so concurrent tool calls are not serialized.
+    return await asyncio.to_thread(_search, query, num_results)
+
+
+@mcp.tool()
+async def search_medium_batch(queries: list[str], num_results: int = 5):
+    """
+    Search Medium for several queries concurrently and return the articles keyed by query.
+    """
+    unique = list(dict.fromkeys(query for query in queries if query and query.strip()))
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+    async def run(query):
+        async with semaphore:
+            return await asyncio.to_thread(_search, query, num_results)
+
+    accepted = unique[:MAX_BATCH_QUERIES]
+    results = dict(zip(accepted, await asyncio.gather(*(run(query) for query in accepted))))
+    for query in unique[MAX_BATCH_QUERIES:]:
+        results[query] = {"error": f"Batch is limited to {MAX_BATCH_QUERIES} queries."}
+    return results
+
 if __name__ == "__main__":
     print("Running Medium MCP...", file=sys.stderr)
     mcp.run(transport="stdio")
@@ -7,7 +7,12 @@ print("[Reddit MCP] Initializing...", file=sys.stderr)
 try:
     from mcp.server import FastMCP
     import praw
+    import asyncio
     import os
+    import threading
+    import time
+    from collections import OrderedDict
+    from concurrent.futures import ThreadPoolExecutor
     from dotenv import load_dotenv
     from pathlib import Path
 except Exception:
@@ -21,57 +26,106 @@ load_dotenv(dotenv_path=env_path)
 
 mcp=FastMCP("Reddit")
 
+REQUEST_TIMEOUT_SECONDS = 8
+COMMENT_FETCH_WORKERS = 4
+RESULT_CACHE_TTL_SECONDS = 120
+RESULT_CACHE_SIZE = 64
+
+# praw is not thread-safe, so each worker thread keeps its own long-lived client (and with it a
+# pooled HTTP session and OAuth token) instead of building one per call.
+_thread_state = threading.local()
+_comment_pool = ThreadPoolExecutor(max_workers=COMMENT_FETCH_WORKERS, thread_name_prefix="reddit-comments")
+
+_result_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _cache_get(key):
+    with _cache_lock:
+        entry = _result_cache.get(key)
+        if not entry:
+            return None
+        if time.monotonic() > entry[0]:
+            _result_cache.pop(key, None)
+            return None
+        _result_cache.move_to_end(key)
+        return entry[1]
+
+
+def _cache_set(key, value):
+    with _cache_lock:
+        _result_cache[key] = (time.monotonic() + RESULT_CACHE_TTL_SECONDS, value)
+        _result_cache.move_to_end(key)
+        while len(_result_cache) > RESULT_CACHE_SIZE:
+            _result_cache.popitem(last=False)
+
+
+def _reddit_client():
+    client = getattr(_thread_state, "client", None)
+    if client is None:
+        client = _thread_state.client = praw.Reddit(
+            client_id=os.getenv("REDDIT_CLIENT_ID"),
+            client_secret=os.getenv("REDDIT_CLIENT_SECRET"),
+            user_agent=os.getenv("USER_AGENT", "echolab-mcp-reddit/0.1"),
+            timeout=REQUEST_TIMEOUT_SECONDS,
+        )
+    return client
+
+
+def _post_with_comments(post_id, comments_per_post):
+    # One request loads the submission together with its comment tree.
+    post = _reddit_client().submission(id=post_id)
+    post_info = {
+        "id": post.id,
+        "title": post.title,
+        "author": str(post.author) if post.author else "deleted",
+        "url": f"https://reddit.com{post.permalink}",
+        "score": int(post.score),
+        "num_comments": int(post.num_comments),
+        "created_utc": float(post.created_utc),
+        "comments": []
+    }
+
+    post.comments.replace_more(limit=0)
+    for comment in post.comments[:comments_per_post]:
+        post_info["comments"].append({
+            "author": str(comment.author) if comment.author else "deleted",
+            "body": comment.body or "",
+            "score": int(comment.score)
+        })
+    return post_info
+
+
+def _fetch_posts(subreddit, limit, comments_per_post):
+    key = (subreddit, limit, comments_per_post)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+
+    post_ids = [post.id for post in _reddit_client().subreddit(subreddit).hot(limit=limit)]
+    # Comment trees are fetched concurrently; map keeps the hot-listing order.
+    posts_data = list(_comment_pool.map(lambda post_id: _post_with_comments(post_id, comments_per_post), post_ids))
+
+    result = {"posts": posts_data}
+    _cache_set(key, result)
+    return result
+
+
 @mcp.tool()
-def fetch_reddit_posts_with_comments(subreddit="all", limit="5", comments_per_post="15"):
+async def fetch_reddit_posts_with_comments(subreddit="all", limit="5", comments_per_post="15"):
     """
     Fetch hot posts and top comments from a subreddit.
     """
     try:
-        # Lazy initialization
-        client_id = os.getenv("REDDIT_CLIENT_ID")
-        client_secret = os.getenv("REDDIT_CLIENT_SECRET")
-        
-        if not client_id or not client_secret:
+        if not os.getenv("REDDIT_CLIENT_ID") or not os.getenv("REDDIT_CLIENT_SECRET"):
             return {"error": "Reddit API credentials (REDDIT_CLIENT_ID, REDDIT_CLIENT_SECRET) are missing.", "posts": []}
 
-        reddit_client = praw.Reddit(
-            client_id=client_id,
-            client_secret=client_secret,
-            user_agent=os.getenv("USER_AGENT", "echolab-mcp-reddit/0.1")
-        )
-
         # Convert string inputs to int
         limit = int(limit)
         comments_per_post = int(comments_per_post)
 
-        posts_data = []
-        sub = reddit_client.subreddit(subreddit)
-        submissions = sub.hot(limit=limit)
-
-        for post in submissions:
-            post_info = {
-                "id": post.id,
-                "title": post.title,
-                "author": str(post.author) if post.author else "deleted",
-                "url": f"https://reddit.com{post.permalink}",
-                "score": int(post.score),
-                "num_comments": int(post.num_comments),
-                "created_utc": float(post.created_utc),
-                "comments": []
-            }
-
-            post.comments.replace_more(limit=0)
-            for comment in post.comments[:comments_per_post]:
-                post_info["comments"].append({
-                    "author": str(comment.author) if comment.author else "deleted",
-                    "body": comment.body or "",
-                    "score": int(comment.score)
-                })
-
-            posts_data.append(post_info)
-
         # Always return something structured
-        return {"posts": posts_data}
+        return await asyncio.to_thread(_fetch_posts, subreddit, limit, comments_per_post)
 
     except Exception as e:
         return {"error": str(e), "posts": []}
@@ -1,7 +1,11 @@
 from langchain_tavily import TavilySearch
 from mcp.server import FastMCP
+import asyncio
 import os
 import sys
+import threading
+import time
+from collections import OrderedDict
 from dotenv import load_dotenv
 
 mcp = FastMCP("Tavily Search MCP")
@@ -10,15 +14,53 @@ load_dotenv()
 api_key = os.getenv("TAVILY_API_KEY")
 tavily_client = TavilySearch(api_key=api_key) if api_key else None
 
+RESULT_CACHE_TTL_SECONDS = 300
+RESULT_CACHE_SIZE = 256
+
+_result_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _cache_get(key):
+    with _cache_lock:
+        entry = _result_cache.get(key)
+        if not entry:
+            return None
+        if time.monotonic() > entry[0]:
+            _result_cache.pop(key, None)
+            return None
+        _result_cache.move_to_end(key)
+        return entry[1]
+
+
+def _cache_set(key, value):
+    with _cache_lock:
+        _result_cache[key] = (time.monotonic() + RESULT_CACHE_TTL_SECONDS, value)
+        _result_cache.move_to_end(key)
+        while len(_result_cache) > RESULT_CACHE_SIZE:
+            _result_cache.popitem(last=False)
+
+
+def _search(cleaned_query: str):
+    key = cleaned_query.lower()
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+    result = tavily_client.run(cleaned_query)
+    if not (isinstance(result, dict) and result.get("error")):
+        _cache_set(key, result)
+    return result
+
 
 @mcp.tool()
-def tavily(query: str):
+async def tavily(query: str):
     if not tavily_client:
         return {"error": "TAVILY_API_KEY is not configured."}
     cleaned_query = (query or "").replace("tavily:", "").strip()
     if not cleaned_query:
         return {"error": "Query is empty."}
-    return tavily_client.run(cleaned_query)
+    # Run the blocking client off the event loop so concurrent tool calls are not serialized.
+    return await asyncio.to_thread(_search, cleaned_query)
 
 
 if __name__ == "__main__":
@@ -1,9 +1,116 @@
 import asyncio
+import threading
+import time
+from collections import OrderedDict
 from mcp.server import FastMCP
-import wikipedia
+import requests
+from requests.adapters import HTTPAdapter
 
 mcp = FastMCP("wikipedia")
 
+API_URL = "https://en.wikipedia.org/w/api.php"
+REQUEST_TIMEOUT = (3.05, 8)  # (connect, read) seconds
+RESULT_CACHE_TTL_SECONDS = 600
+RESULT_CACHE_SIZE = 256
+MAX_BATCH_QUERIES = 20
+BATCH_CONCURRENCY = 8
+
+# One pooled session for the life of the server instead of a fresh connection per summary.
+session = requests.Session()
+session.headers.update({"User-Agent": "echolab-mcp-wikipedia/0.1"})
+session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=16))
+
+_result_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _cache_get(key):
+    with _cache_lock:
+        entry = _result_cache.get(key)
+        if not entry:
+            return None
+        if time.monotonic() > entry[0]:
+            _result_cache.pop(key, None)
+            return None
+        _result_cache.move_to_end(key)
+        return entry[1]
+
+
+def _cache_set(key, value):
+    with _cache_lock:
+        _result_cache[key] = (time.monotonic() + RESULT_CACHE_TTL_SECONDS, value)
+        _result_cache.move_to_end(key)
+        while len(_result_cache) > RESULT_CACHE_SIZE:
+            _result_cache.popitem(last=False)
+
+
+def _page_url(title: str) -> str:
+    return f"https://en.wikipedia.org/wiki/{title.replace(' ', '_')}"
+
+
+def _api(params):
+    response = session.get(API_URL, params={"action": "query", "format": "json", "redirects": 1, **params}, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    return response.json().get("query") or {}
+
+
+def _search(query: str, limit: int):
+    key = ("search", query.strip().lower(), limit)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+
+    # The search hits and their two-sentence summaries come back in one request rather than
+    # one `wikipedia.summary` round trip per hit.
+    pages = _api({
+        "generator": "search",
+        "gsrsearch": query,
+        "gsrlimit": limit,
+        "prop": "extracts",
+        "exintro": 1,
+        "explaintext": 1,
+        "exsentences": 2,
+        "exlimit": "max",
+    }).get("pages") or {}
+    data = [
+        {
+            "title": page["title"],
+            "summary": page.get("extract") or "Summary not available",
+            "url": _page_url(page["title"])
+        }
+        for page in sorted(pages.values(), key=lambda page: page.get("index", 0))
+    ]
+    _cache_set(key, data)
+    return data
+
+
+def _get_page(title: str):
+    key = ("page", title)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+
+    pages = _api({
+        "titles": title,
+        "prop": "extracts|pageprops",
+        "ppprop": "disambiguation",
+        "exintro": 1,
+        "explaintext": 1,
+    }).get("pages") or {}
+    page = next(iter(pages.values()), {})
+    if not page or "missing" in page or "invalid" in page:
+        return {"error": f'Page id "{title}" does not match any pages. Try another id!'}
+    if "disambiguation" in (page.get("pageprops") or {}):
+        return {"error": f'"{title}" may refer to several pages. Try a more specific title.'}
+    result = {
+        "title": title,
+        "summary": page.get("extract") or "",
+        "url": _page_url(title)
+    }
+    _cache_set(key, result)
+    return result
+
+
 # Health check
 @mcp.tool()
 async def ping() -> str:
@@ -12,30 +119,32 @@ async def ping() -> str:
 # Search Wikipedia
 @mcp.tool()
 async def search(query: str, limit: int = 5):
-    results = wikipedia.search(query, results=limit)
-    data = []
-    for r in results:
-        try:
-            summary = wikipedia.summary(r, sentences=2, auto_suggest=False)
-        except Exception:
-            summary = "Summary not available"
-        data.append({
-            "title": r,
-            "summary": summary,
-            "url": f"https://en.wikipedia.org/wiki/{r.replace(' ', '_')}"
-        })
-    return data
+    return await asyncio.to_thread(_search, query, limit)
+
+# Search Wikipedia for several queries at once, results keyed by query
+@mcp.tool()
+async def search_batch(queries: list[str], limit: int = 5):
+    unique = list(dict.fromkeys(query for query in queries if query and query.strip()))
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+    async def run(query):
+        async with semaphore:
+            try:
+                return await asyncio.to_thread(_search, query, limit)
+            except Exception as e:
+                return {"error": str(e)}
+
+    accepted = unique[:MAX_BATCH_QUERIES]
+    results = dict(zip(accepted, await asyncio.gather(*(run(query) for query in accepted))))
+    for query in unique[MAX_BATCH_QUERIES:]:
+        results[query] = {"error": f"Batch is limited to {MAX_BATCH_QUERIES} queries."}
+    return results
 
 # Get a page summary
 @mcp.tool()
 async def get_page(title: str):
     try:
-        summary = wikipedia.summary(title, auto_suggest=False)
-        return {
-            "title": title,
-            "summary": summary,
-            "url": f"https://en.wikipedia.org/wiki/{title.replace(' ', '_')}"
-        }
+        return await asyncio.to_thread(_get_page, title)
     except Exception as e:
         return {"error": str(e)}
 
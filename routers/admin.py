@@ -0,0 +1,39 @@
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Request
+
+from src.auth import require_admin_user_id
+from src.services.llm_usage_service import GROUP_FIELDS, get_llm_usage_ledger
+
+router = APIRouter()
+
+
+@router.on_event("shutdown")
+def flush_llm_usage() -> None:
+    if get_llm_usage_ledger.cache_info().currsize:
+        get_llm_usage_ledger().stop()
+
+
+@router.get("/api/admin/llm-usage")
+async def get_llm_usage(
+    request: Request,
+    group_by: str = "user_id,route,model",
+    user_id: Optional[str] = None,
+    limit: int = 100,
+):
+    require_admin_user_id(request)
+    fields = [field.strip() for field in group_by.split(",") if field.strip()]
+    unknown = sorted(set(fields) - set(GROUP_FIELDS))
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown group_by fields: {', '.join(unknown)}. Use {', '.join(GROUP_FIELDS)}.")
+    return get_llm_usage_ledger().snapshot(group_by=fields, user_id=user_id, limit=min(max(limit, 1), 1000))
+
+
+@router.post("/api/admin/llm-usage/flush")
+async def flush_llm_usage_now(request: Request):
+    require_admin_user_id(request)
+    ledger = get_llm_usage_ledger()
+    if ledger.sink is None:
+        raise HTTPException(status_code=409, detail="No usage store configured. Set HATCHUP_LLM_USAGE_STORE.")
+    rows = ledger.flush()
+    return {"flushed_rows": rows, "last_flush": ledger.last_flush}
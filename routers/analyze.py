@@ -1,6 +1,6 @@
+import asyncio
+import io
 import os
-import shutil
-import tempfile
 from functools import lru_cache
 from typing import Any, Dict, List
 from hashlib import sha256
@@ -8,6 +8,7 @@ from hashlib import sha256
 from fastapi import APIRouter, File, HTTPException, Request, Response, UploadFile
 from pydantic import BaseModel
 
+from src.admission import get_admission_controller, request_fingerprint
 from src.analyzer import PitchDeckAnalyzer
 from src.auth import require_user_id
 from src.document_parser import DocumentParser
@@ -53,68 +54,50 @@ async def debug_groq_key(request: Request):
         "fingerprint_prefix": sha256(normalized_value.encode("utf-8")).hexdigest()[:12] if normalized_value else "",
     }
 
+def _parse_and_analyze(api_key: str, filename: str, content: bytes):
+    # DocumentParser only needs a readable stream with a `.name` for its extension dispatch.
+    upload = io.BytesIO(content)
+    upload.name = filename
+    raw_text = DocumentParser.parse_file(upload)
+    analyzer = PitchDeckAnalyzer(api_key=api_key)
+    return analyzer.analyze_pitch_deck(raw_text)
+
+
 @router.post("/api/analyze")
 async def analyze_deck(request: Request, response: Response, file: UploadFile = File(...)):
     groq_api_key = normalize_secret(os.environ.get("GROQ_API_KEY"))
     if not groq_api_key:
         raise HTTPException(status_code=500, detail="GROQ_API_KEY not configured")
+    user_id = get_authenticated_user_id(request)
 
     try:
-        # Save uploaded file temporarily because DocumentParser and libraries might expect a file on disk
-        # (PyPDF2, pptx, PIL can work with file-like objects but sometimes need seekable, which UploadFile provides via .file)
-        # However, looking at src/document_parser.py, it uses uploaded_file.name for extension logic.
-        # We need to simulate that or save to temp file with correct extension.
-        
-        suffix = os.path.splitext(file.filename)[1]
-        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-            shutil.copyfileobj(file.file, tmp)
-            tmp_path = tmp.name
-
-        try:
-            # We need to adapt DocumentParser to use file path or open file object with name attribute
-            with open(tmp_path, "rb") as f:
-                # Mock streamlit uploaded_file object which has .name attribute
-                class MockFile:
-                    def __init__(self, f_obj, name):
-                        self.f = f_obj
-                        self.name = name
-                    def read(self, *args): return self.f.read(*args)
-                    def seek(self, *args): return self.f.seek(*args)
-                    def tell(self): return self.f.tell()
-                    # Forward other methods if needed
-                    def __getattr__(self, name): return getattr(self.f, name)
-
-                mock_file = MockFile(f, file.filename)
-                
-                # Parse
-                raw_text = DocumentParser.parse_file(mock_file)
-            
-            # Extract Data
-            analyzer = PitchDeckAnalyzer(api_key=groq_api_key)
-            deck_data = analyzer.analyze_pitch_deck(raw_text)
-            user_id = get_authenticated_user_id(request)
-            service = get_analysis_service()
-            active_analysis = service.get_or_create_active_analysis(
-                user_id=user_id,
-                active_analysis_id=get_active_analysis_id(request),
-            )
-            updated = service.update_deck_and_reset_outputs(
-                user_id=user_id,
-                analysis_id=active_analysis["analysis_id"],
-                deck_data=deck_data.dict(),
-            )
-            set_active_analysis_id(response, updated["analysis_id"])
-            
-            return {
-                "analysis_id": updated["analysis_id"],
-                "deck": deck_data.dict(),
-            }
-
-        finally:
-            # Cleanup temp file
-            if os.path.exists(tmp_path):
-                os.remove(tmp_path)
-
+        content = await file.read()
+        filename = file.filename or "upload"
+        # Parsing, OCR and the LLM call run off the event loop under the analyze admission slots;
+        # a repeated upload of the same deck while the first is still running shares its result.
+        deck_data = await get_admission_controller("analyze").run(
+            user_id,
+            request_fingerprint(filename, content),
+            lambda: asyncio.to_thread(_parse_and_analyze, groq_api_key, filename, content),
+        )
+        service = get_analysis_service()
+        active_analysis = service.get_or_create_active_analysis(
+            user_id=user_id,
+            active_analysis_id=get_active_analysis_id(request),
+        )
+        updated = service.update_deck_and_reset_outputs(
+            user_id=user_id,
+            analysis_id=active_analysis["analysis_id"],
+            deck_data=deck_data.dict(),
+        )
+        set_active_analysis_id(response, updated["analysis_id"])
+
+        return {
+            "analysis_id": updated["analysis_id"],
+            "deck": deck_data.dict(),
+        }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, HTTPException, Request, Response
 from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from typing import Any, Awaitable, Dict, List, Optional
 from functools import lru_cache
 import os
 from pathlib import Path
@@ -16,14 +16,20 @@ from datetime import datetime, timezone
 from urllib.parse import urlparse
 import requests
 from dotenv import load_dotenv
+from src.admission import get_admission_controller, request_fingerprint
 from src.auth import require_user_id
+from src.circuit_breaker import CircuitOpenError, check_circuit, circuit
+from src.deadlines import DeadlineExceeded, call_timeout, deadline, hedged
+from src.expiring_set import build_expiring_set
+from src.instrumentation import span, timed
+from src.metrics import cache_events, provider_call, record_mcp_call, track_llm_call
+from src.research_context import build_research_context
 from src.services.analysis_service import AnalysisService
+from src.services.chat_persistence_service import ChatPersistenceQueueFull, ChatWriteBehindService
 from src.services.chat_service import ChatService
+from src.services.conversation_memory_service import ConversationMemoryService
 from src.session import get_active_analysis_id, set_active_analysis_id
 
-from langchain_groq import ChatGroq
-from langchain_core.prompts import ChatPromptTemplate
-from mcp_use import MCPClient
 import sys
 
 load_dotenv()
@@ -32,6 +38,10 @@ router = APIRouter()
 logger = logging.getLogger(__name__)
 
 MCP_CALL_TIMEOUT_SECONDS = 8
+# Request budgets: provider calls get whatever is left rather than their full per-call timeout.
+CHAT_REQUEST_BUDGET_SECONDS = float(os.environ.get("HATCHUP_CHAT_BUDGET_SECONDS") or 30)
+LIVE_SEARCH_BUDGET_SECONDS = float(os.environ.get("HATCHUP_LIVE_SEARCH_BUDGET_SECONDS") or 8)
+TALENT_SCOUT_BUDGET_SECONDS = float(os.environ.get("HATCHUP_TALENT_SCOUT_BUDGET_SECONDS") or 45)
 SEARCH_CACHE_TTL_SECONDS = 300
 _search_cache: Dict[str, Dict[str, Any]] = {}
 GITHUB_API_BASE = "https://api.github.com"
@@ -45,8 +55,7 @@ EXCLUDED_TALENT_SCOUT_DOMAINS = ("linkedin.com", "naukri.com")
 TALENT_SCOUT_TARGET_PLATFORMS = {"GitHub", "Stack Overflow", "Twitter (X)"}
 TALENT_SCOUT_PLATFORM_ORDER = ["GitHub", "Stack Overflow", "Twitter (X)"]
 TALENT_POOL_MEMORY_TTL_SECONDS = 60 * 60 * 6
-_talent_pool_seen_urls: Dict[str, Dict[str, float]] = {}
-_talent_pool_signatures: Dict[str, Dict[str, float]] = {}
+TALENT_POOL_MEMORY_MAX_ENTRIES = 50_000
 _talent_rng = random.SystemRandom()
 
 
@@ -55,6 +64,12 @@ def get_analysis_service() -> AnalysisService:
     return AnalysisService()
 
 
+@lru_cache(maxsize=None)
+def get_talent_pool_memory(kind: str) -> Any:
+    """Profile URLs (``seen_urls``) or pool signatures (``signatures``) recently shown per query."""
+    return build_expiring_set(f"talent_pool_{kind}", TALENT_POOL_MEMORY_TTL_SECONDS, TALENT_POOL_MEMORY_MAX_ENTRIES)
+
+
 def get_authenticated_user_id(request: Request) -> str:
     return require_user_id(request)
 
@@ -64,9 +79,33 @@ def get_chat_service() -> ChatService:
     return ChatService()
 
 
+@lru_cache(maxsize=1)
+def get_chat_write_behind() -> ChatWriteBehindService:
+    return ChatWriteBehindService(store=get_chat_service())
+
+
+@router.on_event("shutdown")
+def flush_chat_write_behind() -> None:
+    if get_chat_write_behind.cache_info().currsize:
+        writer = get_chat_write_behind()
+        writer.flush()
+        writer.stop()
+
+
+@lru_cache(maxsize=1)
+def get_conversation_memory_service() -> ConversationMemoryService:
+    try:
+        store = get_chat_service()
+    except Exception:
+        logger.warning("chat storage unavailable; conversation summaries stay in memory only")
+        store = None
+    return ConversationMemoryService(store=store)
+
+
 class Message(BaseModel):
     role: str
     content: str
+    id: Optional[str] = None
 
 
 class ResearchRequest(BaseModel):
@@ -378,14 +417,17 @@ def _github_headers() -> Dict[str, str]:
     return headers
 
 
+@timed("search", "github")
 def _github_request(path: str, params: Optional[Dict[str, Any]] = None) -> Any:
-    response = requests.get(
-        f"{GITHUB_API_BASE}{path}",
-        headers=_github_headers(),
-        params=params or {},
-        timeout=GITHUB_TIMEOUT_SECONDS,
-    )
-    response.raise_for_status()
+    timeout = call_timeout(GITHUB_TIMEOUT_SECONDS)
+    with circuit("github"), provider_call("github"):
+        response = requests.get(
+            f"{GITHUB_API_BASE}{path}",
+            headers=_github_headers(),
+            params=params or {},
+            timeout=timeout,
+        )
+        response.raise_for_status()
     return response.json()
 
 
@@ -442,21 +484,27 @@ def _tavily_api_key() -> str:
     return api_key
 
 
+@timed("search", "tavily")
 def _tavily_search(query: str, max_results: int = 8, search_depth: str = "advanced") -> Any:
-    response = requests.post(
-        TAVILY_API_BASE,
-        json={
-            "api_key": _tavily_api_key(),
-            "query": query,
-            "max_results": max_results,
-            "search_depth": search_depth,
-            "include_answer": False,
-            "include_images": False,
-            "include_raw_content": False,
-        },
-        timeout=GITHUB_TIMEOUT_SECONDS,
-    )
-    response.raise_for_status()
+    # Credentials are resolved outside provider_call so a missing key is not counted as a provider error
+    # (nor does it trip the tavily circuit).
+    api_key = _tavily_api_key()
+    timeout = call_timeout(GITHUB_TIMEOUT_SECONDS)
+    with circuit("tavily"), provider_call("tavily"):
+        response = requests.post(
+            TAVILY_API_BASE,
+            json={
+                "api_key": api_key,
+                "query": query,
+                "max_results": max_results,
+                "search_depth": search_depth,
+                "include_answer": False,
+                "include_images": False,
+                "include_raw_content": False,
+            },
+            timeout=timeout,
+        )
+        response.raise_for_status()
     return response.json()
 
 
@@ -619,6 +667,8 @@ def _fetch_github_candidates(query: str, query_meta: Dict[str, Any], max_results
                 params={"sort": "updated", "per_page": 10, "type": "owner"},
             )
             candidates.append(_github_candidate_from_user(query_meta, user, repos if isinstance(repos, list) else []))
+        except DeadlineExceeded:
+            break
         except Exception as exc:
             logger.warning("GitHub enrichment failed for %s: %s", login, exc)
             continue
@@ -798,7 +848,7 @@ async def _fetch_tavily_candidates(query: str, query_meta: Dict[str, Any], max_r
         f'-site:linkedin.com -site:naukri.com'
     )
     try:
-        payload = await asyncio.to_thread(_tavily_search, tavily_query, max_results, "advanced")
+        payload = await _hedged_tavily_search(tavily_query, max_results, "advanced")
     except Exception:
         return []
 
@@ -864,12 +914,15 @@ def _fetch_serpapi_candidates(query: str, query_meta: Dict[str, Any], max_result
         f'({query}) (site:x.com OR site:twitter.com OR site:kaggle.com OR '
         f'site:leetcode.com OR site:substack.com OR site:medium.com)'
     )
-    response = requests.get(
-        SERPAPI_BASE,
-        params=_serpapi_params(search_query, max_results),
-        timeout=GITHUB_TIMEOUT_SECONDS,
-    )
-    response.raise_for_status()
+    params = _serpapi_params(search_query, max_results)
+    timeout = call_timeout(GITHUB_TIMEOUT_SECONDS)
+    with circuit("serpapi"), provider_call("serpapi"):
+        response = requests.get(
+            SERPAPI_BASE,
+            params=params,
+            timeout=timeout,
+        )
+        response.raise_for_status()
     payload = response.json()
     organic_results = payload.get("organic_results") or []
     candidates: List[Dict[str, Any]] = []
@@ -881,19 +934,22 @@ def _fetch_serpapi_candidates(query: str, query_meta: Dict[str, Any], max_result
 
 
 def _fetch_x_candidates(query: str, query_meta: Dict[str, Any], max_results: int = 20) -> List[Dict[str, Any]]:
-    response = requests.get(
-        f"{X_API_BASE}/tweets/search/recent",
-        headers=_x_headers(),
-        params={
-            "query": f"({query}) -is:retweet lang:en",
-            "max_results": max_results,
-            "expansions": "author_id",
-            "user.fields": "name,username,description,location,public_metrics,verified",
-            "tweet.fields": "public_metrics,text,created_at",
-        },
-        timeout=GITHUB_TIMEOUT_SECONDS,
-    )
-    response.raise_for_status()
+    headers = _x_headers()
+    timeout = call_timeout(GITHUB_TIMEOUT_SECONDS)
+    with circuit("x"), provider_call("x"):
+        response = requests.get(
+            f"{X_API_BASE}/tweets/search/recent",
+            headers=headers,
+            params={
+                "query": f"({query}) -is:retweet lang:en",
+                "max_results": max_results,
+                "expansions": "author_id",
+                "user.fields": "name,username,description,location,public_metrics,verified",
+                "tweet.fields": "public_metrics,text,created_at",
+            },
+            timeout=timeout,
+        )
+        response.raise_for_status()
     payload = response.json()
     users = {user.get("id"): user for user in (payload.get("includes", {}) or {}).get("users", [])}
     tweets = payload.get("data") or []
@@ -941,13 +997,16 @@ def _fetch_x_candidates(query: str, query_meta: Dict[str, Any], max_results: int
 
 
 def _fetch_kaggle_candidates(query: str, query_meta: Dict[str, Any], max_results: int = 20) -> List[Dict[str, Any]]:
-    response = requests.get(
-        f"{KAGGLE_API_BASE}/users/list",
-        params={"search": query},
-        auth=_kaggle_auth(),
-        timeout=GITHUB_TIMEOUT_SECONDS,
-    )
-    response.raise_for_status()
+    auth = _kaggle_auth()
+    timeout = call_timeout(GITHUB_TIMEOUT_SECONDS)
+    with circuit("kaggle"), provider_call("kaggle"):
+        response = requests.get(
+            f"{KAGGLE_API_BASE}/users/list",
+            params={"search": query},
+            auth=auth,
+            timeout=timeout,
+        )
+        response.raise_for_status()
     payload = response.json()
     items = payload if isinstance(payload, list) else payload.get("users") or payload.get("items") or []
     candidates: List[Dict[str, Any]] = []
@@ -982,19 +1041,21 @@ def _fetch_kaggle_candidates(query: str, query_meta: Dict[str, Any], max_results
 
 
 def _fetch_stackoverflow_candidates(query: str, query_meta: Dict[str, Any], max_results: int = 20) -> List[Dict[str, Any]]:
-    response = requests.get(
-        f"{STACKEXCHANGE_API_BASE}/users",
-        params=_stackexchange_params(
-            {
-                "inname": query,
-                "pagesize": max_results,
-                "order": "desc",
-                "sort": "reputation",
-            }
-        ),
-        timeout=GITHUB_TIMEOUT_SECONDS,
-    )
-    response.raise_for_status()
+    timeout = call_timeout(GITHUB_TIMEOUT_SECONDS)
+    with circuit("stackexchange"), provider_call("stackexchange"):
+        response = requests.get(
+            f"{STACKEXCHANGE_API_BASE}/users",
+            params=_stackexchange_params(
+                {
+                    "inname": query,
+                    "pagesize": max_results,
+                    "order": "desc",
+                    "sort": "reputation",
+                }
+            ),
+            timeout=timeout,
+        )
+        response.raise_for_status()
     payload = response.json()
     items = payload.get("items") or []
     candidates: List[Dict[str, Any]] = []
@@ -1040,7 +1101,7 @@ async def _fetch_broader_web_candidates(query: str, query_meta: Dict[str, Any],
         asyncio.to_thread(_fetch_serpapi_candidates, query, query_meta, 20),
         asyncio.to_thread(_fetch_x_candidates, query, query_meta, 20),
         asyncio.to_thread(_fetch_kaggle_candidates, query, query_meta, 20),
-        _call_tool_with_timeout(sessions, "@echolab/mcp-reddit", "fetch_reddit_posts_with_comments", {"subreddit": "startups", "limit": 10}, "Reddit"),
+        _call_tool_with_timeout(sessions, "@echolab/mcp-reddit", "fetch_reddit_posts_with_comments", {"subreddit": "startups", "limit": 10}, "Reddit", hedge=True),
     ]
     tavily_candidates, serp_candidates, x_candidates, kaggle_candidates, reddit_result = await asyncio.gather(
         *async_calls,
@@ -1073,10 +1134,14 @@ def _cache_get(query: str) -> Optional[Dict[str, Any]]:
     key = _normalize_query(query)
     cached = _search_cache.get(key)
     if not cached:
+        cache_events.inc(cache="search", event="miss")
         return None
     if time.time() - cached.get("ts", 0) > SEARCH_CACHE_TTL_SECONDS:
         _search_cache.pop(key, None)
+        cache_events.inc(cache="search", event="eviction")
+        cache_events.inc(cache="search", event="miss")
         return None
+    cache_events.inc(cache="search", event="hit")
     return cached.get("data")
 
 
@@ -1092,41 +1157,58 @@ async def deep_research(payload: ResearchRequest, request: Request, response: Re
         if not api_key:
             raise HTTPException(status_code=500, detail="Server is not configured for chat generation.")
 
-        data_obj = payload.data
-        memo_obj = payload.memo
         analysis_id = get_active_analysis_id(request)
         user_id = get_authenticated_user_id(request)
-        if not data_obj:
+        context_str = ""
+        if payload.data:
+            context_str = build_research_context(payload.data, payload.memo)
+        else:
             service = get_analysis_service()
-            active = service.get_or_create_active_analysis(
-                user_id=user_id,
-                active_analysis_id=get_active_analysis_id(request),
-            )
-            analysis_id = active["analysis_id"]
-            data_obj = active.get("deck")
-            memo_obj = active.get("memo") or {}
+            cached = service.get_research_context(user_id, analysis_id)
+            if cached:
+                context_str = cached["context"]
+            else:
+                active = service.get_or_create_active_analysis(
+                    user_id=user_id,
+                    active_analysis_id=analysis_id,
+                )
+                analysis_id = active["analysis_id"]
+                if active.get("deck"):
+                    context_str = build_research_context(active.get("deck"), active.get("memo"))
             set_active_analysis_id(response, analysis_id)
-        if not data_obj:
+        if not context_str:
             raise HTTPException(status_code=400, detail="No active deck analysis found.")
 
-        context_str = (
-            "*** STARTUP ANALYZED DATA ***\n"
-            f"{json.dumps(data_obj, indent=2)}\n\n"
-            "*** INVESTMENT MEMO ***\n"
-            f"{json.dumps(memo_obj or {}, indent=2)}"
-        )
-
         system_prompt = """You are a highly intelligent VC Research Associate.
 You have access to parsed Pitch Deck Data and a generated Investment Memo.
 Use provided context as primary source, remain concise and insightful, and avoid markdown tables."""
 
         user_query = payload.messages[-1].content
+        memory = get_conversation_memory_service()
+        memory_key = f"research:{analysis_id}" if analysis_id else ""
+        history_text = memory.build_history(user_id, memory_key, payload.messages[:-1], persist=False)
+        from langchain_core.prompts import ChatPromptTemplate
+        from langchain_groq import ChatGroq
+
         llm = ChatGroq(temperature=0.5, model_name="openai/gpt-oss-20b", groq_api_key=api_key)
         prompt_template = ChatPromptTemplate.from_messages(
-            [("system", system_prompt), ("user", "Context:\n{context}\n\nQuestion: {question}")]
+            [
+                ("system", system_prompt),
+                ("user", "Context:\n{context}\n\nConversation so far:\n{history}\n\nQuestion: {question}"),
+            ]
         )
         chain = prompt_template | llm
-        llm_response = await chain.ainvoke({"context": context_str, "question": user_query})
+        with track_llm_call("research") as llm_config:
+            llm_response = await chain.ainvoke(
+                {"context": context_str, "history": history_text or "(none)", "question": user_query},
+                config=llm_config,
+            )
+        memory.schedule_update(
+            user_id,
+            memory_key,
+            [*payload.messages, Message(role="assistant", content=str(llm_response.content or ""))],
+            persist=False,
+        )
         return {"response": llm_response.content, "analysis_id": analysis_id}
     except HTTPException:
         raise
@@ -1168,32 +1250,86 @@ async def get_mcp_sessions():
     with open(temp_config_path, "w", encoding="utf-8") as f:
         json.dump(server_config, f, indent=2)
 
+    from mcp_use import MCPClient
+
     mcp_client = MCPClient.from_config_file(str(temp_config_path))
     mcp_sessions = await mcp_client.create_all_sessions()
     return mcp_sessions
 
 
+class _MCPToolError(Exception):
+    """A tool call that completed but reported an upstream failure in its payload."""
+
+    def __init__(self, payload: Any) -> None:
+        super().__init__(str(payload.get("error") if isinstance(payload, dict) else payload))
+        self.payload = payload
+
+
+async def _call_tool_once(session: Any, session_name: str, tool_name: str, args: Dict[str, Any], label: str) -> Any:
+    timeout = call_timeout(MCP_CALL_TIMEOUT_SECONDS)
+    breaker = check_circuit(f"mcp:{session_name}")
+    started = time.perf_counter()
+    try:
+        with span("mcp", f"{label}.{tool_name}"):
+            result = await asyncio.wait_for(session.call_tool(tool_name, args), timeout=timeout)
+    except asyncio.TimeoutError:
+        breaker.record_failure()
+        record_mcp_call(session_name, tool_name, "timeout", time.perf_counter() - started)
+        raise
+    except Exception:
+        breaker.record_failure()
+        record_mcp_call(session_name, tool_name, "error", time.perf_counter() - started)
+        raise
+    payload = _unwrap_tool_payload(result)
+    # The servers report upstream failures as an ``{"error": ...}`` payload rather than raising.
+    if getattr(result, "isError", False) or (isinstance(payload, dict) and payload.get("error")):
+        breaker.record_failure()
+        record_mcp_call(session_name, tool_name, "error", time.perf_counter() - started)
+        raise _MCPToolError(payload)
+    breaker.record_success()
+    record_mcp_call(session_name, tool_name, "ok", time.perf_counter() - started)
+    return payload
+
+
 async def _call_tool_with_timeout(
     sessions: Dict[str, Any],
     session_name: str,
     tool_name: str,
     args: Dict[str, Any],
     label: str,
+    hedge: bool = False,
 ) -> Any:
+    """Call an MCP tool within the request's remaining budget; failures come back as an error string.
+
+    ``hedge`` is for idempotent search tools: a slow call is backed up by a second one.
+    """
     if session_name not in sessions:
+        record_mcp_call(session_name, tool_name, "unavailable")
         return f"[{label} MCP Error: session unavailable]"
+
+    def attempt() -> Awaitable[Any]:
+        return _call_tool_once(sessions[session_name], session_name, tool_name, args, label)
+
     try:
-        result = await asyncio.wait_for(
-            sessions[session_name].call_tool(tool_name, args),
-            timeout=MCP_CALL_TIMEOUT_SECONDS,
-        )
-        return _unwrap_tool_payload(result)
+        return await (hedged(f"mcp:{session_name}:{tool_name}", attempt) if hedge else attempt())
+    except CircuitOpenError:
+        record_mcp_call(session_name, tool_name, "circuit_open")
+        return f"[{label} MCP Error: circuit open]"
+    except DeadlineExceeded:
+        record_mcp_call(session_name, tool_name, "deadline_exceeded")
+        return f"[{label} MCP Error: deadline exceeded]"
     except asyncio.TimeoutError:
         return f"[{label} MCP Error: timeout]"
+    except _MCPToolError as exc:
+        return exc.payload
     except Exception as exc:
         return f"[{label} MCP Error: {exc}]"
 
 
+async def _hedged_tavily_search(query: str, max_results: int = 8, search_depth: str = "advanced") -> Any:
+    return await hedged("tavily", lambda: asyncio.to_thread(_tavily_search, query, max_results, search_depth))
+
+
 async def run_searches(query: str, sessions: Dict[str, Any]) -> Dict[str, Any]:
     cached = _cache_get(query)
     if cached:
@@ -1207,10 +1343,10 @@ async def run_searches(query: str, sessions: Dict[str, Any]) -> Dict[str, Any]:
     ]
 
     tasks = [
-        _call_tool_with_timeout(sessions, session, tool, args, label)
+        _call_tool_with_timeout(sessions, session, tool, args, label, hedge=True)
         for _, session, tool, args, label in specs
     ]
-    tasks.append(asyncio.to_thread(_tavily_search, query, 8, "advanced"))
+    tasks.append(_hedged_tavily_search(query, 8, "advanced"))
     values = await asyncio.gather(*tasks, return_exceptions=True)
     results = {}
     for idx, spec in enumerate(specs):
@@ -1695,13 +1831,14 @@ async def _run_alternative_platform_search(
     strategy: Dict[str, str],
 ) -> List[Dict[str, Any]]:
     search_query = _build_alternative_discovery_query(query, query_meta, config, strategy)
-    tavily_task = asyncio.to_thread(_tavily_search, search_query, 8, "advanced")
+    tavily_task = _hedged_tavily_search(search_query, 8, "advanced")
     google_task = _call_tool_with_timeout(
         sessions,
         "@echolab/mcp-google",
         "google_search",
         {"query": search_query, "num_results": 5},
         "Google",
+        hedge=True,
     )
     tavily_payload, google_payload = await asyncio.gather(tavily_task, google_task, return_exceptions=True)
 
@@ -1736,13 +1873,13 @@ async def _fetch_platform_web_fallback_candidates(
 
     items: List[Dict[str, Any]] = []
     try:
-        tavily_payload = await asyncio.to_thread(_tavily_search, search_query, max_results, "advanced")
+        tavily_payload = await _hedged_tavily_search(search_query, max_results, "advanced")
         items.extend(_extract_tavily_items(tavily_payload))
     except Exception:
         logger.warning("%s Tavily fallback fetch failed", platform)
 
     try:
-        serp_items = _fetch_serpapi_candidates(query, query_meta, max_results)
+        serp_items = await asyncio.to_thread(_fetch_serpapi_candidates, query, query_meta, max_results)
         for item in serp_items:
             if _canonical_platform_label(str(item.get("primary_platform") or "")) == platform:
                 items.append(
@@ -1781,6 +1918,8 @@ async def _fetch_direct_api_candidates(query: str, query_meta: Dict[str, Any]) -
         for variant in _platform_query_variants(query, query_meta, platform):
             try:
                 payload = await asyncio.to_thread(fetcher, variant, query_meta, per_query_limit)
+            except DeadlineExceeded:
+                break
             except Exception as exc:
                 logger.warning("%s direct fetch failed for query '%s': %s", platform, variant, exc)
                 continue
@@ -1827,33 +1966,14 @@ async def _fetch_direct_api_candidates(query: str, query_meta: Dict[str, Any]) -
     return candidates
 
 
-def _prune_talent_pool_memory() -> None:
-    cutoff = time.time() - TALENT_POOL_MEMORY_TTL_SECONDS
-    for memory in (_talent_pool_seen_urls, _talent_pool_signatures):
-        stale_queries = []
-        for query_key, values in memory.items():
-            fresh_values = {key: ts for key, ts in values.items() if ts >= cutoff}
-            if fresh_values:
-                memory[query_key] = fresh_values
-            else:
-                stale_queries.append(query_key)
-        for query_key in stale_queries:
-            memory.pop(query_key, None)
-
-
 def _recent_seen_urls(query: str) -> set:
-    _prune_talent_pool_memory()
-    return set((_talent_pool_seen_urls.get(_normalize_query(query)) or {}).keys())
+    return get_talent_pool_memory("seen_urls").members(_normalize_query(query))
 
 
 def _remember_talent_pool(query: str, candidates: List[Dict[str, Any]]) -> None:
     query_key = _normalize_query(query)
-    now = time.time()
-    seen_map = _talent_pool_seen_urls.setdefault(query_key, {})
-    for candidate in candidates:
-        profile_url = str(candidate.get("profile_url") or "").strip().lower()
-        if profile_url:
-            seen_map[profile_url] = now
+    profile_urls = [str(candidate.get("profile_url") or "").strip().lower() for candidate in candidates]
+    get_talent_pool_memory("seen_urls").add(query_key, [url for url in profile_urls if url])
 
     signature = "|".join(sorted(
         str(candidate.get("profile_url") or "").strip().lower()
@@ -1861,8 +1981,7 @@ def _remember_talent_pool(query: str, candidates: List[Dict[str, Any]]) -> None:
         if candidate.get("profile_url")
     ))
     if signature:
-        _talent_pool_signatures.setdefault(query_key, {})[signature] = now
-    _prune_talent_pool_memory()
+        get_talent_pool_memory("signatures").add(query_key, [signature])
 
 
 def _candidate_sort_key(candidate: Dict[str, Any]) -> Any:
@@ -2275,6 +2394,9 @@ async def _format_talent_pool_with_groq(query: str, candidates: List[Dict[str, A
     if not api_key:
         return _fallback_profile_objects(candidates)
 
+    from langchain_core.prompts import ChatPromptTemplate
+    from langchain_groq import ChatGroq
+
     llm = ChatGroq(model="openai/gpt-oss-20b", temperature=0.9, groq_api_key=api_key)
     prompt = ChatPromptTemplate.from_messages(
         [
@@ -2347,7 +2469,8 @@ Return this exact schema:
                 ensure_ascii=True,
             ),
         )
-        response = await llm.ainvoke(messages)
+        with track_llm_call("talent_scout.format") as llm_config:
+            response = await llm.ainvoke(messages, config=llm_config)
         payload = json.loads(str(response.content or "[]"))
         if isinstance(payload, list) and payload:
             return _sanitize_formatted_talent_profiles(payload, candidates)
@@ -2441,26 +2564,46 @@ def _sanitize_formatted_talent_profiles(payload: List[Dict[str, Any]], candidate
 
 
 @router.get("/api/chat/hatchup/history")
-async def get_hatchup_chat_history(request: Request, chat_id: Optional[str] = None):
+async def get_hatchup_chat_history(
+    request: Request,
+    chat_id: Optional[str] = None,
+    before: Optional[str] = None,
+    after: Optional[str] = None,
+    since: Optional[str] = None,
+    limit: int = 50,
+):
     try:
         user_id = get_authenticated_user_id(request)
         service = get_chat_service()
         resolved_chat_id = _normalize_chat_id(chat_id)
-        if not resolved_chat_id:
-            latest_chat_id = service.get_latest_chat_id(user_id)
-            resolved_chat_id = latest_chat_id or service.create_chat_id()
-
-        messages = service.get_chat_messages(user_id=user_id, chat_id=resolved_chat_id)
+        # `since` is the incremental mode: only messages newer than the cursor.
+        after = after or since
+        if (after or before) and not resolved_chat_id:
+            raise HTTPException(status_code=400, detail="chat_id is required when paging history.")
+        try:
+            page = service.get_chat_page(
+                user_id=user_id,
+                chat_id=resolved_chat_id,
+                before=before,
+                after=after,
+                limit=limit,
+            )
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc))
         return {
-            "chat_id": resolved_chat_id,
+            "chat_id": page["chat_id"] or service.create_chat_id(),
             "messages": [
                 {
+                    "id": msg["id"],
                     "role": msg["role"],
                     "content": msg["content"],
                     "created_at": msg["created_at"],
                 }
-                for msg in messages
+                for msg in page["messages"]
             ],
+            "has_more": page["has_more"],
+            "before": page["before"],
+            "after": page["after"],
         }
     except HTTPException:
         raise
@@ -2475,14 +2618,28 @@ async def get_hatchup_chat_history(request: Request, chat_id: Optional[str] = No
 
 @router.post("/api/chat/hatchup")
 async def hatchup_chat(payload: ChatRequest, request: Request):
+    user_id = get_authenticated_user_id(request)
+    # A resubmitted turn (double send, client retry) joins the reply already being generated.
+    with deadline(CHAT_REQUEST_BUDGET_SECONDS):
+        return await get_admission_controller("chat").run(
+            user_id,
+            request_fingerprint(payload.model_dump(mode="json")),
+            lambda: _hatchup_chat_reply(payload, user_id),
+        )
+
+
+async def _hatchup_chat_reply(payload: ChatRequest, user_id: str) -> Dict[str, Any]:
     try:
-        user_id = get_authenticated_user_id(request)
+        received_at = datetime.now(timezone.utc).isoformat()
         service = get_chat_service()
         resolved_chat_id = _normalize_chat_id(payload.chat_id) or service.create_chat_id()
         api_key = os.environ.get("GROQ_API_KEY")
         if not api_key:
             raise HTTPException(status_code=500, detail="Server is not configured for chat generation.")
 
+        from langchain_core.prompts import ChatPromptTemplate
+        from langchain_groq import ChatGroq
+
         llm = ChatGroq(model="openai/gpt-oss-20b", temperature=0.3, groq_api_key=api_key)
         search_results: Dict[str, Any] = {}
         context_str = "No live search context was used for this query."
@@ -2491,7 +2648,8 @@ async def hatchup_chat(payload: ChatRequest, request: Request):
         if _should_run_live_search(payload.query):
             try:
                 sessions = await get_mcp_sessions()
-                search_results = await run_searches(payload.query, sessions)
+                with deadline(LIVE_SEARCH_BUDGET_SECONDS):
+                    search_results = await run_searches(payload.query, sessions)
                 context_str = build_context_string(search_results)
                 used_live_tools = True
             except Exception:
@@ -2499,7 +2657,12 @@ async def hatchup_chat(payload: ChatRequest, request: Request):
                 search_results = {"error": "Live search unavailable"}
                 context_str = "Live search tools are temporarily unavailable."
 
-        history_text = "\n".join([f"{m.role.upper()}: {m.content}" for m in payload.messages[-5:]])
+        # The client sends the current turn as the last message; it is passed separately as the question.
+        prior_messages = list(payload.messages)
+        if prior_messages and prior_messages[-1].role == "user" and prior_messages[-1].content.strip() == payload.query.strip():
+            prior_messages = prior_messages[:-1]
+        memory = get_conversation_memory_service()
+        history_text = memory.build_history(user_id, resolved_chat_id, prior_messages)
         chat_prompt = ChatPromptTemplate.from_messages(
             [
                 (
@@ -2533,29 +2696,45 @@ Use clean executive memo style with short actionable bullets.
             history=history_text,
             question=payload.query,
         )
-        response = await llm.ainvoke(messages)
+        with track_llm_call("chat") as llm_config:
+            response = await llm.ainvoke(messages, config=llm_config)
+        user_row = service.build_message_row(user_id, resolved_chat_id, "user", payload.query, created_at=received_at)
+        assistant_row = service.build_message_row(
+            user_id,
+            resolved_chat_id,
+            "assistant",
+            str(response.content or ""),
+            created_at=datetime.now(timezone.utc).isoformat(),
+        )
         result = {
             "chat_id": resolved_chat_id,
             "response": response.content,
             "sources": search_results,
             "used_live_tools": used_live_tools,
+            "user_message_id": user_row["id"],
+            "assistant_message_id": assistant_row["id"],
         }
         try:
-            service.save_message(
-                user_id=user_id,
-                chat_id=resolved_chat_id,
-                role="user",
-                content=payload.query,
-            )
-            service.save_message(
-                user_id=user_id,
-                chat_id=resolved_chat_id,
-                role="assistant",
-                content=str(response.content or ""),
-            )
+            writer = get_chat_write_behind()
+            previous_failure = writer.pop_failure(resolved_chat_id)
+            writer.enqueue([user_row, assistant_row])
+            if previous_failure:
+                result["storage_warning"] = f"Earlier chat messages were not saved: {previous_failure}"
+        except ChatPersistenceQueueFull as save_exc:
+            logger.warning("chat write-behind queue full; messages not saved")
+            result["storage_warning"] = f"Chat message was generated but not saved: {_error_text(save_exc)}"
         except Exception as save_exc:
             logger.exception("chat message persistence failed")
             result["storage_warning"] = f"Chat message was generated but not saved: {_error_text(save_exc)}"
+        memory.schedule_update(
+            user_id,
+            resolved_chat_id,
+            [
+                *prior_messages,
+                Message(id=user_row["id"], role="user", content=payload.query),
+                Message(id=assistant_row["id"], role="assistant", content=str(response.content or "")),
+            ],
+        )
         return result
     except HTTPException:
         raise
@@ -2566,8 +2745,17 @@ Use clean executive memo style with short actionable bullets.
 
 @router.post("/api/founder/talent-scout/search")
 async def founder_talent_scout_search(payload: FounderScoutRequest, request: Request):
+    user_id = get_authenticated_user_id(request)
+    with deadline(TALENT_SCOUT_BUDGET_SECONDS):
+        return await get_admission_controller("talent_scout").run(
+            user_id,
+            request_fingerprint(payload.model_dump(mode="json")),
+            lambda: _founder_talent_scout_search(payload),
+        )
+
+
+async def _founder_talent_scout_search(payload: FounderScoutRequest) -> List[Dict[str, Any]]:
     try:
-        get_authenticated_user_id(request)
         query = (payload.query or "").strip()
         if not query:
             raise HTTPException(status_code=400, detail="Query is required.")
@@ -2587,7 +2775,7 @@ async def founder_talent_scout_search(payload: FounderScoutRequest, request: Req
         exploration_factor = round(_talent_rng.uniform(0.15, 0.95), 2)
 
         selected_candidates: List[Dict[str, Any]] = []
-        existing_signatures = _talent_pool_signatures.get(_normalize_query(query), {})
+        existing_signatures = get_talent_pool_memory("signatures").members(_normalize_query(query))
         try:
             for _ in range(4):
                 pool = _select_rag_talent_pool(
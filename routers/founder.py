@@ -1,22 +1,29 @@
+import asyncio
+import hashlib
+import json
+import logging
 import os
-import re
 import shutil
 import tempfile
 import uuid
 from datetime import datetime, timezone
 from functools import lru_cache
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from fastapi import APIRouter, File, Form, HTTPException, Request, UploadFile
+from fastapi import APIRouter, File, Form, HTTPException, Request, Response, UploadFile
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
+from src.admission import get_admission_controller, request_fingerprint
 from src.auth import require_user_id
 from src.document_parser import DocumentParser
 from src.env_utils import normalize_secret
-from src.revenue_wedge_engine import RevenueWedgeEngine
+from src.revenue_wedge_engine import RevenueWedgeEngine, compute_text_stats
 from src.services.founder_workspace_service import FounderWorkspaceService
+from src.services.revenue_wedge_job_service import RevenueWedgeJobRegistry
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 ALLOWED_FOUNDER_TAGS = {
     "sales_call",
@@ -37,7 +44,7 @@ PARSER_ERROR_PREFIXES = (
     "Error parsing Image",
     "Error reading text file:",
 )
-COMMERCIAL_SIGNAL_TERMS = {
+COMMERCIAL_SIGNAL_TERMS = frozenset({
     "customer",
     "prospect",
     "buyer",
@@ -83,7 +90,7 @@ COMMERCIAL_SIGNAL_TERMS = {
     "qualified",
     "mrr",
     "arr",
-}
+})
 
 
 def _utc_now() -> str:
@@ -104,8 +111,15 @@ def get_revenue_wedge_engine() -> RevenueWedgeEngine:
     return RevenueWedgeEngine(api_key=normalize_secret(os.environ.get("GROQ_API_KEY")))
 
 
+@lru_cache(maxsize=1)
+def get_revenue_wedge_jobs() -> RevenueWedgeJobRegistry:
+    return RevenueWedgeJobRegistry()
+
+
 class RevenueRunRequest(BaseModel):
     input_ids: Optional[List[str]] = None
+    # "job" returns a run_id immediately and streams progress from /run/{run_id}/events.
+    mode: str = "sync"
 
 
 class RevenueRunResultPayload(BaseModel):
@@ -166,7 +180,8 @@ def _build_excerpt(text: str) -> str:
     return compact[:200] + ("..." if len(compact) > 200 else "")
 
 
-def _validate_revenue_wedge_text(raw_text: str, source_type: str) -> str:
+def _validate_revenue_wedge_text(raw_text: str, source_type: str) -> Tuple[str, Dict[str, Any]]:
+    """Return the stripped text and its ``text_stats``, which are stored on the input for later runs."""
     normalized = (raw_text or "").strip()
     if not normalized:
         raise HTTPException(status_code=400, detail="Provide pasted text or upload a supported file.")
@@ -177,11 +192,10 @@ def _validate_revenue_wedge_text(raw_text: str, source_type: str) -> str:
             detail="We couldn't read usable text from that file. Try a cleaner export or paste the relevant notes directly.",
         )
 
-    alpha_tokens = re.findall(r"[a-zA-Z]{3,}", normalized.lower())
-    compact = re.sub(r"\s+", " ", normalized)
-    commercial_hits = sum(1 for token in alpha_tokens if token in COMMERCIAL_SIGNAL_TERMS)
+    text_stats = compute_text_stats(normalized, COMMERCIAL_SIGNAL_TERMS)
+    commercial_hits = text_stats["commercial_hits"]
 
-    if len(compact) < 60 or len(alpha_tokens) < 8:
+    if text_stats["normalized_chars"] < 60 or text_stats["alpha_token_count"] < 8:
         raise HTTPException(
             status_code=400,
             detail="That input is too thin for Revenue Wedge. Add more founder notes, call transcripts, objections, CRM reasons, or landing page copy.",
@@ -194,12 +208,13 @@ def _validate_revenue_wedge_text(raw_text: str, source_type: str) -> str:
             detail=f"The {source_label} does not look like revenue or customer feedback input yet. Add sales calls, support issues, objections, CRM loss reasons, or GTM copy.",
         )
 
-    return normalized
+    return normalized, text_stats
 
 
 def _serialize_workspace(workspace: Dict[str, Any]) -> Dict[str, Any]:
-    return {
+    payload = {
         "workspace_id": workspace.get("workspace_id"),
+        "view": workspace.get("view") or "full",
         "inputs": workspace.get("inputs") or [],
         "latest_run_id": workspace.get("latest_run_id"),
         "latest_run": workspace.get("latest_run"),
@@ -207,19 +222,60 @@ def _serialize_workspace(workspace: Dict[str, Any]) -> Dict[str, Any]:
         "learned_patterns": workspace.get("learned_patterns") or {},
         "updated_at": workspace.get("updated_at"),
     }
+    if "runs_has_more" in workspace:
+        payload["runs_has_more"] = workspace.get("runs_has_more")
+        payload["runs_next_before"] = workspace.get("runs_next_before")
+    return payload
+
+
+def _workspace_etag(workspace_id: Optional[str], updated_at: Optional[str], view: str) -> str:
+    digest = hashlib.sha1(f"{workspace_id}:{updated_at}:{view}".encode("utf-8")).hexdigest()[:20]
+    return f'W/"{digest}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match") or ""
+    return any(tag.strip() in {etag, "*"} for tag in header.split(",") if tag.strip())
+
+
+def _workspace_response(response: Response, workspace: Dict[str, Any]) -> Dict[str, Any]:
+    payload = _serialize_workspace(workspace)
+    response.headers["ETag"] = _workspace_etag(payload["workspace_id"], payload["updated_at"], payload["view"])
+    response.headers["Cache-Control"] = "private, no-cache"
+    return payload
 
 
 @router.get("/api/founder/revenue-wedge/workspace")
-async def get_revenue_wedge_workspace(request: Request):
+async def get_revenue_wedge_workspace(request: Request, response: Response, view: str = "summary"):
     user_id = get_authenticated_user_id(request)
     service = get_founder_workspace_service()
-    workspace = service.get_or_create_workspace(user_id)
-    return _serialize_workspace(workspace)
+    if view == "full":
+        return _workspace_response(response, service.get_or_create_workspace(user_id))
+    header = service.get_workspace_header(user_id)
+    etag = _workspace_etag(header["workspace_id"], header["updated_at"], "summary")
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "private, no-cache"})
+    return _workspace_response(response, service.get_workspace_summary(user_id))
+
+
+@router.get("/api/founder/revenue-wedge/runs")
+async def list_revenue_wedge_runs(request: Request, response: Response, before: Optional[str] = None, limit: int = 10):
+    user_id = get_authenticated_user_id(request)
+    service = get_founder_workspace_service()
+    header = service.get_workspace_header(user_id)
+    etag = _workspace_etag(header["workspace_id"], header["updated_at"], f"runs:{before or ''}:{limit}")
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "private, no-cache"})
+    page = service.list_runs(user_id, before=before, limit=limit, workspace_id=header["workspace_id"])
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, no-cache"
+    return page
 
 
 @router.post("/api/founder/revenue-wedge/input")
 async def create_revenue_wedge_input(
     request: Request,
+    response: Response,
     tag: str = Form(...),
     title: str = Form(""),
     pasted_text: str = Form(""),
@@ -239,7 +295,7 @@ async def create_revenue_wedge_input(
         filename = file.filename
         content_type = file.content_type or "application/octet-stream"
 
-    raw_text = _validate_revenue_wedge_text(raw_text, source_type)
+    raw_text, text_stats = _validate_revenue_wedge_text(raw_text, source_type)
 
     now = _utc_now()
     input_record = {
@@ -251,49 +307,40 @@ async def create_revenue_wedge_input(
         "content_type": content_type,
         "raw_text": raw_text,
         "excerpt": _build_excerpt(raw_text),
+        "text_stats": text_stats,
         "created_at": now,
         "updated_at": now,
     }
     service = get_founder_workspace_service()
     workspace = service.save_input(user_id, input_record)
-    return _serialize_workspace(workspace)
+    return _workspace_response(response, workspace)
 
 
 @router.delete("/api/founder/revenue-wedge/input/{input_id}")
-async def delete_revenue_wedge_input(input_id: str, request: Request):
+async def delete_revenue_wedge_input(input_id: str, request: Request, response: Response):
     user_id = get_authenticated_user_id(request)
     service = get_founder_workspace_service()
     workspace = service.delete_input(user_id, input_id)
-    return _serialize_workspace(workspace)
+    return _workspace_response(response, workspace)
 
 
-@router.post("/api/founder/revenue-wedge/run")
-async def run_revenue_wedge(payload: RevenueRunRequest, request: Request):
-    user_id = get_authenticated_user_id(request)
-    service = get_founder_workspace_service()
-    workspace = service.get_or_create_workspace(user_id)
-    selected_ids = set(payload.input_ids or [])
+def _select_run_inputs(workspace: Dict[str, Any], input_ids: Optional[List[str]]) -> List[Dict[str, Any]]:
+    selected_ids = set(input_ids or [])
     inputs = workspace.get("inputs") or []
     if selected_ids:
         inputs = [item for item in inputs if item.get("input_id") in selected_ids]
     if not inputs:
         raise HTTPException(status_code=400, detail="Add founder inputs before running Revenue Wedge Engine.")
+    return inputs
 
-    previous_run = workspace.get("latest_run")
-    run_history = workspace.get("runs") or []
-    learned_patterns = workspace.get("learned_patterns") or {}
-    engine = get_revenue_wedge_engine()
-    result = engine.generate(inputs, previous_run=previous_run, run_history=run_history, learned_patterns=learned_patterns)
-    signals = {
-        key: [cluster.model_dump() if hasattr(cluster, "model_dump") else cluster for cluster in value]
-        for key, value in (result.get("signals") or {}).items()
-    }
+
+def _build_run_record(run_id: str, inputs: List[Dict[str, Any]], result: Dict[str, Any]) -> Dict[str, Any]:
     brief = result.get("decision_brief") or {}
-    run_record = {
-        "run_id": str(uuid.uuid4()),
+    return {
+        "run_id": run_id,
         "created_at": _utc_now(),
         "input_ids": [item.get("input_id") for item in inputs],
-        "signals": signals,
+        "signals": result.get("signals") or {},
         "decision_brief": brief,
         "snapshot": {
             "recommended_icp": brief.get("recommended_icp"),
@@ -310,12 +357,118 @@ async def run_revenue_wedge(payload: RevenueRunRequest, request: Request):
         "comparison": result.get("comparison"),
         "outcome_log": None,
     }
-    updated_workspace = service.save_run(user_id, run_record)
-    return _serialize_workspace(updated_workspace)
+
+
+async def _execute_revenue_run(
+    user_id: str,
+    run_id: str,
+    workspace: Dict[str, Any],
+    inputs: List[Dict[str, Any]],
+    progress=None,
+) -> Dict[str, Any]:
+    service = get_founder_workspace_service()
+    engine = get_revenue_wedge_engine()
+    result = await engine.agenerate(
+        inputs,
+        previous_run=workspace.get("latest_run"),
+        run_history=workspace.get("runs") or [],
+        learned_patterns=workspace.get("learned_patterns") or {},
+        progress=progress,
+        signal_caches=workspace.get("signal_caches") or {},
+        cache_scope=workspace.get("workspace_id") or user_id,
+    )
+    if result.get("input_extractions"):
+        try:
+            await asyncio.to_thread(service.save_input_signal_caches, user_id, result["input_extractions"])
+        except Exception:
+            logger.warning("founder input signal cache persistence failed", exc_info=True)
+    return await asyncio.to_thread(service.save_run, user_id, _build_run_record(run_id, inputs, result))
+
+
+@router.post("/api/founder/revenue-wedge/run")
+async def run_revenue_wedge(payload: RevenueRunRequest, request: Request, response: Response):
+    user_id = get_authenticated_user_id(request)
+    mode = (payload.mode or "sync").strip().lower()
+    if mode not in {"sync", "job"}:
+        raise HTTPException(status_code=400, detail="mode must be 'sync' or 'job'.")
+    service = get_founder_workspace_service()
+    workspace = await asyncio.to_thread(service.get_or_create_workspace, user_id)
+    inputs = _select_run_inputs(workspace, payload.input_ids)
+    run_id = str(uuid.uuid4())
+    admission = get_admission_controller("revenue_wedge")
+    fingerprint = request_fingerprint(sorted(item.get("input_id") for item in inputs))
+
+    if mode == "job":
+        jobs = get_revenue_wedge_jobs()
+        job = jobs.find_active(user_id, fingerprint)
+        if job is None:
+            # The job is registered before the first await so a duplicate request arriving while this
+            # one waits for admission joins it instead of starting a second run.
+            job = jobs.create(user_id, run_id, fingerprint=fingerprint)
+            # The slot is taken here so a saturated instance answers 429 instead of queueing a job,
+            # and it is held until the background run finishes.
+            try:
+                admitted_at = await admission.acquire(user_id)
+            except BaseException as exc:
+                jobs.update(run_id, "failed", error=str(getattr(exc, "detail", "") or "Not admitted."))
+                raise
+
+            async def run_job():
+                try:
+                    await _execute_revenue_run(user_id, run_id, workspace, inputs, progress=lambda stage: jobs.update(run_id, stage))
+                finally:
+                    admission.release(user_id, admitted_at)
+
+            jobs.start(run_id, run_job())
+        response.status_code = 202
+        return {
+            **job,
+            "status_url": f"/api/founder/revenue-wedge/run/{job['run_id']}/status",
+            "events_url": f"/api/founder/revenue-wedge/run/{job['run_id']}/events",
+        }
+
+    updated_workspace = await admission.run(
+        user_id,
+        fingerprint,
+        lambda: _execute_revenue_run(user_id, run_id, workspace, inputs),
+    )
+    return _workspace_response(response, updated_workspace)
+
+
+@router.get("/api/founder/revenue-wedge/run/{run_id}/status")
+async def get_revenue_wedge_job(run_id: str, request: Request):
+    user_id = get_authenticated_user_id(request)
+    job = get_revenue_wedge_jobs().get(user_id, run_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Revenue wedge job not found.")
+    return job
+
+
+@router.get("/api/founder/revenue-wedge/run/{run_id}/events")
+async def stream_revenue_wedge_job(run_id: str, request: Request):
+    user_id = get_authenticated_user_id(request)
+    jobs = get_revenue_wedge_jobs()
+    if jobs.get(user_id, run_id) is None:
+        raise HTTPException(status_code=404, detail="Revenue wedge job not found.")
+
+    async def event_source():
+        async for event in jobs.stream(user_id, run_id):
+            if await request.is_disconnected():
+                return
+            if event is None:
+                yield ": keepalive\n\n"
+                continue
+            yield f"event: {event['stage']}\ndata: {json.dumps(event)}\n\n"
+
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.post("/api/founder/revenue-wedge/run/{run_id}/result")
-async def log_revenue_wedge_result(run_id: str, payload: RevenueRunResultPayload, request: Request):
+async def log_revenue_wedge_result(run_id: str, payload: RevenueRunResultPayload, request: Request, response: Response):
     user_id = get_authenticated_user_id(request)
     service = get_founder_workspace_service()
     try:
@@ -334,4 +487,4 @@ async def log_revenue_wedge_result(run_id: str, payload: RevenueRunResultPayload
         )
     except KeyError as exc:
         raise HTTPException(status_code=404, detail="Revenue wedge run not found.") from exc
-    return _serialize_workspace(workspace)
+    return _workspace_response(response, workspace)
@@ -1,5 +1,7 @@
 from fastapi import APIRouter, Body, Response, HTTPException, Request
 from functools import lru_cache
+from typing import Tuple
+from src.admission import get_admission_controller, request_fingerprint
 from src.models import PitchDeckData, InvestmentMemo, ExecutiveSummary
 from src.auth import require_user_id
 from src.env_utils import normalize_secret
@@ -7,6 +9,7 @@ from src.memo_generator import MemoGenerator
 from src.exporter import Exporter
 from src.services.analysis_service import AnalysisService
 from src.session import get_active_analysis_id, set_active_analysis_id
+import asyncio
 import os
 
 router = APIRouter()
@@ -20,20 +23,28 @@ def get_analysis_service() -> AnalysisService:
 def get_authenticated_user_id(request: Request) -> str:
     return require_user_id(request)
 
+def _generate_memo_and_summary(api_key: str, data: PitchDeckData) -> Tuple[InvestmentMemo, ExecutiveSummary]:
+    generator = MemoGenerator(api_key=api_key)
+    memo = generator.generate_memo(data)
+    return memo, generator.generate_executive_summary(data, memo)
+
+
 @router.post("/api/generate_memo")
 async def generate_memo_endpoint(request: Request, response: Response, data: PitchDeckData):
     """
     Generates an investment memo and executive summary from pitch deck data.
     """
+    user_id = get_authenticated_user_id(request)
     try:
         api_key = normalize_secret(os.environ.get("GROQ_API_KEY"))
         if not api_key:
             raise HTTPException(status_code=500, detail="GROQ_API_KEY not found in environment variables.")
 
-        generator = MemoGenerator(api_key=api_key)
-        memo = generator.generate_memo(data)
-        summary = generator.generate_executive_summary(data, memo)
-        user_id = get_authenticated_user_id(request)
+        memo, summary = await get_admission_controller("memo").run(
+            user_id,
+            request_fingerprint(data.model_dump(mode="json")),
+            lambda: asyncio.to_thread(_generate_memo_and_summary, api_key, data),
+        )
         service = get_analysis_service()
         active = service.get_or_create_active_analysis(
             user_id=user_id,
@@ -53,6 +64,8 @@ async def generate_memo_endpoint(request: Request, response: Response, data: Pit
             "memo": memo.dict(),
             "summary": summary.dict()
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
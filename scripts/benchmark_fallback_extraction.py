@@ -0,0 +1,113 @@
+"""Benchmark the compiled category matcher against the per-keyword substring loop.
+
+Usage: python scripts/benchmark_fallback_extraction.py [--sentences 10000] [--hit-rate 0.3] [--repeat 3]
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT_DIR))
+
+from src.models import RevenueWedgeInputRecord  # noqa: E402
+from src.revenue_wedge_engine import (  # noqa: E402
+    CATEGORY_KEYWORDS,
+    CATEGORY_MATCHER,
+    RevenueWedgeEngine,
+    _split_sentences,
+)
+
+FILLER_WORDS = (
+    "the", "customer", "mentioned", "that", "their", "current", "process", "is", "quite", "for", "our",
+    "account", "and", "they", "asked", "about", "next", "steps", "with", "contract", "review", "pilot",
+)
+
+
+def build_corpus(sentence_count: int, hit_rate: float = 0.3, seed: int = 7) -> str:
+    rng = random.Random(seed)
+    keywords = [keyword for values in CATEGORY_KEYWORDS.values() for keyword in values]
+    sentences = []
+    for _index in range(sentence_count):
+        words = rng.choices(FILLER_WORDS, k=rng.randint(8, 18))
+        hit_count = rng.randint(1, 3) if rng.random() < hit_rate else 0
+        for _hit in range(hit_count):
+            words.insert(rng.randrange(len(words) + 1), rng.choice(keywords))
+        sentences.append(" ".join(words).capitalize() + ".")
+    return " ".join(sentences)
+
+
+# Sentences whose length changes under ``str.lower()`` ("İ" lowers to two code points), mixed
+# with keyword hits, so a matcher that maps match positions back to sentences wrongly is caught.
+NON_ASCII_SENTENCES = [
+    "İİİİ İstanbul team.",
+    "İİİİİİİİ",
+    "Our pricing is too expensive for the budget.",
+    "ÉTUDE İNCELEME: the onboarding setup took weeks.",
+    "Straße İ renewal churn risk.",
+]
+
+
+def legacy_match(sentences):
+    results = []
+    for sentence in sentences:
+        lowered = sentence.lower()
+        hits = {}
+        for category, keywords in CATEGORY_KEYWORDS.items():
+            keyword = next((value for value in keywords if value in lowered), None)
+            if keyword:
+                hits[category] = keyword
+        results.append(hits)
+    return results
+
+
+def best_of(repeat, func, *args):
+    timings = []
+    result = None
+    for _index in range(repeat):
+        started = time.perf_counter()
+        result = func(*args)
+        timings.append(time.perf_counter() - started)
+    return min(timings), result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sentences", type=int, default=10000)
+    parser.add_argument("--hit-rate", type=float, default=0.3, help="share of sentences containing keywords")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.sentences, args.hit_rate)
+    sentences = _split_sentences(corpus)
+    legacy_time, legacy_hits = best_of(args.repeat, legacy_match, sentences)
+    compiled_time, compiled_hits = best_of(args.repeat, CATEGORY_MATCHER.match_sentences, sentences)
+    if legacy_hits != compiled_hits:
+        raise SystemExit("compiled matcher disagrees with the legacy loop")
+    if legacy_match(NON_ASCII_SENTENCES) != CATEGORY_MATCHER.match_sentences(NON_ASCII_SENTENCES):
+        raise SystemExit("compiled matcher disagrees with the legacy loop on non-ASCII text")
+
+    engine = RevenueWedgeEngine(api_key="")
+    engine.llm = None
+    record = {
+        "input_id": "bench",
+        "title": "Synthetic CRM export",
+        "tag": "crm_export",
+        "source_type": "upload",
+        "content_type": "text/csv",
+        "raw_text": corpus,
+        "excerpt": "",
+        "created_at": "",
+        "updated_at": "",
+    }
+    extraction_time, extraction = best_of(args.repeat, engine._fallback_extraction, [RevenueWedgeInputRecord(**record)])
+
+    print(f"sentences: {len(sentences)}")
+    print(f"legacy keyword loop:   {legacy_time * 1000:8.1f} ms")
+    print(f"compiled matcher:      {compiled_time * 1000:8.1f} ms  ({legacy_time / compiled_time:.1f}x)")
+    print(f"_fallback_extraction:  {extraction_time * 1000:8.1f} ms  ({len(extraction.observations)} observations)")
+
+
+if __name__ == "__main__":
+    main()
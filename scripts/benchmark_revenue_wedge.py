@@ -0,0 +1,182 @@
+"""Benchmark RevenueWedgeEngine offline on synthetic founder workspaces.
+
+LLM calls go through ReplayChatModel, so runs are deterministic and need no network:
+  --llm synthetic   answer every prompt with the engine's own heuristics (default)
+  --llm replay      play back --replay-file, falling back to synthetic answers (or failing with --strict)
+  --llm record      call Groq (GROQ_API_KEY) on misses and write the responses to --replay-file
+  --llm none        no LLM at all; the pure heuristic path
+
+Usage: python scripts/benchmark_revenue_wedge.py [--scenarios 5x1,50x20,500x200] [--repeat 3]
+       [--save outputs.json] [--compare baseline.json]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT_DIR))
+
+from src.revenue_wedge_engine import (  # noqa: E402
+    RevenueWedgeEngine,
+    clear_normalization_caches,
+    extraction_cache,
+    normalization_cache_stats,
+)
+from src.revenue_wedge_replay import (  # noqa: E402
+    ReplayChatModel,
+    ReplayStore,
+    heuristic_responder,
+    synthetic_workspace,
+)
+
+STAGES = ("extract", "cluster", "context", "quality", "brief", "validate")
+
+
+def parse_scenarios(value):
+    scenarios = []
+    for item in value.split(","):
+        inputs, _sep, runs = item.strip().partition("x")
+        scenarios.append((int(inputs), int(runs or 0)))
+    return scenarios
+
+
+def build_engine(args, store):
+    engine = RevenueWedgeEngine(api_key="")
+    if args.llm == "none":
+        return engine
+    inner = None
+    if args.llm == "record":
+        from langchain_groq import ChatGroq
+
+        api_key = os.environ.get("GROQ_API_KEY")
+        if not api_key:
+            raise SystemExit("--llm record needs GROQ_API_KEY")
+        inner = ChatGroq(temperature=0, model_name=engine.model_name, groq_api_key=api_key)
+    responder = None if (args.llm == "replay" and args.strict) else heuristic_responder(engine)
+    engine.llm = ReplayChatModel(store=store, inner=inner, responder=responder)
+    return engine
+
+
+def run_once(engine, workspace, measure_alloc=False):
+    stage_ms = {}
+
+    def profile(stage, elapsed_ms):
+        stage_ms[stage] = stage_ms.get(stage, 0.0) + elapsed_ms
+
+    if measure_alloc:
+        tracemalloc.start()
+    started = time.perf_counter()
+    result = engine.generate(
+        workspace["inputs"],
+        previous_run=workspace["latest_run"],
+        run_history=workspace["runs"],
+        learned_patterns=workspace["learned_patterns"],
+        profile=profile,
+    )
+    total_ms = (time.perf_counter() - started) * 1000
+    peak = 0
+    if measure_alloc:
+        _current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return result, total_ms, stage_ms, peak
+
+
+def canonical_output(result):
+    output = {key: value for key, value in result.items() if key != "input_extractions"}
+    return json.loads(json.dumps(output, default=str, sort_keys=True))
+
+
+def diff_paths(before, after, path="", limit=10):
+    if len(diff_paths.found) >= limit:
+        return
+    if isinstance(before, dict) and isinstance(after, dict):
+        for key in sorted(set(before) | set(after)):
+            diff_paths(before.get(key), after.get(key), f"{path}.{key}" if path else str(key), limit)
+    elif isinstance(before, list) and isinstance(after, list) and len(before) == len(after):
+        for index, (left, right) in enumerate(zip(before, after)):
+            diff_paths(left, right, f"{path}[{index}]", limit)
+    elif before != after:
+        diff_paths.found.append(path or "<root>")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenarios", default="5x1,50x20,500x200", help="comma-separated INPUTSxRUNS workspace sizes")
+    parser.add_argument("--llm", choices=("synthetic", "replay", "record", "none"), default="synthetic")
+    parser.add_argument("--replay-file", default="", help="recorded responses for --llm replay/record")
+    parser.add_argument("--strict", action="store_true", help="with --llm replay, treat misses as LLM failures")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--warm-cache", action="store_true", help="keep extraction and normalization caches between repeats")
+    parser.add_argument("--cache-stats", action="store_true", help="print normalization helper call counts and hit rates")
+    parser.add_argument("--no-alloc", action="store_true", help="skip the tracemalloc pass")
+    parser.add_argument("--seed", type=int, default=11)
+    parser.add_argument("--save", default="", help="write outputs per scenario to this JSON file")
+    parser.add_argument("--compare", default="", help="diff outputs against a file written by --save")
+    args = parser.parse_args()
+    if args.llm in {"replay", "record"} and not args.replay_file:
+        raise SystemExit(f"--llm {args.llm} needs --replay-file")
+
+    store = ReplayStore(args.replay_file or None)
+    engine = build_engine(args, store)
+    baseline = {}
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as handle:
+            baseline = json.load(handle)
+
+    outputs = {}
+    header = f"{'scenario':>10} {'total ms':>10} " + " ".join(f"{stage:>9}" for stage in STAGES) + f" {'peak KiB':>9}  source"
+    print(header)
+    for input_count, run_count in parse_scenarios(args.scenarios):
+        name = f"{input_count}x{run_count}"
+        workspace = synthetic_workspace(input_count, run_count, seed=args.seed)
+        best = None
+        for _index in range(max(1, args.repeat)):
+            if not args.warm_cache:
+                extraction_cache.clear()
+                clear_normalization_caches()
+            result, total_ms, stage_ms, _peak = run_once(engine, workspace)
+            if best is None or total_ms < best[1]:
+                best = (result, total_ms, stage_ms)
+        peak = 0
+        if not args.no_alloc:
+            if not args.warm_cache:
+                extraction_cache.clear()
+                clear_normalization_caches()
+            _result, _total, _stages, peak = run_once(engine, workspace, measure_alloc=True)
+
+        result, total_ms, stage_ms = best
+        outputs[name] = canonical_output(result)
+        stages = " ".join(f"{stage_ms.get(stage, 0.0):9.1f}" for stage in STAGES)
+        print(f"{name:>10} {total_ms:10.1f} {stages} {peak / 1024:9.0f}  {result.get('generation_source')}")
+
+    if args.cache_stats:
+        for helper, stats in sorted(normalization_cache_stats().items()):
+            print(f"{helper:>28}: {stats['calls']:>8} calls  {stats['hit_rate']:6.1%} hits  {stats['size']:>5}/{stats['max_size']} cached")
+    if isinstance(engine.llm, ReplayChatModel):
+        print(f"llm calls: {engine.llm.stats}")
+    if args.llm == "record":
+        store.save()
+        print(f"recorded responses written to {args.replay_file}")
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as handle:
+            json.dump(outputs, handle, indent=1, sort_keys=True)
+    if baseline:
+        changed = 0
+        for name, output in outputs.items():
+            if name not in baseline:
+                print(f"{name}: not in baseline")
+                continue
+            diff_paths.found = []
+            diff_paths(baseline[name], output)
+            if diff_paths.found:
+                changed += 1
+                print(f"{name}: output differs at {', '.join(diff_paths.found)}")
+        print(f"output diff: {changed} of {len(outputs)} scenarios changed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""Admission control for the LLM-heavy endpoints.
+
+Each route class gets a ``AdmissionController`` with a global and a per-user concurrency limit.
+Requests past the global limit wait in a short bounded queue; a user already at their limit, a full
+queue or a queue timeout is turned away with ``429`` and a ``Retry-After`` hint. ``run`` also folds
+identical in-flight requests from the same user into one execution.
+"""
+import asyncio
+import hashlib
+import json
+import math
+import os
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+
+from fastapi import HTTPException
+
+from src.metrics import Counter, Gauge, registry
+
+T = TypeVar("T")
+
+DEFAULT_QUEUE_SIZE = 8
+DEFAULT_QUEUE_TIMEOUT_SECONDS = 5.0
+INITIAL_HOLD_SECONDS = 5.0
+MAX_RETRY_AFTER_SECONDS = 120
+REJECTION_MESSAGES = {
+    "user": "you already have one running",
+    "queue_full": "the queue is full",
+    "timeout": "no slot freed up in time",
+}
+
+
+@dataclass(frozen=True)
+class AdmissionLimits:
+    global_limit: int
+    per_user_limit: int
+    queue_size: int = DEFAULT_QUEUE_SIZE
+    queue_timeout: float = DEFAULT_QUEUE_TIMEOUT_SECONDS
+
+
+# Override one class with HATCHUP_ADMISSION_<CLASS>="global,per_user[,queue_size[,queue_timeout]]".
+ROUTE_CLASS_LIMITS: Dict[str, AdmissionLimits] = {
+    "analyze": AdmissionLimits(global_limit=4, per_user_limit=1),
+    "memo": AdmissionLimits(global_limit=4, per_user_limit=1),
+    "chat": AdmissionLimits(global_limit=16, per_user_limit=2),
+    "revenue_wedge": AdmissionLimits(global_limit=4, per_user_limit=1),
+    "talent_scout": AdmissionLimits(global_limit=4, per_user_limit=1),
+}
+
+admission_events = registry.register(
+    Counter(
+        "hatchup_admission_events_total",
+        "Admission decisions per route class (admitted, queued, deduplicated, rejected_user, rejected_queue_full, rejected_timeout).",
+        ("route_class", "event"),
+    )
+)
+admission_active = registry.register(Gauge("hatchup_admission_active", "Requests holding an admission slot.", ("route_class",)))
+admission_waiting = registry.register(Gauge("hatchup_admission_waiting", "Requests queued for an admission slot.", ("route_class",)))
+
+
+class AdmissionRejected(HTTPException):
+    def __init__(self, route_class: str, reason: str, retry_after: int) -> None:
+        super().__init__(
+            status_code=429,
+            detail=f"Too many {route_class.replace('_', ' ')} requests right now ({reason}). Retry in {retry_after}s.",
+            headers={"Retry-After": str(retry_after)},
+        )
+        self.reason = reason
+
+
+def request_fingerprint(*parts: Any) -> str:
+    """Stable hash of a request's meaningful inputs, used to detect duplicate submissions."""
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, bytes):
+            digest.update(part)
+        else:
+            digest.update(json.dumps(part, sort_keys=True, default=str, ensure_ascii=True).encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+class AdmissionController:
+    def __init__(self, route_class: str, limits: AdmissionLimits) -> None:
+        self.route_class = route_class
+        self.limits = limits
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._active = 0
+        self._waiting = 0
+        self._per_user: Dict[str, int] = {}
+        self._inflight: Dict[Tuple[str, str], asyncio.Task] = {}
+        self._average_hold = INITIAL_HOLD_SECONDS
+
+    def _retry_after(self) -> int:
+        # Roughly how long until a slot frees up for someone at the back of the queue.
+        backlog = (self._waiting + 1) / max(1, self.limits.global_limit)
+        return max(1, min(MAX_RETRY_AFTER_SECONDS, math.ceil(self._average_hold * backlog)))
+
+    def _reject(self, reason: str) -> AdmissionRejected:
+        admission_events.inc(route_class=self.route_class, event=f"rejected_{reason}")
+        return AdmissionRejected(self.route_class, REJECTION_MESSAGES[reason], self._retry_after())
+
+    async def acquire(self, user_id: str) -> float:
+        """Take a global and a per-user slot, waiting in the queue if needed; returns the admit time."""
+        if self._per_user.get(user_id, 0) >= self.limits.per_user_limit:
+            raise self._reject("user")
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.limits.global_limit)
+        if self._semaphore.locked() and self._waiting >= self.limits.queue_size:
+            raise self._reject("queue_full")
+        self._per_user[user_id] = self._per_user.get(user_id, 0) + 1
+        try:
+            if self._semaphore.locked():
+                admission_events.inc(route_class=self.route_class, event="queued")
+                self._waiting += 1
+                admission_waiting.inc(route_class=self.route_class)
+                try:
+                    await asyncio.wait_for(self._semaphore.acquire(), timeout=self.limits.queue_timeout)
+                except asyncio.TimeoutError:
+                    raise self._reject("timeout") from None
+                finally:
+                    self._waiting -= 1
+                    admission_waiting.dec(route_class=self.route_class)
+            else:
+                await self._semaphore.acquire()
+        except BaseException:
+            self._release_user(user_id)
+            raise
+        self._active += 1
+        admission_active.inc(route_class=self.route_class)
+        admission_events.inc(route_class=self.route_class, event="admitted")
+        return time.monotonic()
+
+    def _release_user(self, user_id: str) -> None:
+        remaining = self._per_user.get(user_id, 0) - 1
+        if remaining > 0:
+            self._per_user[user_id] = remaining
+        else:
+            self._per_user.pop(user_id, None)
+
+    def release(self, user_id: str, admitted_at: Optional[float] = None) -> None:
+        if admitted_at is not None:
+            self._average_hold = 0.8 * self._average_hold + 0.2 * (time.monotonic() - admitted_at)
+        self._active -= 1
+        admission_active.dec(route_class=self.route_class)
+        self._release_user(user_id)
+        if self._semaphore is not None:
+            self._semaphore.release()
+
+    @asynccontextmanager
+    async def slot(self, user_id: str) -> AsyncIterator[None]:
+        admitted_at = await self.acquire(user_id)
+        try:
+            yield
+        finally:
+            self.release(user_id, admitted_at)
+
+    async def _admit_and_run(self, user_id: str, work: Callable[[], Awaitable[T]]) -> T:
+        async with self.slot(user_id):
+            return await work()
+
+    def _forget(self, key: Tuple[str, str], task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            self._inflight.pop(key, None)
+        if not task.cancelled():
+            task.exception()
+
+    async def run(self, user_id: str, fingerprint: str, work: Callable[[], Awaitable[T]]) -> T:
+        """Run ``work`` under a slot, or join the identical request this user already has in flight.
+
+        The work runs as its own task, so a caller that disconnects does not cancel it for the
+        others waiting on the same result.
+        """
+        key = (user_id, fingerprint)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._admit_and_run(user_id, work))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            admission_events.inc(route_class=self.route_class, event="deduplicated")
+        return await asyncio.shield(task)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "route_class": self.route_class,
+            "active": self._active,
+            "waiting": self._waiting,
+            "users": len(self._per_user),
+            "deduplicating": len(self._inflight),
+            "limits": self.limits.__dict__,
+        }
+
+
+def _limits_for(route_class: str) -> AdmissionLimits:
+    limits = ROUTE_CLASS_LIMITS[route_class]
+    raw = (os.environ.get(f"HATCHUP_ADMISSION_{route_class.upper()}") or "").strip()
+    if not raw:
+        return limits
+    values = [value.strip() for value in raw.split(",")]
+    return AdmissionLimits(
+        global_limit=max(1, int(values[0])),
+        per_user_limit=max(1, int(values[1])) if len(values) > 1 and values[1] else limits.per_user_limit,
+        queue_size=max(0, int(values[2])) if len(values) > 2 and values[2] else limits.queue_size,
+        queue_timeout=float(values[3]) if len(values) > 3 and values[3] else limits.queue_timeout,
+    )
+
+
+@lru_cache(maxsize=None)
+def get_admission_controller(route_class: str) -> AdmissionController:
+    return AdmissionController(route_class, _limits_for(route_class))
+
@@ -1,13 +1,13 @@
 from typing import Optional
-from langchain_groq import ChatGroq
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import PydanticOutputParser
 from src.env_utils import normalize_secret
+from src.metrics import track_llm_call
 from src.models import PitchDeckData
 import os
 
 class PitchDeckAnalyzer:
     def __init__(self, api_key: str, model_name: str = "openai/gpt-oss-20b"):
+        from langchain_groq import ChatGroq
+
         cleaned_api_key = normalize_secret(api_key)
         self.llm = ChatGroq(
             temperature=0,
@@ -20,6 +20,9 @@ class PitchDeckAnalyzer:
         Analyzes the full text of a pitch deck and extracts structured insights.
         """
         
+        from langchain_core.output_parsers import PydanticOutputParser
+        from langchain_core.prompts import ChatPromptTemplate
+
         # We will use PydanticOutputParser to ensure strictly formatted JSON
         parser = PydanticOutputParser(pydantic_object=PitchDeckData)
         
@@ -38,10 +41,11 @@ Output must be valid JSON matching the schema provided."""
         chain = prompt | self.llm | parser
         
         try:
-            result = chain.invoke({
-                "text": deck_text,
-                "format_instructions": parser.get_format_instructions()
-            })
+            with track_llm_call("analyzer") as llm_config:
+                result = chain.invoke({
+                    "text": deck_text,
+                    "format_instructions": parser.get_format_instructions()
+                }, config=llm_config)
             return result
         except Exception as e:
             # Fallback or error handling
@@ -4,6 +4,8 @@ from typing import Optional, Any
 
 from fastapi import HTTPException, Request
 
+from src.instrumentation import set_current_user, span
+
 AUTH_COOKIE_NAME = "hatchup_access_token"
 
 
@@ -47,6 +49,16 @@ def require_user_id(request: Request) -> str:
     user_id = getattr(user, "id", None)
     if not user_id:
         raise HTTPException(status_code=401, detail="Invalid authentication token")
+    set_current_user(user_id)
+    return user_id
+
+
+def require_admin_user_id(request: Request) -> str:
+    """Authenticated user id that is listed in ``HATCHUP_ADMIN_USER_IDS`` (comma-separated)."""
+    user_id = require_user_id(request)
+    admin_ids = {value.strip() for value in os.environ.get("HATCHUP_ADMIN_USER_IDS", "").split(",") if value.strip()}
+    if user_id not in admin_ids:
+        raise HTTPException(status_code=403, detail="Admin access required")
     return user_id
 
 
@@ -56,8 +68,9 @@ def require_user(request: Request) -> Any:
         raise HTTPException(status_code=401, detail="Authentication required")
 
     try:
-        client = get_supabase_auth_client()
-        auth_response = client.auth.get_user(token)
+        with span("auth"):
+            client = get_supabase_auth_client()
+            auth_response = client.auth.get_user(token)
     except Exception:
         raise HTTPException(status_code=401, detail="Invalid authentication token")
 
@@ -0,0 +1,180 @@
+"""Circuit breakers for MCP servers and external providers.
+
+A breaker watches the recent outcomes of calls to one dependency. Once enough of them fail it
+opens, and calls are refused instantly with ``CircuitOpenError`` instead of waiting on a dead
+provider. After a cooldown a single half-open probe is let through: success closes the breaker,
+failure re-opens it with a longer cooldown.
+"""
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+from src.metrics import Counter, Gauge, registry
+
+WINDOW_SIZE = 20
+WINDOW_SECONDS = 120.0
+MIN_CALLS = 4
+FAILURE_RATE_THRESHOLD = 0.5
+OPEN_SECONDS = 30.0
+MAX_OPEN_SECONDS = 300.0
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+# Client errors that describe the request rather than the provider's health.
+NEUTRAL_STATUS_CODES = frozenset(range(400, 500)) - {401, 403, 408, 429}
+
+circuit_state = registry.register(
+    Gauge("hatchup_circuit_state", "Circuit breaker state per provider (0 closed, 1 half-open, 2 open).", ("provider",))
+)
+circuit_rejections = registry.register(
+    Counter("hatchup_circuit_rejections_total", "Calls refused because the provider's circuit was open.", ("provider",))
+)
+
+
+class CircuitOpenError(RuntimeError):
+    def __init__(self, provider: str, retry_in: float) -> None:
+        super().__init__(f"{provider} is temporarily unavailable (circuit open, retry in {max(1, round(retry_in))}s)")
+        self.provider = provider
+        self.retry_in = retry_in
+
+
+def is_failure(exc: BaseException) -> bool:
+    status = getattr(exc, "status_code", None) or getattr(getattr(exc, "response", None), "status_code", None)
+    return not (isinstance(status, int) and status in NEUTRAL_STATUS_CODES)
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        name: str,
+        window_size: int = WINDOW_SIZE,
+        window_seconds: float = WINDOW_SECONDS,
+        min_calls: int = MIN_CALLS,
+        failure_rate: float = FAILURE_RATE_THRESHOLD,
+        open_seconds: float = OPEN_SECONDS,
+    ) -> None:
+        self.name = name
+        self.window_seconds = window_seconds
+        self.min_calls = min_calls
+        self.failure_rate = failure_rate
+        self.base_open_seconds = open_seconds
+        self.state = CLOSED
+        self._outcomes: Deque[Tuple[float, bool]] = deque(maxlen=window_size)
+        self._open_seconds = open_seconds
+        self._opened_at = 0.0
+        self._probe_started: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def _set_state(self, state: str) -> None:
+        self.state = state
+        circuit_state.set(STATE_VALUES[state], provider=self.name)
+
+    def _retry_in(self, now: float) -> float:
+        return max(0.0, self._opened_at + self._open_seconds - now)
+
+    def allow(self) -> bool:
+        """Whether a call may go out now; in half-open state only one probe is in flight at a time."""
+        now = time.monotonic()
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN and self._retry_in(now) > 0:
+                return False
+            # Cooldown over, or a half-open probe that never reported back: let one probe through.
+            if self._probe_started is not None and now - self._probe_started < self._open_seconds:
+                return False
+            self._set_state(HALF_OPEN)
+            self._probe_started = now
+            return True
+
+    def retry_in(self) -> float:
+        with self._lock:
+            return self._retry_in(time.monotonic())
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._outcomes.append((time.monotonic(), True))
+            if self.state != CLOSED:
+                self._outcomes.clear()
+                self._open_seconds = self.base_open_seconds
+                self._probe_started = None
+                self._set_state(CLOSED)
+
+    def record_failure(self) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._outcomes.append((now, False))
+            if self.state == HALF_OPEN:
+                self._open_seconds = min(MAX_OPEN_SECONDS, self._open_seconds * 2)
+                self._trip(now)
+                return
+            while self._outcomes and now - self._outcomes[0][0] > self.window_seconds:
+                self._outcomes.popleft()
+            failures = sum(1 for _at, ok in self._outcomes if not ok)
+            if len(self._outcomes) >= self.min_calls and failures / len(self._outcomes) >= self.failure_rate:
+                self._trip(now)
+
+    def _trip(self, now: float) -> None:
+        self._opened_at = now
+        self._probe_started = None
+        self._set_state(OPEN)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            outcomes = list(self._outcomes)
+            return {
+                "provider": self.name,
+                "state": self.state,
+                "calls": len(outcomes),
+                "failures": sum(1 for _at, ok in outcomes if not ok),
+                "retry_in_seconds": round(self._retry_in(time.monotonic()), 1) if self.state == OPEN else 0,
+            }
+
+
+class CircuitBreakerRegistry:
+    def __init__(self) -> None:
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(name)
+            if breaker is None:
+                breaker = self._breakers[name] = CircuitBreaker(name)
+            return breaker
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return [breaker.snapshot() for breaker in sorted(breakers, key=lambda item: item.name)]
+
+
+circuit_breakers = CircuitBreakerRegistry()
+
+
+def check_circuit(name: str) -> CircuitBreaker:
+    """Return the breaker for ``name``, raising ``CircuitOpenError`` when calls are being refused."""
+    breaker = circuit_breakers.get(name)
+    if not breaker.allow():
+        circuit_rejections.inc(provider=name)
+        raise CircuitOpenError(name, breaker.retry_in())
+    return breaker
+
+
+@contextmanager
+def circuit(name: str) -> Iterator[CircuitBreaker]:
+    """Guard one call to ``name``: refuse it while open and record how it went."""
+    breaker = check_circuit(name)
+    try:
+        yield breaker
+    except Exception as exc:
+        if is_failure(exc):
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        raise
+    breaker.record_success()
@@ -0,0 +1,145 @@
+"""Request-scoped deadlines and hedged calls for outbound provider requests.
+
+A route opens ``deadline(seconds)``; the absolute deadline lives in a ContextVar, so it follows the
+request into asyncio tasks and ``asyncio.to_thread`` workers. ``call_timeout`` turns a provider's
+usual per-call timeout into whatever is left of that budget. ``hedged`` runs an idempotent call and,
+if it has not answered by the provider's recent p90 latency, fires a second attempt and returns
+whichever succeeds first.
+"""
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Awaitable, Callable, Deque, Dict, Iterator, Optional, TypeVar
+
+from src.metrics import Counter, registry
+
+T = TypeVar("T")
+
+LATENCY_SAMPLES = 200
+MIN_HEDGE_SAMPLES = 20
+HEDGE_QUANTILE = 0.9
+MIN_HEDGE_DELAY_SECONDS = 0.05
+# Hedging is on by default; set HATCHUP_HEDGED_REQUESTS=0 to send every call once.
+HEDGING_ENABLED = os.environ.get("HATCHUP_HEDGED_REQUESTS", "1").strip().lower() not in {"0", "false", "no", "off"}
+
+_deadline: ContextVar[Optional[float]] = ContextVar("hatchup_deadline", default=None)
+
+hedge_events = registry.register(
+    Counter("hatchup_hedge_events_total", "Hedged provider calls (fired, won when the second attempt answered first).", ("provider", "event"))
+)
+
+
+class DeadlineExceeded(TimeoutError):
+    def __init__(self) -> None:
+        super().__init__("request deadline exceeded")
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[float]:
+    """Bound the enclosed work to ``seconds`` from now, or the enclosing deadline if that is sooner."""
+    candidate = time.monotonic() + seconds
+    current = _deadline.get()
+    absolute = candidate if current is None else min(current, candidate)
+    token = _deadline.set(absolute)
+    try:
+        yield absolute
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """Seconds left before the current deadline, ``None`` when no deadline is set."""
+    absolute = _deadline.get()
+    if absolute is None:
+        return None
+    return max(0.0, absolute - time.monotonic())
+
+
+def call_timeout(cap: float) -> float:
+    """Timeout for one outbound call: ``cap``, cut down to the remaining budget."""
+    left = remaining()
+    if left is None:
+        return cap
+    if left <= 0:
+        raise DeadlineExceeded()
+    return min(cap, left)
+
+
+class LatencyTracker:
+    """Recent successful call latencies for one provider, used to pick the hedge delay."""
+
+    def __init__(self, max_samples: int = LATENCY_SAMPLES) -> None:
+        self._samples: Deque[float] = deque(maxlen=max_samples)
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def quantile(self, q: float) -> Optional[float]:
+        with self._lock:
+            if len(self._samples) < MIN_HEDGE_SAMPLES:
+                return None
+            ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+_trackers: Dict[str, LatencyTracker] = {}
+_trackers_lock = threading.Lock()
+
+
+def latency_tracker(provider: str) -> LatencyTracker:
+    with _trackers_lock:
+        tracker = _trackers.get(provider)
+        if tracker is None:
+            tracker = _trackers[provider] = LatencyTracker()
+        return tracker
+
+
+async def _observed(tracker: LatencyTracker, attempt: Callable[[], Awaitable[T]]) -> T:
+    started = time.monotonic()
+    result = await attempt()
+    tracker.observe(time.monotonic() - started)
+    return result
+
+
+async def hedged(provider: str, attempt: Callable[[], Awaitable[T]]) -> T:
+    """Await ``attempt()``, firing one backup attempt if it is slower than the provider's p90.
+
+    Only for idempotent calls. The first attempt to succeed wins and the other is cancelled; if
+    both fail, the first failure is raised. A failure before the hedge delay is not retried.
+    """
+    tracker = latency_tracker(provider)
+    delay = tracker.quantile(HEDGE_QUANTILE) if HEDGING_ENABLED else None
+    left = remaining()
+    if delay is None or (left is not None and left <= delay):
+        return await _observed(tracker, attempt)
+
+    tasks = [asyncio.ensure_future(_observed(tracker, attempt))]
+    try:
+        done, _pending = await asyncio.wait(tasks, timeout=max(MIN_HEDGE_DELAY_SECONDS, delay))
+        if not done:
+            hedge_events.inc(provider=provider, event="fired")
+            tasks.append(asyncio.ensure_future(_observed(tracker, attempt)))
+        pending = set(tasks)
+        first_error: Optional[BaseException] = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in tasks:
+                if task not in done:
+                    continue
+                error = task.exception()
+                if error is None:
+                    if task is not tasks[0]:
+                        hedge_events.inc(provider=provider, event="won")
+                    return task.result()
+                first_error = first_error or error
+        raise first_error
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
@@ -1,14 +1,8 @@
 import csv
 import io
 from typing import List, Dict, Union
-import PyPDF2
-from pptx import Presentation
-from PIL import Image
-import pytesseract
-try:
-    from docx import Document
-except Exception:
-    Document = None
+
+from src.instrumentation import span, timed
 
 class DocumentParser:
     """
@@ -16,6 +10,7 @@ class DocumentParser:
     """
     
     @staticmethod
+    @timed("parse", "DocumentParser.parse_file")
     def parse_file(uploaded_file) -> str:
         """
         Detects file type and delegates to the appropriate parser.
@@ -42,6 +37,8 @@ class DocumentParser:
     def _parse_pdf(file) -> str:
         text = ""
         try:
+            import PyPDF2
+
             reader = PyPDF2.PdfReader(file)
             for page in reader.pages:
                 page_text = page.extract_text()
@@ -55,6 +52,8 @@ class DocumentParser:
     def _parse_pptx(file) -> str:
         text = ""
         try:
+            from pptx import Presentation
+
             prs = Presentation(file)
             for slide in prs.slides:
                 for shape in slide.shapes:
@@ -66,7 +65,9 @@ class DocumentParser:
 
     @staticmethod
     def _parse_docx(file) -> str:
-        if Document is None:
+        try:
+            from docx import Document
+        except Exception:
             return "Error parsing DOCX: python-docx is not installed."
         try:
             doc = Document(file)
@@ -111,8 +112,12 @@ class DocumentParser:
         Requires Tesseract to be installed on the system.
         """
         try:
+            import pytesseract
+            from PIL import Image
+
             image = Image.open(file)
-            text = pytesseract.image_to_string(image)
+            with span("ocr"):
+                text = pytesseract.image_to_string(image)
             return text
         except Exception as e:
             return f"Error parsing Image (OCR): {str(e)}. Ensure Tesseract is installed."
@@ -0,0 +1,137 @@
+"""Namespaced sets whose members expire a fixed time after they were last added.
+
+``ExpiringSet`` keeps every member in one ``OrderedDict`` ordered by when it was last touched.
+Because the TTL is the same for every member, the oldest entries are always at the front, so
+expiry and LRU eviction both pop from the front: amortized O(1) per write, instead of rescanning
+everything that is remembered. ``SqliteExpiringSet`` has the same interface but keeps members in
+a local SQLite file, so several uvicorn workers on one host share the memory.
+"""
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 50_000
+# The SQLite backend sweeps expired rows at most this often rather than on every write.
+SQLITE_SWEEP_INTERVAL_SECONDS = 60.0
+
+
+class ExpiringSet:
+    def __init__(self, ttl_seconds: float, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], float]" = OrderedDict()
+        self._namespaces: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def _discard_front(self) -> None:
+        (namespace, member), _touched = self._entries.popitem(last=False)
+        members = self._namespaces.get(namespace)
+        if members is not None:
+            members.discard(member)
+            if not members:
+                self._namespaces.pop(namespace, None)
+
+    def _expire(self, now: float) -> None:
+        cutoff = now - self.ttl_seconds
+        while self._entries and next(iter(self._entries.values())) < cutoff:
+            self._discard_front()
+
+    def add(self, namespace: str, members: Iterable[str]) -> None:
+        now = time.time()
+        with self._lock:
+            self._expire(now)
+            for member in members:
+                key = (namespace, member)
+                self._entries[key] = now
+                self._entries.move_to_end(key)
+                self._namespaces.setdefault(namespace, set()).add(member)
+            while len(self._entries) > self.max_entries:
+                self._discard_front()
+
+    def members(self, namespace: str) -> Set[str]:
+        with self._lock:
+            self._expire(time.time())
+            return set(self._namespaces.get(namespace) or ())
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._expire(time.time())
+            return len(self._entries)
+
+
+class SqliteExpiringSet:
+    """``ExpiringSet`` backed by a SQLite table, shared by every process that opens the same file."""
+
+    def __init__(self, path: str, table: str, ttl_seconds: float, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        if not re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", table):
+            raise ValueError(f"Invalid table name: {table!r}")
+        self.path = path
+        self.table = table
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._last_sweep = 0.0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=5.0, isolation_level=None, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} ("
+            "namespace TEXT NOT NULL, member TEXT NOT NULL, touched_at REAL NOT NULL, "
+            "PRIMARY KEY (namespace, member))"
+        )
+        self._connection.execute(f"CREATE INDEX IF NOT EXISTS {table}_touched_at ON {table} (touched_at)")
+
+    def _sweep(self, now: float) -> None:
+        if now - self._last_sweep < SQLITE_SWEEP_INTERVAL_SECONDS:
+            return
+        self._last_sweep = now
+        self._connection.execute(f"DELETE FROM {self.table} WHERE touched_at < ?", (now - self.ttl_seconds,))
+        (count,) = self._connection.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()
+        if count > self.max_entries:
+            self._connection.execute(
+                f"DELETE FROM {self.table} WHERE rowid IN "
+                f"(SELECT rowid FROM {self.table} ORDER BY touched_at LIMIT ?)",
+                (count - self.max_entries,),
+            )
+
+    def add(self, namespace: str, members: Iterable[str]) -> None:
+        now = time.time()
+        rows = [(namespace, member, now) for member in members]
+        with self._lock:
+            if rows:
+                self._connection.executemany(f"INSERT OR REPLACE INTO {self.table} VALUES (?, ?, ?)", rows)
+            self._sweep(now)
+
+    def members(self, namespace: str) -> Set[str]:
+        # Reads filter on the TTL themselves, so rows waiting for the next sweep never show up.
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT member FROM {self.table} WHERE namespace = ? AND touched_at >= ?",
+                (namespace, time.time() - self.ttl_seconds),
+            ).fetchall()
+        return {member for (member,) in rows}
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._connection.execute(
+                f"SELECT COUNT(*) FROM {self.table} WHERE touched_at >= ?",
+                (time.time() - self.ttl_seconds,),
+            ).fetchone()
+        return count
+
+
+def build_expiring_set(name: str, ttl_seconds: float, max_entries: int = DEFAULT_MAX_ENTRIES) -> Any:
+    """``HATCHUP_SHARED_MEMORY_PATH`` is a SQLite file shared by local workers, or unset for per-process memory."""
+    path = (os.environ.get("HATCHUP_SHARED_MEMORY_PATH") or "").strip()
+    if path:
+        try:
+            return SqliteExpiringSet(path, name, ttl_seconds, max_entries)
+        except (sqlite3.Error, OSError):
+            logger.warning("shared memory store unavailable; keeping %s in process memory", name, exc_info=True)
+    return ExpiringSet(ttl_seconds, max_entries)
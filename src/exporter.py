@@ -1,5 +1,3 @@
-import pandas as pd
-from fpdf import FPDF
 from src.models import PitchDeckData, InvestmentMemo
 import io
 
@@ -45,6 +43,8 @@ class Exporter:
             flat_data["Field"].append(k)
             flat_data["Value"].append(", ".join(v) if v else "None")
 
+        import pandas as pd
+
         df = pd.DataFrame(flat_data)
         
         output = io.BytesIO()
@@ -77,6 +77,8 @@ class Exporter:
         """
         Creates a PDF Investment Memo.
         """
+        from fpdf import FPDF
+
         pdf = FPDF()
         pdf.add_page()
         
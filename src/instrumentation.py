@@ -0,0 +1,236 @@
+"""Per-request timing spans, ``Server-Timing`` headers and per-route latency histograms.
+
+The HTTP middleware in ``main.py`` binds a ``SpanRecorder`` to the request context; ``span`` and
+``timed`` record how long a block took into it. The recorder follows the context into asyncio
+tasks and ``asyncio.to_thread`` workers, and outside a request a span costs one ContextVar lookup.
+"""
+import functools
+import inspect
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+MAX_SPANS_PER_REQUEST = 256
+MAX_TRACKED_ROUTES = 512
+
+_recorder: ContextVar[Optional["SpanRecorder"]] = ContextVar("hatchup_span_recorder", default=None)
+_active_spans: ContextVar[FrozenSet[str]] = ContextVar("hatchup_active_spans", default=frozenset())
+
+
+class SpanRecorder:
+    """Spans recorded while serving one request, in completion order, plus who made the request.
+
+    ``scope`` is the ASGI scope the router fills in, so the route template can be read once routing
+    has happened; ``user_id`` is set by ``src.auth`` when the request authenticates.
+    """
+
+    def __init__(self, scope: Optional[Dict[str, Any]] = None) -> None:
+        self.started = time.perf_counter()
+        self.scope = scope or {}
+        self.user_id: Optional[str] = None
+        self.spans: List[Tuple[str, str, float]] = []
+        self.dropped = 0
+        self._lock = threading.Lock()
+
+    def add(self, name: str, detail: str, elapsed_ms: float) -> None:
+        with self._lock:
+            if len(self.spans) >= MAX_SPANS_PER_REQUEST:
+                self.dropped += 1
+                return
+            self.spans.append((name, detail, elapsed_ms))
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started) * 1000
+
+    def totals(self) -> Dict[str, Tuple[float, int]]:
+        """Summed duration and call count per span name, in first-seen order."""
+        totals: Dict[str, Tuple[float, int]] = {}
+        with self._lock:
+            spans = list(self.spans)
+        for name, _detail, elapsed_ms in spans:
+            total, count = totals.get(name, (0.0, 0))
+            totals[name] = (total + elapsed_ms, count + 1)
+        return totals
+
+    def server_timing(self, total_ms: float) -> str:
+        # Durations are summed per name, so concurrent calls (e.g. parallel MCP searches) can add
+        # up to more than the request's wall time; ``desc`` carries the call count.
+        parts = [f'{name};dur={total:.1f};desc="{count}x"' for name, (total, count) in self.totals().items()]
+        parts.append(f"total;dur={total_ms:.1f}")
+        return ", ".join(parts)
+
+    def breakdown(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            spans = list(self.spans)
+        return [{"span": name, "detail": detail, "ms": round(elapsed_ms, 1)} for name, detail, elapsed_ms in spans]
+
+
+def start_recording(scope: Optional[Dict[str, Any]] = None) -> Tuple[SpanRecorder, Token]:
+    recorder = SpanRecorder(scope)
+    return recorder, _recorder.set(recorder)
+
+
+def stop_recording(token: Token) -> None:
+    _recorder.reset(token)
+
+
+def current_recorder() -> Optional[SpanRecorder]:
+    return _recorder.get()
+
+
+def route_from_scope(scope: Dict[str, Any]) -> str:
+    path = getattr(scope.get("route"), "path", None)
+    if path:
+        return path
+    if str(scope.get("path") or "").startswith("/static/"):
+        return "/static"
+    return "unmatched"
+
+
+def set_current_user(user_id: str) -> None:
+    recorder = _recorder.get()
+    if recorder is not None:
+        recorder.user_id = user_id
+
+
+def current_request_labels() -> Tuple[Optional[str], Optional[str]]:
+    """``(user_id, route template)`` of the request being served, ``None`` outside a request."""
+    recorder = _recorder.get()
+    if recorder is None:
+        return None, None
+    return recorder.user_id, route_from_scope(recorder.scope)
+
+
+@contextmanager
+def span(name: str, detail: str = "") -> Iterator[None]:
+    """Time the enclosed block as ``name``; a nested span of the same name is folded into the outer one."""
+    recorder = _recorder.get()
+    active = _active_spans.get()
+    if recorder is None or name in active:
+        yield
+        return
+    token = _active_spans.set(active | {name})
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        recorder.add(name, detail, (time.perf_counter() - started) * 1000)
+        _active_spans.reset(token)
+
+
+def timed(name: str, detail: Optional[str] = None) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Decorator form of ``span`` for sync and async functions; ``detail`` defaults to the qualname."""
+
+    def decorate(func: Callable[..., Any]) -> Callable[..., Any]:
+        label = detail if detail is not None else func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with span(name, label):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with span(name, label):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def instrument_methods(name: str, exclude: Iterable[str] = ()) -> Callable[[type], type]:
+    """Class decorator wrapping every public method defined on the class in ``timed(name)``."""
+    skipped = set(exclude)
+
+    def decorate(cls: type) -> type:
+        for attr, value in list(vars(cls).items()):
+            if attr.startswith("_") or attr in skipped or not inspect.isfunction(value):
+                continue
+            setattr(cls, attr, timed(name, f"{cls.__name__}.{attr}")(value))
+        return cls
+
+    return decorate
+
+
+class LatencyHistogram:
+    """Cumulative-bucket latency histogram in milliseconds."""
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS_MS) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum_ms = 0.0
+
+    def observe(self, elapsed_ms: float) -> None:
+        self.counts[bisect_left(self.buckets, elapsed_ms)] += 1
+        self.count += 1
+        self.sum_ms += elapsed_ms
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the q-th observation; ``None`` past the last bucket."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                return float(self.buckets[index]) if index < len(self.buckets) else None
+        return None
+
+    def snapshot(self) -> Dict[str, Any]:
+        cumulative = 0
+        buckets = {}
+        for bound, bucket_count in zip(self.buckets, self.counts):
+            cumulative += bucket_count
+            buckets[str(bound)] = cumulative
+        buckets["+Inf"] = self.count
+        return {
+            "count": self.count,
+            "sum_ms": round(self.sum_ms, 1),
+            "p50_ms": self.quantile(0.5),
+            "p90_ms": self.quantile(0.9),
+            "p99_ms": self.quantile(0.99),
+            "buckets": buckets,
+        }
+
+
+class RouteHistograms:
+    """Request latency per ``(method, route template)``; unseen routes past the cap share one bucket."""
+
+    def __init__(self, max_routes: int = MAX_TRACKED_ROUTES) -> None:
+        self.max_routes = max_routes
+        self._histograms: Dict[Tuple[str, str], LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, method: str, route: str, elapsed_ms: float) -> None:
+        key = (method, route)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                if len(self._histograms) >= self.max_routes:
+                    key = (method, "other")
+                    histogram = self._histograms.get(key)
+                if histogram is None:
+                    histogram = self._histograms[key] = LatencyHistogram()
+            histogram.observe(elapsed_ms)
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            items = [(key, histogram.snapshot()) for key, histogram in self._histograms.items()]
+        return [{"method": method, "route": route, **stats} for (method, route), stats in sorted(items)]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+
+
+route_histograms = RouteHistograms()
@@ -1,11 +1,11 @@
-from langchain_groq import ChatGroq
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import PydanticOutputParser
 from src.env_utils import normalize_secret
+from src.metrics import track_llm_call
 from src.models import PitchDeckData, InvestmentMemo, ExecutiveSummary
 
 class MemoGenerator:
     def __init__(self, api_key: str, model_name: str = "openai/gpt-oss-20b"):
+        from langchain_groq import ChatGroq
+
         cleaned_api_key = normalize_secret(api_key)
         self.llm = ChatGroq(
             temperature=0.3, # Slightly creative for writing but still grounded
@@ -17,6 +17,9 @@ class MemoGenerator:
         """
         Generates a professional Investment Memo based on the extracted data.
         """
+        from langchain_core.output_parsers import PydanticOutputParser
+        from langchain_core.prompts import ChatPromptTemplate
+
         parser = PydanticOutputParser(pydantic_object=InvestmentMemo)
         
         system_prompt = """You are a professional VC Partner writing an internal investment memo.
@@ -41,15 +44,19 @@ Constraint: Do NOT generate repetitive lists. Keep it concise."""
 
         chain = prompt | self.llm | parser
         
-        return chain.invoke({
-            "data": data.model_dump_json(),
-            "format_instructions": parser.get_format_instructions()
-        })
+        with track_llm_call("memo") as llm_config:
+            return chain.invoke({
+                "data": data.model_dump_json(),
+                "format_instructions": parser.get_format_instructions()
+            }, config=llm_config)
 
     def generate_executive_summary(self, data: PitchDeckData, memo: InvestmentMemo) -> ExecutiveSummary:
         """
         Generates a concise Executive Summary (30-second read).
         """
+        from langchain_core.output_parsers import PydanticOutputParser
+        from langchain_core.prompts import ChatPromptTemplate
+
         parser = PydanticOutputParser(pydantic_object=ExecutiveSummary)
         
         system_prompt = """You are a VC Associate summarizing a deal for a General Partner.
@@ -68,8 +75,9 @@ Avoid fluff."""
 
         chain = prompt | self.llm | parser
         
-        return chain.invoke({
-            "data": data.model_dump_json(),
-            "memo": memo.model_dump_json(),
-            "format_instructions": parser.get_format_instructions()
-        })
+        with track_llm_call("memo.summary") as llm_config:
+            return chain.invoke({
+                "data": data.model_dump_json(),
+                "memo": memo.model_dump_json(),
+                "format_instructions": parser.get_format_instructions()
+            }, config=llm_config)
@@ -0,0 +1,367 @@
+"""In-process Prometheus metrics rendered in the text exposition format at ``/metrics``.
+
+Counters, gauges and histograms live in memory on the worker that serves the scrape, so no
+exporter or push gateway is needed; each worker process reports its own series.
+"""
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from src.instrumentation import current_request_labels, route_histograms, span
+from src.services.llm_usage_service import get_llm_usage_ledger
+from src.token_utils import count_tokens
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+DURATION_BUCKETS_SECONDS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+MAX_SERIES_PER_METRIC = 1000
+OVERFLOW_LABEL = "other"
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(pairs: Sequence[Tuple[str, Any]]) -> str:
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _number(value: float) -> str:
+    if value == int(value):
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._series: Dict[Tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> Tuple[str, ...]:
+        key = tuple(str(labels.get(name, "")) for name in self.labelnames)
+        if key not in self._series and len(self._series) >= MAX_SERIES_PER_METRIC:
+            return tuple(OVERFLOW_LABEL for _name in self.labelnames)
+        return key
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels: Any) -> None:
+        with self._lock:
+            key = self._key(labels)
+            self._series[key] = self._series.get(key, 0) + amount
+
+    def value(self, **labels: Any) -> float:
+        with self._lock:
+            return self._series.get(tuple(str(labels.get(name, "")) for name in self.labelnames), 0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            series = sorted(self._series.items())
+        return self.header() + [
+            f"{self.name}{_labels(list(zip(self.labelnames, key)))} {_number(value)}" for key, value in series
+        ]
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, amount: float = 1, **labels: Any) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: Any) -> None:
+        with self._lock:
+            self._series[self._key(labels)] = value
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DURATION_BUCKETS_SECONDS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value: float, **labels: Any) -> None:
+        with self._lock:
+            key = self._key(labels)
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = {"buckets": [0] * len(self.buckets), "count": 0, "sum": 0.0}
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series["buckets"][index] += 1
+            series["count"] += 1
+            series["sum"] += value
+
+    def render(self) -> List[str]:
+        with self._lock:
+            series = sorted((key, dict(value, buckets=list(value["buckets"]))) for key, value in self._series.items())
+        lines = self.header()
+        for key, value in series:
+            pairs = list(zip(self.labelnames, key))
+            for bound, count in zip(self.buckets, value["buckets"]):
+                lines.append(f"{self.name}_bucket{_labels(pairs + [('le', _number(bound))])} {count}")
+            lines.append(f"{self.name}_bucket{_labels(pairs + [('le', '+Inf')])} {value['count']}")
+            lines.append(f"{self.name}_sum{_labels(pairs)} {_number(round(value['sum'], 6))}")
+            lines.append(f"{self.name}_count{_labels(pairs)} {value['count']}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: List[_Metric] = []
+        self._collectors: List[Callable[[], List[str]]] = []
+
+    def register(self, metric: _Metric) -> Any:
+        self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector: Callable[[], List[str]]) -> None:
+        """Register a callable returning ready-made exposition lines, rendered after the metrics."""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        for collector in self._collectors:
+            lines.extend(collector())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+requests_total = registry.register(
+    Counter("hatchup_http_requests_total", "HTTP requests served, by route template and status.", ("method", "route", "status"))
+)
+requests_in_flight = registry.register(Gauge("hatchup_http_requests_in_flight", "HTTP requests currently being served."))
+cache_events = registry.register(
+    Counter("hatchup_cache_events_total", "In-process cache lookups and evictions.", ("cache", "event"))
+)
+llm_calls = registry.register(
+    Counter(
+        "hatchup_llm_calls_total",
+        "LLM calls by call site and outcome (ok, error, timeout, rate_limited, parse_error).",
+        ("site", "outcome"),
+    )
+)
+llm_in_flight = registry.register(Gauge("hatchup_llm_calls_in_flight", "LLM calls currently waiting on the provider.", ("site",)))
+llm_duration = registry.register(
+    Histogram("hatchup_llm_call_duration_seconds", "LLM call latency by call site.", ("site",))
+)
+llm_tokens = registry.register(
+    Counter("hatchup_llm_tokens_total", "Tokens reported by the LLM provider, by call site and direction.", ("site", "kind"))
+)
+mcp_tool_calls = registry.register(
+    Counter("hatchup_mcp_tool_calls_total", "MCP tool calls by server, tool and outcome.", ("server", "tool", "outcome"))
+)
+mcp_tool_duration = registry.register(
+    Histogram("hatchup_mcp_tool_duration_seconds", "MCP tool call latency by server.", ("server",))
+)
+provider_requests = registry.register(
+    Counter(
+        "hatchup_provider_requests_total",
+        "Outbound provider requests by outcome (ok, error, timeout, rate_limited).",
+        ("provider", "outcome"),
+    )
+)
+
+
+def _route_latency_lines() -> List[str]:
+    name = "hatchup_http_request_duration_seconds"
+    lines = [f"# HELP {name} HTTP request latency by route template.", f"# TYPE {name} histogram"]
+    for entry in route_histograms.snapshot():
+        pairs = [("method", entry["method"]), ("route", entry["route"])]
+        for bound, count in entry["buckets"].items():
+            le = bound if bound == "+Inf" else _number(float(bound) / 1000)
+            lines.append(f"{name}_bucket{_labels(pairs + [('le', le)])} {count}")
+        lines.append(f"{name}_sum{_labels(pairs)} {_number(round(entry['sum_ms'] / 1000, 6))}")
+        lines.append(f"{name}_count{_labels(pairs)} {entry['count']}")
+    return lines
+
+
+registry.add_collector(_route_latency_lines)
+
+
+def render_metrics() -> str:
+    return registry.render()
+
+
+def error_outcome(exc: BaseException) -> str:
+    """Classify a provider failure as ``rate_limited``, ``timeout`` or ``error``."""
+    status = getattr(exc, "status_code", None) or getattr(getattr(exc, "response", None), "status_code", None)
+    if status == 429:
+        return "rate_limited"
+    if isinstance(exc, TimeoutError) or "timeout" in exc.__class__.__name__.lower():
+        return "timeout"
+    return "error"
+
+
+def record_provider_outcome(provider: str, outcome: str) -> None:
+    provider_requests.inc(provider=provider, outcome=outcome)
+
+
+@contextmanager
+def provider_call(provider: str) -> Iterator[None]:
+    """Count one outbound provider request by outcome; exceptions are classified and re-raised."""
+    try:
+        yield
+    except Exception as exc:
+        record_provider_outcome(provider, error_outcome(exc))
+        raise
+    record_provider_outcome(provider, "ok")
+
+
+def _message_text(message: Any) -> str:
+    content = getattr(message, "content", message)
+    if isinstance(content, list):
+        return " ".join(str(part.get("text", "")) if isinstance(part, dict) else str(part) for part in content)
+    return str(content or "")
+
+
+def _usage_from_result(result: Any) -> Tuple[int, int]:
+    input_tokens = output_tokens = 0
+    for generations in getattr(result, "generations", None) or []:
+        for generation in generations:
+            usage = getattr(getattr(generation, "message", None), "usage_metadata", None) or {}
+            input_tokens += int(usage.get("input_tokens") or 0)
+            output_tokens += int(usage.get("output_tokens") or 0)
+    if not (input_tokens or output_tokens):
+        usage = (getattr(result, "llm_output", None) or {}).get("token_usage") or {}
+        input_tokens = int(usage.get("prompt_tokens") or 0)
+        output_tokens = int(usage.get("completion_tokens") or 0)
+    return input_tokens, output_tokens
+
+
+@lru_cache(maxsize=1)
+def _usage_handler_class() -> type:
+    from langchain_core.callbacks import BaseCallbackHandler
+
+    class LLMUsageHandler(BaseCallbackHandler):
+        """Count provider-reported tokens and charge them to the current user, route and model.
+
+        When the provider reports no usage the call is charged from tiktoken estimates of the
+        prompt and completion text instead, and flagged as estimated in the ledger. The provider
+        outcome is recorded here, from the model's own end/error callbacks, so failures in output
+        parsing after a good response are not counted against the provider.
+        """
+
+        run_inline = True
+
+        def __init__(self, site: str, provider: str) -> None:
+            self.site = site
+            self.provider = provider
+            self.model: Optional[str] = None
+            self.prompt_text = ""
+            self.in_flight = 0
+            self.provider_outcome: Optional[str] = None
+
+        def _finish(self, outcome: str) -> None:
+            self.in_flight = max(0, self.in_flight - 1)
+            self.provider_outcome = outcome
+            record_provider_outcome(self.provider, outcome)
+
+        def _remember_model(self, serialized: Optional[Dict[str, Any]], kwargs: Dict[str, Any]) -> None:
+            params = kwargs.get("invocation_params") or {}
+            self.model = (
+                (kwargs.get("metadata") or {}).get("ls_model_name")
+                or params.get("model_name")
+                or params.get("model")
+                or ((serialized or {}).get("kwargs") or {}).get("model_name")
+            )
+
+        def on_chat_model_start(self, serialized: Dict[str, Any], messages: List[List[Any]], **kwargs: Any) -> None:
+            self.in_flight += 1
+            self._remember_model(serialized, kwargs)
+            self.prompt_text = "\n".join(_message_text(message) for batch in messages for message in batch)
+
+        def on_llm_start(self, serialized: Dict[str, Any], prompts: List[str], **kwargs: Any) -> None:
+            self.in_flight += 1
+            self._remember_model(serialized, kwargs)
+            self.prompt_text = "\n".join(prompts)
+
+        def on_llm_error(self, error: BaseException, **kwargs: Any) -> None:
+            self._finish(error_outcome(error))
+
+        def on_llm_end(self, response: Any, **kwargs: Any) -> None:
+            self._finish("ok")
+            input_tokens, output_tokens = _usage_from_result(response)
+            estimated = not (input_tokens or output_tokens)
+            if estimated:
+                completion = "".join(
+                    getattr(generation, "text", "") or "" for generations in response.generations for generation in generations
+                )
+                input_tokens, output_tokens = count_tokens(self.prompt_text), count_tokens(completion)
+            else:
+                llm_tokens.inc(input_tokens, site=self.site, kind="input")
+                llm_tokens.inc(output_tokens, site=self.site, kind="output")
+            user_id, route = current_request_labels()
+            model = self.model or (getattr(response, "llm_output", None) or {}).get("model_name")
+            get_llm_usage_ledger().record(
+                user_id=user_id,
+                route=route,
+                model=model,
+                site=self.site,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                estimated=estimated,
+            )
+
+    return LLMUsageHandler
+
+
+@contextmanager
+def track_llm_call(site: str, provider: str = "groq") -> Iterator[Dict[str, Any]]:
+    """Time, count and span one LLM call; pass the yielded dict as ``config=`` so usage and outcome are recorded.
+
+    Provider outcomes come from the callback handler. An exception raised after the provider
+    answered (typically an ``OutputParserException``) counts as ``parse_error`` for the call site
+    only; one that interrupts a request still in flight, such as a deadline, is charged to the provider.
+    """
+    llm_in_flight.inc(site=site)
+    started = time.perf_counter()
+    outcome = "ok"
+    handler = _usage_handler_class()(site, provider)
+    try:
+        with span("llm", site):
+            yield {"callbacks": [handler]}
+    except Exception as exc:
+        if handler.in_flight:
+            outcome = error_outcome(exc)
+            record_provider_outcome(provider, outcome)
+        elif handler.provider_outcome == "ok":
+            outcome = "parse_error"
+        else:
+            outcome = handler.provider_outcome or error_outcome(exc)
+        raise
+    finally:
+        llm_in_flight.dec(site=site)
+        llm_duration.observe(time.perf_counter() - started, site=site)
+        llm_calls.inc(site=site, outcome=outcome)
+
+
+def record_mcp_call(server: str, tool: str, outcome: str, elapsed_seconds: Optional[float] = None) -> None:
+    mcp_tool_calls.inc(server=server, tool=tool, outcome=outcome)
+    if elapsed_seconds is not None:
+        mcp_tool_duration.observe(elapsed_seconds, server=server)
@@ -1,6 +1,6 @@
 
 from pydantic import BaseModel, Field
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 class SectionAnalysis(BaseModel):
     content: str = Field(description="extracted content for this section")
@@ -145,6 +145,7 @@ class RevenueWedgeInputRecord(BaseModel):
     excerpt: str
     created_at: str
     updated_at: str
+    text_stats: Optional[Dict[str, Any]] = None
 
 
 class RevenueWedgeRunRecord(BaseModel):
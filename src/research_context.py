@@ -0,0 +1,125 @@
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.token_utils import count_tokens
+
+RESEARCH_CONTEXT_TOKEN_BUDGET = 1800
+RESEARCH_CONTEXT_CACHE_SIZE = 256
+FIELD_CHAR_LIMITS = (900, 600, 400, 250, 150)
+
+DECK_FIELD_LABELS = (
+    ("startup_name", "Startup"),
+    ("problem", "Problem"),
+    ("solution", "Solution"),
+    ("product", "Product"),
+    ("market_tam", "Market / TAM"),
+    ("business_model", "Business model"),
+    ("traction_metrics", "Traction"),
+    ("team", "Team"),
+    ("competitive_landscape", "Competition"),
+    ("funding_ask_stage", "Funding ask / stage"),
+    ("missing_sections", "Missing sections"),
+    ("weak_signals", "Weak signals"),
+    ("red_flags", "Red flags"),
+)
+
+MEMO_FIELD_LABELS = (
+    ("company_overview", "Company overview"),
+    ("problem_solution_clarity", "Problem / solution clarity"),
+    ("market_opportunity", "Market opportunity"),
+    ("product_differentiation", "Product differentiation"),
+    ("traction_metrics_analysis", "Traction analysis"),
+    ("team_assessment", "Team assessment"),
+    ("risks_concerns", "Risks"),
+    ("open_questions", "Open questions"),
+    ("neutral_assessment", "Assessment"),
+)
+
+
+def _compact_value(value: Any, limit: int) -> str:
+    if isinstance(value, (list, tuple)):
+        text = "; ".join(_compact_value(item, limit) for item in value if item not in (None, ""))
+    elif isinstance(value, dict):
+        text = "; ".join(f"{key}: {_compact_value(item, limit)}" for key, item in value.items() if item not in (None, ""))
+    else:
+        text = str(value or "")
+    text = re.sub(r"\s+", " ", text).strip()
+    if len(text) > limit:
+        return text[:limit].rstrip() + " ..."
+    return text
+
+
+def _render_section(title: str, payload: Dict[str, Any], labels: Tuple[Tuple[str, str], ...], limit: int) -> List[str]:
+    lines = [f"*** {title} ***"]
+    known_keys = {key for key, _label in labels}
+    for key, label in labels:
+        value = _compact_value(payload.get(key), limit)
+        if value:
+            lines.append(f"{label}: {value}")
+    for key, raw_value in payload.items():
+        if key in known_keys:
+            continue
+        value = _compact_value(raw_value, limit)
+        if value:
+            lines.append(f"{key}: {value}")
+    return lines
+
+
+def build_research_context(
+    deck: Optional[Dict[str, Any]],
+    memo: Optional[Dict[str, Any]] = None,
+    token_budget: int = RESEARCH_CONTEXT_TOKEN_BUDGET,
+) -> str:
+    """Render deck and memo as compact labelled lines that fit within ``token_budget``."""
+    deck = deck if isinstance(deck, dict) else {}
+    memo = memo if isinstance(memo, dict) else {}
+    text = ""
+    for limit in FIELD_CHAR_LIMITS:
+        lines = _render_section("STARTUP ANALYZED DATA", deck, DECK_FIELD_LABELS, limit)
+        if memo:
+            lines.append("")
+            lines.extend(_render_section("INVESTMENT MEMO", memo, MEMO_FIELD_LABELS, limit))
+        text = "\n".join(lines)
+        if count_tokens(text) <= token_budget:
+            return text
+    # Even the tightest field limit overflows: hard-trim to the budget.
+    while text and count_tokens(text) > token_budget:
+        text = text[: int(len(text) * 0.9)].rstrip()
+    return text + " ... [TRUNCATED]"
+
+
+class ResearchContextCache:
+    """Bounded LRU of built research contexts keyed by ``analysis_id`` and ``updated_at``."""
+
+    def __init__(self, max_entries: int = RESEARCH_CONTEXT_CACHE_SIZE) -> None:
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[str, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, analysis_id: str, updated_at: Optional[str]) -> Optional[str]:
+        if not analysis_id:
+            return None
+        with self._lock:
+            entry = self._entries.get(analysis_id)
+            if not entry or entry[0] != str(updated_at or ""):
+                return None
+            self._entries.move_to_end(analysis_id)
+            return entry[1]
+
+    def set(self, analysis_id: str, updated_at: Optional[str], context: str) -> None:
+        if not analysis_id:
+            return
+        with self._lock:
+            self._entries[analysis_id] = (str(updated_at or ""), context)
+            self._entries.move_to_end(analysis_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, analysis_id: str) -> None:
+        with self._lock:
+            self._entries.pop(analysis_id, None)
+
+
+research_context_cache = ResearchContextCache()
@@ -1,16 +1,23 @@
+import asyncio
+import contextvars
+import hashlib
 import json
 import os
 import re
-from collections import defaultdict
-from typing import Any, Dict, List, Optional
-
-from langchain_core.output_parsers import PydanticOutputParser
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_groq import ChatGroq
-
+import threading
+import time
+from bisect import bisect_right
+from collections import OrderedDict, defaultdict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+from src.metrics import track_llm_call
+from src.token_utils import count_tokens, split_to_token_chunks
 from src.models import (
     RevenueCluster,
-    RevenueEvidenceItem,
     RevenueSignalExtraction,
     RevenueWedgeDecisionBrief,
     RevenueWedgeInputRecord,
@@ -80,6 +87,63 @@ RAW_LABEL_PATTERNS = (
 
 PRODUCT_NAME = "HatchUp"
 
+# Bump when EXTRACTION_SYSTEM_PROMPT or the extraction schema changes so cached observations are re-extracted.
+EXTRACTION_PROMPT_VERSION = "2"
+EXTRACTION_CACHE_SIZE = 1024
+# Map-reduce extraction: inputs are split into chunks, packed into batches and extracted concurrently.
+EXTRACTION_CHUNK_TOKENS = 1500
+EXTRACTION_BATCH_TOKENS = 4500
+EXTRACTION_MAX_WORKERS = 4
+# Per-run ceiling on LLM extraction: one concurrent wave of full batches, so run latency stays at about
+# one call however large the workspace is. Chunks past it are read with the fallback heuristics and
+# reported in ``signal_quality["extraction_budget"]``.
+EXTRACTION_MAX_BATCHES = EXTRACTION_MAX_WORKERS
+EXTRACTION_RUN_TOKEN_BUDGET = EXTRACTION_BATCH_TOKENS * EXTRACTION_MAX_BATCHES
+EXTRACTION_SYSTEM_PROMPT = """You are Revenue Wedge Engine, a founder decision system.
+Extract only repeated commercial signals from startup inputs.
+
+Rules:
+- Emit observations only when the input contains direct evidence.
+- Every supporting_quote must be a short verbatim quote from the inputs.
+- If a claim has no quote, do not emit it.
+- Categories allowed: segment, pain, objection, trigger, blocker, feature_request, urgency, language, stage.
+- Prefer labels that are concrete and operational, not generic strategy language.
+- Stage must be one of: awareness, discovery, evaluation, proposal, decision, onboarding, renewal, unknown.
+- impact_direction must be positive, negative, or neutral.
+- Prioritize signals tied to buyer outcomes, especially patterns in won deals and then lost deals.
+- Treat objections like trust, hesitation, and risk as symptoms unless the quote clearly states the deeper operational problem.
+- When you see evidence that buyers understood value, output, ICP fit, or decision speed in a won deal, preserve that signal.
+- Ignore compliments, generic advice, and broad startup platitudes.
+Return valid JSON matching the schema."""
+
+DECISION_SYSTEM_PROMPT = """You are HatchUp's Revenue Wedge Engine.
+You are not a brainstorming assistant. You are forcing one decision for the next 7 days.
+
+Hard rules:
+- Output exactly one ICP, one core problem, and one decision.
+- Every claim must be supported by the evidence bank. If you cannot support a claim, omit it.
+- Every evidence.quote must be verbatim from the evidence bank.
+- Interpret raw labels into natural operator language before writing.
+- Weight won-deal patterns at 3.0, lost-deal patterns at 1.5, and neutral evidence at 1.0.
+- Use patterns from won deals as the primary signal for ICP, pain, and decision speed.
+- Treat objections like trust, hesitation, and risk as symptoms, then name the deeper root problem.
+- If recent runs show no improvement for two consecutive runs, enter exploration mode.
+- In exploration mode, keep the ICP stable unless it is clearly wrong, generate 2-3 alternative root-cause hypotheses from the evidence, and choose exactly one new hypothesis to test this week.
+- Do not repeat the same core problem more than two runs in a row without measurable improvement.
+- Never expose internal labels, extraction tokens, or awkward shorthand in the final answer.
+- Use at most two short quotes for evidence, and never reuse raw quotes as landing page or outbound copy.
+- Keep the core brief product-neutral. Do not mention HatchUp in the decision, why, execution plan, evidence, or assets.
+- If you include product guidance, put it only in the optional how_to_use_hatchup field and keep it to 2-3 short lines.
+- Do not use generic startup language such as \"improve landing page\", \"increase engagement\", or \"optimize funnel\".
+- Write exact execution instructions and exact copy. No placeholders. No multiple options.
+- Resolve contradictions explicitly and explain why one signal won.
+- Before finalizing, check whether the core problem explains both the won-deal pattern and the lost-deal pattern. If not, rewrite it.
+- Make the run feel evolutionary. Clearly state the previous hypothesis, the lack of improvement, the new hypothesis, and that this week is a test when exploration mode is active.
+- If the copy does not sound like something a real founder would ship this week, rewrite it.
+- If your output can apply to any startup, it is wrong. Rewrite it.
+- confidence_score must be 0-100.
+Return valid JSON matching the schema."""
+
 CATEGORY_KEYWORDS = {
     "segment": ["founder", "operator", "ops", "finance", "sales", "agency", "smb", "startup", "revops", "team"],
     "pain": ["manual", "slow", "waste", "stuck", "messy", "unclear", "broken", "delay", "late", "hard"],
@@ -91,6 +155,79 @@ CATEGORY_KEYWORDS = {
     "language": ["said", "called", "described", "worded", "phrased"],
 }
 
+def _trie_pattern(words: List[str]) -> str:
+    """Regex alternation shaped as a trie so shared prefixes are tested once; greedy, so longest wins."""
+    trie: Dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = True
+
+    def build(node: Dict[str, Any]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+class CategoryKeywordMatcher:
+    """Find, per category, the first listed keyword that occurs in each sentence.
+
+    Equivalent to ``next(k for k in keywords if k in sentence.lower())`` for every category, but
+    the whole input is scanned by one compiled trie regex. Each search resumes one character after
+    the previous match start so overlapping keywords are still seen; keywords that are prefixes of
+    the longest match at a position also occur there and are added from a precomputed table.
+    """
+
+    def __init__(self, category_keywords: Dict[str, List[str]]) -> None:
+        keywords = sorted({keyword for values in category_keywords.values() for keyword in values})
+        self._pattern = re.compile(_trie_pattern(keywords))
+        ranks: Dict[str, List[Tuple[str, int]]] = defaultdict(list)
+        for category, values in category_keywords.items():
+            for rank, keyword in enumerate(values):
+                if all(existing != category for existing, _rank in ranks[keyword]):
+                    ranks[keyword].append((category, rank))
+        # Every (category, rank, keyword) implied by a match: the match itself plus its keyword prefixes.
+        self._hits = {
+            keyword: tuple(
+                (category, rank, other)
+                for other in keywords
+                if keyword.startswith(other)
+                for category, rank in ranks[other]
+            )
+            for keyword in keywords
+        }
+
+    def match_sentences(self, sentences: List[str]) -> List[Dict[str, str]]:
+        """Return ``{category: keyword}`` for each sentence from a single scan of the joined text."""
+        # Offsets come from the lowered text that is actually scanned: ``lower()`` can change a
+        # string's length (``"İ"`` becomes two code points).
+        lowered = [sentence.lower() for sentence in sentences]
+        offsets = []
+        position = 0
+        for sentence in lowered:
+            offsets.append(position)
+            position += len(sentence) + 1
+        joined = "\n".join(lowered)
+        best: List[Dict[str, Tuple[int, str]]] = [{} for _sentence in sentences]
+        search = self._pattern.search
+        match = search(joined)
+        while match:
+            hits = best[bisect_right(offsets, match.start()) - 1]
+            for category, rank, keyword in self._hits[match.group(0)]:
+                current = hits.get(category)
+                if current is None or rank < current[0]:
+                    hits[category] = (rank, keyword)
+            match = search(joined, match.start() + 1)
+        return [{category: keyword for category, (_rank, keyword) in hits.items()} for hits in best]
+
+
+CATEGORY_MATCHER = CategoryKeywordMatcher(CATEGORY_KEYWORDS)
+
 ALLOWED_HYPOTHESES = (
     "ICP too broad",
     "messaging unclear",
@@ -101,12 +238,148 @@ ALLOWED_HYPOTHESES = (
 )
 
 
+TEXT_STATS_VERSION = 1
+# Per-input unique tokens kept for corpus-wide counts; exact while the corpus has at most this many.
+UNIQUE_TOKEN_SAMPLE = 32
+NORMALIZATION_CACHE_SIZE = 4096
+SENTENCE_CACHE_SIZE = 128
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[\.\!\?\n])\s+")
+_WORD_RE = re.compile(r"[a-zA-Z0-9']+")
+_ALPHA_TOKEN_RE = re.compile(r"[a-zA-Z]{3,}")
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_SEGMENT_KEYWORDS = frozenset({"revops", "ops", "finance", "sales", "agency", "smb", "startup", "founder", "team"})
+_SEGMENT_LABEL_RES = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"(revenue operations managers?)",
+        r"(revops teams?)",
+        r"(finance teams?)",
+        r"(sales teams?)",
+        r"(operators?)",
+        r"(agencies?)",
+        r"(smb teams?)",
+        r"(startup founders?)",
+        r"(founders?)",
+    )
+)
+_PAIN_LABEL_RES = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"too ([a-z0-9-]+(?: [a-z0-9-]+){0,3})",
+        r"still needs ([a-z0-9-]+(?: [a-z0-9-]+){0,3})",
+        r"cannot ([a-z0-9-]+(?: [a-z0-9-]+){0,5})",
+        r"can't ([a-z0-9-]+(?: [a-z0-9-]+){0,5})",
+        r"did not trust ([a-z0-9-]+(?: [a-z0-9-]+){0,3})",
+    )
+)
+_CLAUSE_SPLIT_RE = re.compile(r"\b(and|or|before|after|because|but)\b")
+_SPACE_BEFORE_PUNCT_RE = re.compile(r"\s+([,.;:!?])")
+_REPEATED_PHRASE_RE = re.compile(r"\b(.+?)\s+\1\b", flags=re.IGNORECASE)
+_OPEN_PAREN_RE = re.compile(r"\s*\(\s*")
+_CLOSE_PAREN_RE = re.compile(r"\s*\)\s*")
+_DOUBLE_WITH_RE = re.compile(r"\bwith\s+with\b", flags=re.IGNORECASE)
+_DOUBLE_THAT_RE = re.compile(r"\bthat\s+that\b", flags=re.IGNORECASE)
+_FILLER_VERB_RE = re.compile(r"\b(improve|optimize|enhance|leverage|streamline)\b", flags=re.IGNORECASE)
+_PRODUCT_NAME_RE = re.compile(r"\bHatchUp\b", flags=re.IGNORECASE)
+
+# Pure string transforms that clustering, context building and rewriting call with the same
+# labels and quotes over and over; see ``normalization_cache_stats``.
+_NORMALIZATION_CACHES: Dict[str, Any] = {}
+
+
+def _memoized(maxsize: int = NORMALIZATION_CACHE_SIZE):
+    def decorator(func):
+        cached = lru_cache(maxsize=maxsize)(func)
+        _NORMALIZATION_CACHES[func.__name__] = cached
+        return cached
+
+    return decorator
+
+
+_CacheInfo = namedtuple("_CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class _DigestKeyedCache:
+    """LRU over a ``str -> value`` function keyed by the sha256 of the argument.
+
+    For helpers called with whole founder inputs, where ``lru_cache`` would keep every input text
+    alive as a key. Exposes ``cache_info``/``cache_clear`` like ``lru_cache``.
+    """
+
+    def __init__(self, func: Callable[[str], Any], maxsize: int) -> None:
+        self._func = func
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[bytes, Any]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, text: str) -> Any:
+        key = hashlib.sha256(text.encode("utf-8", "surrogatepass")).digest()
+        with self._lock:
+            if key in self._entries:
+                self._hits += 1
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            self._misses += 1
+        value = self._func(text)
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def cache_info(self) -> Any:
+        with self._lock:
+            return _CacheInfo(self._hits, self._misses, self.maxsize, len(self._entries))
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = 0
+
+
+def _digest_memoized(maxsize: int):
+    def decorator(func):
+        cached = _DigestKeyedCache(func, maxsize)
+        _NORMALIZATION_CACHES[func.__name__] = cached
+        return cached
+
+    return decorator
+
+
+def normalization_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Debug hook: per-helper call counts, hit rates and cache sizes."""
+    stats = {}
+    for name, cached in _NORMALIZATION_CACHES.items():
+        info = cached.cache_info()
+        calls = info.hits + info.misses
+        stats[name] = {
+            "calls": calls,
+            "hits": info.hits,
+            "hit_rate": round(info.hits / calls, 3) if calls else 0.0,
+            "size": info.currsize,
+            "max_size": info.maxsize,
+        }
+    return stats
+
+
+def clear_normalization_caches() -> None:
+    for cached in _NORMALIZATION_CACHES.values():
+        cached.cache_clear()
+
+
 def _normalize_text(value: str) -> str:
-    return re.sub(r"\s+", " ", str(value or "").strip())
+    return _WHITESPACE_RE.sub(" ", str(value or "").strip())
 
 
+@_memoized()
 def _slug(value: str) -> str:
-    return re.sub(r"[^a-z0-9]+", "-", _normalize_text(value).lower()).strip("-")
+    return _NON_ALNUM_RE.sub("-", _normalize_text(value).lower()).strip("-")
 
 
 def _clip(value: str, limit: int = 2200) -> str:
@@ -117,43 +390,31 @@ def _clip(value: str, limit: int = 2200) -> str:
 
 
 def _split_sentences(text: str) -> List[str]:
-    parts = re.split(r"(?<=[\.\!\?\n])\s+", text or "")
-    return [_normalize_text(part) for part in parts if _normalize_text(part)]
+    return list(_split_sentences_cached(text or ""))
+
+
+@_digest_memoized(SENTENCE_CACHE_SIZE)
+def _split_sentences_cached(text: str) -> Tuple[str, ...]:
+    normalized = (_normalize_text(part) for part in _SENTENCE_SPLIT_RE.split(text))
+    return tuple(part for part in normalized if part)
 
 
+@_memoized()
 def _extract_label(sentence: str, keyword: str) -> str:
     lowered = sentence.lower()
-    if keyword in {"revops", "ops", "finance", "sales", "agency", "smb", "startup", "founder", "team"}:
-        patterns = (
-            r"(revenue operations managers?)",
-            r"(revops teams?)",
-            r"(finance teams?)",
-            r"(sales teams?)",
-            r"(operators?)",
-            r"(agencies?)",
-            r"(smb teams?)",
-            r"(startup founders?)",
-            r"(founders?)",
-        )
-        for pattern in patterns:
-            match = re.search(pattern, lowered)
+    if keyword in _SEGMENT_KEYWORDS:
+        for pattern in _SEGMENT_LABEL_RES:
+            match = pattern.search(lowered)
             if match:
                 return match.group(1)
 
-    pain_patterns = (
-        r"too ([a-z0-9-]+(?: [a-z0-9-]+){0,3})",
-        r"still needs ([a-z0-9-]+(?: [a-z0-9-]+){0,3})",
-        r"cannot ([a-z0-9-]+(?: [a-z0-9-]+){0,5})",
-        r"can't ([a-z0-9-]+(?: [a-z0-9-]+){0,5})",
-        r"did not trust ([a-z0-9-]+(?: [a-z0-9-]+){0,3})",
-    )
-    for pattern in pain_patterns:
-        match = re.search(pattern, lowered)
+    for pattern in _PAIN_LABEL_RES:
+        match = pattern.search(lowered)
         if match:
-            phrase = re.split(r"\b(and|or|before|after|because|but)\b", match.group(1))[0]
+            phrase = _CLAUSE_SPLIT_RE.split(match.group(1))[0]
             return phrase.strip(" .,:;!?")
 
-    words = re.findall(r"[a-zA-Z0-9']+", sentence.lower())
+    words = _WORD_RE.findall(lowered)
     if not words:
         return keyword
     try:
@@ -194,7 +455,7 @@ def _classify_outcome(source_tag: str, quote: str) -> str:
 
 
 def _quote_to_phrase(quote: str, limit: int = 10) -> str:
-    words = re.findall(r"[A-Za-z0-9']+", quote or "")
+    words = _WORD_RE.findall(quote or "")
     return " ".join(words[:limit]).strip() or "the repeated complaint"
 
 
@@ -213,7 +474,7 @@ def _paraphrase_quote(quote: str) -> str:
         return "deals are slowing down because confidence breaks late in the buying cycle"
     if "slow" in lowered or "messy" in lowered:
         return "buyers describe the current workflow as too messy to trust"
-    words = re.findall(r"[A-Za-z0-9']+", lowered)
+    words = _WORD_RE.findall(lowered)
     return ("buyers describe " + " ".join(words[:8]).strip()) if words else "buyers describe the workflow as hard to trust"
 
 
@@ -270,9 +531,10 @@ def _sounds_like_raw_label(value: str) -> bool:
     return any(pattern in text for pattern in ("lost reason", "trust issue", "manual and", "revops teams: stop"))
 
 
+@_memoized()
 def _clean_copy(value: str) -> str:
-    text = _normalize_text(re.sub(r"\s+([,.;:!?])", r"\1", value or ""))
-    text = re.sub(r"\b(.+?)\s+\1\b", r"\1", text, flags=re.IGNORECASE)
+    text = _normalize_text(_SPACE_BEFORE_PUNCT_RE.sub(r"\1", value or ""))
+    text = _REPEATED_PHRASE_RE.sub(r"\1", text)
     words = text.split()
     deduped_words: List[str] = []
     for word in words:
@@ -283,7 +545,7 @@ def _clean_copy(value: str) -> str:
 
 
 def _strip_product_name(value: str) -> str:
-    return _clean_copy(re.sub(r"\bHatchUp\b", "", value or "", flags=re.IGNORECASE))
+    return _clean_copy(_PRODUCT_NAME_RE.sub("", value or ""))
 
 
 def _trigger_to_clause(trigger: str) -> str:
@@ -314,10 +576,12 @@ def _metric_change_label(current: str, previous: str, field_name: str) -> str:
     return f"{field_name} shifted from {previous or 'none'} to {current or 'none'}"
 
 
+@_memoized()
 def _normalize_problem_text(value: str) -> str:
-    return re.sub(r"[^a-z0-9]+", " ", (value or "").lower()).strip()
+    return _NON_ALNUM_RE.sub(" ", (value or "").lower()).strip()
 
 
+@_memoized()
 def _semantic_cluster_label(category: str, label: str, quote: str = "") -> str:
     combined = _normalize_problem_text(f"{label} {quote}")
     if category == "objection":
@@ -387,8 +651,40 @@ def _parse_structured_sections(raw_text: str) -> List[Dict[str, Any]]:
     return sections
 
 
+def compute_text_stats(raw_text: str, commercial_terms: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+    """Token and structure statistics for one founder input, computed once at ingest.
+
+    Stored on the input as ``text_stats`` and reused by ``_assess_signal_quality`` instead of
+    re-scanning every input on each run.
+    """
+    text = raw_text or ""
+    tokens = [token.lower() for token in _ALPHA_TOKEN_RE.findall(text)]
+    unique_tokens = set(tokens)
+    stats = {
+        "version": TEXT_STATS_VERSION,
+        "chars": len(text),
+        "normalized_chars": len(_normalize_text(text)),
+        "alpha_token_count": len(tokens),
+        "unique_token_count": len(unique_tokens),
+        "unique_token_sample": sorted(unique_tokens)[:UNIQUE_TOKEN_SAMPLE],
+        "structured_sections": [
+            {
+                "marker": section["marker"],
+                "mapped_source": section["mapped_source"],
+                "field_count": section["field_count"],
+                "empty": section["empty"],
+            }
+            for section in _parse_structured_sections(text)
+        ],
+    }
+    if commercial_terms is not None:
+        terms = commercial_terms if isinstance(commercial_terms, (set, frozenset)) else set(commercial_terms)
+        stats["commercial_hits"] = sum(1 for token in tokens if token in terms)
+    return stats
+
+
 def _has_repeated_tokens(value: str, window: int = 4) -> bool:
-    tokens = re.findall(r"[a-z0-9]+", (value or "").lower())
+    tokens = _TOKEN_RE.findall((value or "").lower())
     if len(tokens) < 2:
         return False
     for index in range(1, len(tokens)):
@@ -401,6 +697,7 @@ def _has_repeated_tokens(value: str, window: int = 4) -> bool:
     return False
 
 
+@_memoized()
 def _dedupe_repeated_phrases(value: str) -> str:
     text = _clean_copy(value)
     tokens = text.split()
@@ -426,16 +723,17 @@ def _dedupe_repeated_phrases(value: str) -> str:
     return _clean_copy(" ".join(rebuilt))
 
 
+@_memoized()
 def _normalize_icp_text(value: str, max_words: int = 18) -> str:
     text = _dedupe_repeated_phrases(value)
-    text = re.sub(r"\s*\(\s*", " (", text)
-    text = re.sub(r"\s*\)\s*", ") ", text)
+    text = _OPEN_PAREN_RE.sub(" (", text)
+    text = _CLOSE_PAREN_RE.sub(") ", text)
     text = _clean_copy(text)
     words = text.split()
     if len(words) > max_words:
         text = " ".join(words[:max_words]).rstrip(",.;:") 
-    text = re.sub(r"\bwith\s+with\b", "with", text, flags=re.IGNORECASE)
-    text = re.sub(r"\bthat\s+that\b", "that", text, flags=re.IGNORECASE)
+    text = _DOUBLE_WITH_RE.sub("with", text)
+    text = _DOUBLE_THAT_RE.sub("that", text)
     text = _clean_copy(text)
     if _has_repeated_tokens(text):
         compressed: List[str] = []
@@ -463,8 +761,8 @@ def _limit_words(value: str, max_words: int) -> str:
 
 def _founder_line(value: str, max_words: int = 12) -> str:
     text = _dedupe_repeated_phrases(value)
-    text = re.sub(r"\b(improve|optimize|enhance|leverage|streamline)\b", "", text, flags=re.IGNORECASE)
-    text = re.sub(r"\s+", " ", text).strip(" -,.")
+    text = _FILLER_VERB_RE.sub("", text)
+    text = _WHITESPACE_RE.sub(" ", text).strip(" -,.")
     return _limit_words(text, max_words)
 
 
@@ -479,12 +777,89 @@ def _asset_copy_is_usable(value: str) -> bool:
     return not _has_repeated_tokens(text)
 
 
+def extraction_cache_key(scope: str, input_id: str, raw_text: str, tag: str, model_name: str) -> str:
+    """Key for one input's extraction, scoped to its workspace and ``input_id``.
+
+    Identical text in another workspace, or in another input of the same workspace, gets its own
+    entry, so evidence is never credited to an input it was not extracted from.
+    """
+    payload = "\x1f".join([EXTRACTION_PROMPT_VERSION, model_name or "", scope or "", input_id or "", tag or "", raw_text or ""])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _empty_extraction_budget() -> Dict[str, Any]:
+    return {"llm_batches": 0, "overflow_chunks": 0, "overflow_tokens": 0, "overflow_input_ids": []}
+
+
+# Attribution is re-stamped from the current input on every cache hit rather than stored.
+_UNCACHED_OBSERVATION_FIELDS = ("input_id", "source_tag")
+
+
+class ExtractionCache:
+    """Bounded LRU of per-input LLM extractions keyed by ``extraction_cache_key``.
+
+    Entries hold only ``key``, ``prompt_version`` and unattributed ``observations``; synthesis
+    notes are rebuilt on every run because the prompt that produced them named the input.
+    """
+
+    def __init__(self, max_entries: int = EXTRACTION_CACHE_SIZE) -> None:
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+extraction_cache = ExtractionCache()
+
+
+class StageTimer:
+    """Wall time per engine stage (extract, cluster, context, quality, brief, validate).
+
+    ``hook(stage, elapsed_ms)`` is called as each stage finishes; totals accumulate in ``timings``.
+    """
+
+    def __init__(self, hook: Optional[Callable[[str, float], Any]] = None) -> None:
+        self.hook = hook
+        self.timings: Dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self.timings[name] = self.timings.get(name, 0.0) + elapsed_ms
+            if self.hook is not None:
+                self.hook(name, elapsed_ms)
+
+
 class RevenueWedgeEngine:
     def __init__(self, api_key: Optional[str], model_name: str = "openai/gpt-oss-20b") -> None:
         self.api_key = (api_key or os.environ.get("GROQ_API_KEY") or "").strip()
         self.model_name = model_name
         self.llm = None
         if self.api_key:
+            from langchain_groq import ChatGroq
+
             self.llm = ChatGroq(
                 temperature=0,
                 model_name=model_name,
@@ -497,54 +872,171 @@ class RevenueWedgeEngine:
         previous_run: Optional[Dict[str, Any]] = None,
         run_history: Optional[List[Dict[str, Any]]] = None,
         learned_patterns: Optional[Dict[str, Any]] = None,
+        profile: Optional[Callable[[str, float], Any]] = None,
+        signal_caches: Optional[Dict[str, Dict[str, Any]]] = None,
+        cache_scope: str = "",
+    ) -> Dict[str, Any]:
+        """Run the full pipeline. ``profile(stage, elapsed_ms)`` is called as each stage finishes.
+
+        ``signal_caches`` maps ``input_id`` to the extraction persisted for that input, if any.
+        ``cache_scope`` (the workspace id) keeps cached extractions from crossing workspaces.
+        """
+        timer = StageTimer(profile)
+        normalized_inputs = self._prepare_inputs(inputs, signal_caches, cache_scope)
+        with timer.stage("extract"):
+            extraction, extraction_source, input_extractions, extraction_budget = self._extract_signals(normalized_inputs, cache_scope)
+        analysis = self._analyze_signals(
+            normalized_inputs, extraction, extraction_source, previous_run, run_history or [], learned_patterns or {}, timer, extraction_budget
+        )
+        if analysis["quality"]["insufficient_signal"]:
+            return self._insufficient_result(analysis, extraction, extraction_source, input_extractions, previous_run, run_history or [], learned_patterns or {})
+        with timer.stage("brief"):
+            draft = self._request_decision_brief(analysis["signals"], extraction, analysis["decision_context"], previous_run)
+        with timer.stage("validate"):
+            return self._finish_result(analysis, extraction, draft, previous_run, run_history or [], learned_patterns or {}, input_extractions)
+
+    async def agenerate(
+        self,
+        inputs: List[Dict[str, Any]],
+        previous_run: Optional[Dict[str, Any]] = None,
+        run_history: Optional[List[Dict[str, Any]]] = None,
+        learned_patterns: Optional[Dict[str, Any]] = None,
+        progress: Optional[Callable[[str], Any]] = None,
+        profile: Optional[Callable[[str, float], Any]] = None,
+        signal_caches: Optional[Dict[str, Dict[str, Any]]] = None,
+        cache_scope: str = "",
     ) -> Dict[str, Any]:
+        """Async ``generate``: LLM calls use ``ainvoke`` and CPU-bound stages run in worker threads.
+
+        ``progress`` is called with ``extracting``, ``clustering``, ``deciding`` and ``validating``
+        as each stage starts.
+        """
+        report = progress or (lambda _stage: None)
+        timer = StageTimer(profile)
+        normalized_inputs = self._prepare_inputs(inputs, signal_caches, cache_scope)
+        report("extracting")
+        with timer.stage("extract"):
+            extraction, extraction_source, input_extractions, extraction_budget = await self._aextract_signals(
+                normalized_inputs, cache_scope
+            )
+        report("clustering")
+        analysis = await asyncio.to_thread(
+            self._analyze_signals,
+            normalized_inputs,
+            extraction,
+            extraction_source,
+            previous_run,
+            run_history or [],
+            learned_patterns or {},
+            timer,
+            extraction_budget,
+        )
+        if analysis["quality"]["insufficient_signal"]:
+            return self._insufficient_result(analysis, extraction, extraction_source, input_extractions, previous_run, run_history or [], learned_patterns or {})
+        report("deciding")
+        with timer.stage("brief"):
+            draft = await self._arequest_decision_brief(analysis["signals"], extraction, analysis["decision_context"], previous_run)
+        report("validating")
+        with timer.stage("validate"):
+            return await asyncio.to_thread(
+                self._finish_result,
+                analysis,
+                extraction,
+                draft,
+                previous_run,
+                run_history or [],
+                learned_patterns or {},
+                input_extractions,
+            )
+
+    def _prepare_inputs(
+        self,
+        inputs: List[Dict[str, Any]],
+        signal_caches: Optional[Dict[str, Dict[str, Any]]] = None,
+        cache_scope: str = "",
+    ) -> List[RevenueWedgeInputRecord]:
         normalized_inputs = [RevenueWedgeInputRecord(**item) for item in inputs if item.get("raw_text")]
         if not normalized_inputs:
             raise ValueError("At least one founder input is required.")
+        self._seed_extraction_cache(normalized_inputs, signal_caches or {}, cache_scope)
+        return normalized_inputs
 
-        extraction, extraction_source = self._extract_signals(normalized_inputs)
-        cluster_map = self._cluster_observations(extraction.observations)
-        summary = self._summarize_clusters(cluster_map)
-        decision_context = self._build_decision_context(summary, previous_run, run_history or [], learned_patterns or {})
-        quality = self._assess_signal_quality(normalized_inputs, extraction, summary, extraction_source)
-        comparison = self._build_run_comparison(previous_run, None, run_history or [], learned_patterns or {})
-        if quality["insufficient_signal"]:
-            return {
-                "signals": summary,
-                "synthesis_notes": extraction.synthesis_notes,
-                "decision_brief": None,
-                "generation_source": extraction_source,
-                "signal_quality": quality,
-                "comparison": comparison,
-            }
-        brief, decision_source = self._build_decision_brief(summary, extraction, decision_context, previous_run)
-        if result := brief.model_dump():
-            if quality.get("moderate_signal_pass") and 50 <= int(quality.get("score") or 0) <= 70:
-                result["confidence_score"] = min(int(result.get("confidence_score") or 65), 68)
-                result["confidence_reasoning"] = _clean_copy(
-                    f"{result.get('confidence_reasoning') or ''} This is enough signal to act, but confidence is lower because the pattern is moderate rather than overwhelming."
-                )
-                brief = RevenueWedgeDecisionBrief.model_validate(result)
-        comparison = self._build_run_comparison(previous_run, brief.model_dump(), run_history or [], learned_patterns or {})
-        brief = RevenueWedgeDecisionBrief.model_validate(
-            {
-                **brief.model_dump(),
-                "comparison_to_last_run": brief.comparison_to_last_run or comparison.get("adaptation_reasoning"),
-                "run_to_run_intelligence": comparison,
-            }
-        )
+    def _analyze_signals(
+        self,
+        inputs: List[RevenueWedgeInputRecord],
+        extraction: RevenueSignalExtraction,
+        extraction_source: str,
+        previous_run: Optional[Dict[str, Any]],
+        run_history: List[Dict[str, Any]],
+        learned_patterns: Dict[str, Any],
+        timer: Optional["StageTimer"] = None,
+        extraction_budget: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        timer = timer or StageTimer()
+        with timer.stage("cluster"):
+            summary = self._summarize_clusters(self._cluster_observations(extraction.observations))
+            # Dumped once here; reused by the decision prompt and the stored run.
+            signals = {key: [cluster.model_dump() for cluster in value] for key, value in summary.items()}
+        with timer.stage("context"):
+            decision_context = self._build_decision_context(summary, previous_run, run_history, learned_patterns)
+        with timer.stage("quality"):
+            quality = self._assess_signal_quality(inputs, extraction, summary, extraction_source, extraction_budget)
+        return {"summary": summary, "signals": signals, "decision_context": decision_context, "quality": quality}
+
+    def _insufficient_result(
+        self,
+        analysis: Dict[str, Any],
+        extraction: RevenueSignalExtraction,
+        extraction_source: str,
+        input_extractions: Dict[str, Dict[str, Any]],
+        previous_run: Optional[Dict[str, Any]],
+        run_history: List[Dict[str, Any]],
+        learned_patterns: Dict[str, Any],
+    ) -> Dict[str, Any]:
         return {
-            "signals": summary,
+            "signals": analysis["signals"],
             "synthesis_notes": extraction.synthesis_notes,
-            "decision_brief": brief.model_dump(),
+            "decision_brief": None,
+            "generation_source": extraction_source,
+            "signal_quality": analysis["quality"],
+            "comparison": self._build_run_comparison(previous_run, None, run_history, learned_patterns),
+            "input_extractions": input_extractions,
+        }
+
+    def _finish_result(
+        self,
+        analysis: Dict[str, Any],
+        extraction: RevenueSignalExtraction,
+        draft: Optional[Dict[str, Any]],
+        previous_run: Optional[Dict[str, Any]],
+        run_history: List[Dict[str, Any]],
+        learned_patterns: Dict[str, Any],
+        input_extractions: Dict[str, Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Post-process the brief as one mutable draft and validate it exactly once."""
+        brief, decision_source = self._finalize_decision_brief(draft, analysis["summary"], analysis["decision_context"], previous_run)
+        quality = analysis["quality"]
+        if quality.get("moderate_signal_pass") and 50 <= int(quality.get("score") or 0) <= 70:
+            brief["confidence_score"] = min(int(brief.get("confidence_score") or 65), 68)
+            brief["confidence_reasoning"] = _clean_copy(
+                f"{brief.get('confidence_reasoning') or ''} This is enough signal to act, but confidence is lower because the pattern is moderate rather than overwhelming."
+            )
+        comparison = self._build_run_comparison(previous_run, brief, run_history, learned_patterns)
+        brief["comparison_to_last_run"] = brief.get("comparison_to_last_run") or comparison.get("adaptation_reasoning")
+        brief["run_to_run_intelligence"] = comparison
+        return {
+            "signals": analysis["signals"],
+            "synthesis_notes": extraction.synthesis_notes,
+            "decision_brief": RevenueWedgeDecisionBrief.model_validate(brief).model_dump(),
             "generation_source": decision_source,
             "signal_quality": quality,
             "comparison": comparison,
+            "input_extractions": input_extractions,
         }
 
-    def _build_corpus(self, inputs: List[RevenueWedgeInputRecord]) -> str:
+    def _build_corpus(self, segments: List[Tuple[RevenueWedgeInputRecord, str]]) -> str:
         chunks = []
-        for item in inputs:
+        for item, text in segments:
             chunks.append(
                 "\n".join(
                     [
@@ -553,37 +1045,57 @@ class RevenueWedgeEngine:
                         f"TAG: {item.tag}",
                         f"SOURCE_TYPE: {item.source_type}",
                         "CONTENT:",
-                        _clip(item.raw_text, 2600),
+                        text,
                     ]
                 )
             )
         return "\n\n---\n\n".join(chunks)
 
-    def _extract_signals(self, inputs: List[RevenueWedgeInputRecord]):
-        if not self.llm:
-            return self._fallback_extraction(inputs), "fallback_heuristics"
+    def _cache_key(self, item: RevenueWedgeInputRecord, cache_scope: str) -> str:
+        return extraction_cache_key(cache_scope, item.input_id, item.raw_text, item.tag, self.model_name)
+
+    @staticmethod
+    def _cache_entry(key: str, observations: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return {
+            "key": key,
+            "prompt_version": EXTRACTION_PROMPT_VERSION,
+            "observations": [
+                {field: value for field, value in data.items() if field not in _UNCACHED_OBSERVATION_FIELDS}
+                for data in observations
+            ],
+        }
+
+    @staticmethod
+    def _cached_run_entry(entry: Dict[str, Any], item: RevenueWedgeInputRecord) -> Dict[str, Any]:
+        """A cache hit attributed to ``item``, with its note rebuilt for this run."""
+        observations = [
+            {**data, "input_id": item.input_id, "source_tag": item.tag} for data in entry.get("observations") or []
+        ]
+        notes = [f"{item.title} added {len(observations)} evidence-backed signals."] if observations else []
+        return {"observations": observations, "synthesis_notes": notes}
+
+    def _seed_extraction_cache(
+        self, inputs: List[RevenueWedgeInputRecord], signal_caches: Dict[str, Dict[str, Any]], cache_scope: str
+    ) -> None:
+        """Load extractions persisted next to the inputs (``signal_cache``) into the in-process cache."""
+        for item in inputs:
+            cached = signal_caches.get(item.input_id)
+            if not isinstance(cached, dict) or not cached.get("key"):
+                continue
+            key = self._cache_key(item, cache_scope)
+            if cached["key"] == key:
+                extraction_cache.set(key, self._cache_entry(key, cached.get("observations") or []))
+
+    def _extraction_chain(self):
+        from langchain_core.output_parsers import PydanticOutputParser
+        from langchain_core.prompts import ChatPromptTemplate
 
         parser = PydanticOutputParser(pydantic_object=RevenueSignalExtraction)
         prompt = ChatPromptTemplate.from_messages(
             [
                 (
                     "system",
-                    """You are Revenue Wedge Engine, a founder decision system.
-Extract only repeated commercial signals from startup inputs.
-
-Rules:
-- Emit observations only when the input contains direct evidence.
-- Every supporting_quote must be a short verbatim quote from the inputs.
-- If a claim has no quote, do not emit it.
-- Categories allowed: segment, pain, objection, trigger, blocker, feature_request, urgency, language, stage.
-- Prefer labels that are concrete and operational, not generic strategy language.
-- Stage must be one of: awareness, discovery, evaluation, proposal, decision, onboarding, renewal, unknown.
-- impact_direction must be positive, negative, or neutral.
-- Prioritize signals tied to buyer outcomes, especially patterns in won deals and then lost deals.
-- Treat objections like trust, hesitation, and risk as symptoms unless the quote clearly states the deeper operational problem.
-- When you see evidence that buyers understood value, output, ICP fit, or decision speed in a won deal, preserve that signal.
-- Ignore compliments, generic advice, and broad startup platitudes.
-Return valid JSON matching the schema.""",
+                    EXTRACTION_SYSTEM_PROMPT,
                 ),
                 (
                     "user",
@@ -591,16 +1103,274 @@ Return valid JSON matching the schema.""",
                 ),
             ]
         )
-        chain = prompt | self.llm | parser
-        try:
-            return chain.invoke(
-                {
-                    "corpus": self._build_corpus(inputs),
-                    "format_instructions": parser.get_format_instructions(),
-                }
-            ), "llm_extraction"
-        except Exception:
-            return self._fallback_extraction(inputs), "fallback_heuristics"
+        return prompt | self.llm | parser, parser
+
+    def _plan_extraction_batches(
+        self, inputs: List[RevenueWedgeInputRecord]
+    ) -> Tuple[List[List[Tuple[RevenueWedgeInputRecord, str]]], List[Tuple[RevenueWedgeInputRecord, str]]]:
+        """Split inputs into token-sized chunks and pack them into token-budgeted batches.
+
+        At most ``EXTRACTION_RUN_TOKEN_BUDGET`` tokens and ``EXTRACTION_MAX_BATCHES`` batches go to
+        the LLM. Chunks are admitted round-robin (every input's first chunk, then every second one),
+        so one large export cannot starve the other inputs. The rest comes back as overflow.
+        """
+        chunked = [
+            [(chunk, count_tokens(chunk) + 40) for chunk in split_to_token_chunks(item.raw_text, EXTRACTION_CHUNK_TOKENS)]
+            for item in inputs
+        ]
+        admitted = set()
+        spent = 0
+        for position in range(max((len(chunks) for chunks in chunked), default=0)):
+            for index, chunks in enumerate(chunked):
+                if position < len(chunks) and spent + chunks[position][1] <= EXTRACTION_RUN_TOKEN_BUDGET:
+                    admitted.add((index, position))
+                    spent += chunks[position][1]
+
+        batches: List[List[Tuple[RevenueWedgeInputRecord, str]]] = []
+        overflow: List[Tuple[RevenueWedgeInputRecord, str]] = []
+        current: List[Tuple[RevenueWedgeInputRecord, str]] = []
+        used = 0
+        for index, (item, chunks) in enumerate(zip(inputs, chunked)):
+            for position, (chunk, cost) in enumerate(chunks):
+                if (index, position) not in admitted:
+                    overflow.append((item, chunk))
+                    continue
+                if current and used + cost > EXTRACTION_BATCH_TOKENS:
+                    batches.append(current)
+                    current, used = [], 0
+                if len(batches) >= EXTRACTION_MAX_BATCHES:
+                    overflow.append((item, chunk))
+                    continue
+                current.append((item, chunk))
+                used += cost
+        if current:
+            batches.append(current)
+        return batches, overflow
+
+    def _attribute_observation(self, data: Dict[str, Any], batch: List[Tuple[RevenueWedgeInputRecord, str]]) -> RevenueWedgeInputRecord:
+        by_id = {item.input_id: item for item, _text in batch}
+        if data.get("input_id") in by_id:
+            return by_id[data["input_id"]]
+        quote = _normalize_text(data.get("supporting_quote") or "").lower()
+        if quote:
+            for item, text in batch:
+                if quote in _normalize_text(text).lower():
+                    return item
+        return batch[0][0]
+
+    def _batch_payload(self, parser, batch: List[Tuple[RevenueWedgeInputRecord, str]]) -> Dict[str, str]:
+        return {
+            "corpus": self._build_corpus(batch),
+            "format_instructions": parser.get_format_instructions(),
+        }
+
+    def _extract_batch(self, chain, parser, batch: List[Tuple[RevenueWedgeInputRecord, str]]) -> Tuple[List[Dict[str, Any]], List[str]]:
+        with track_llm_call("revenue_wedge.extract") as llm_config:
+            extraction = chain.invoke(self._batch_payload(parser, batch), config=llm_config)
+        return self._batch_observations(extraction, batch)
+
+    async def _aextract_batch(self, chain, parser, batch: List[Tuple[RevenueWedgeInputRecord, str]]) -> Tuple[List[Dict[str, Any]], List[str]]:
+        with track_llm_call("revenue_wedge.extract") as llm_config:
+            extraction = await chain.ainvoke(self._batch_payload(parser, batch), config=llm_config)
+        return self._batch_observations(extraction, batch)
+
+    def _batch_observations(
+        self, extraction: RevenueSignalExtraction, batch: List[Tuple[RevenueWedgeInputRecord, str]]
+    ) -> Tuple[List[Dict[str, Any]], List[str]]:
+        observations = []
+        for observation in extraction.observations:
+            data = observation.model_dump()
+            item = self._attribute_observation(data, batch)
+            data["input_id"] = item.input_id
+            data["source_tag"] = item.tag
+            observations.append(data)
+        return observations, list(extraction.synthesis_notes or [])
+
+    @staticmethod
+    def _dedupe_observations(observations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        seen = set()
+        unique = []
+        for data in observations:
+            key = (
+                data.get("input_id"),
+                data.get("category"),
+                _normalize_text(data.get("label") or "").lower(),
+                _normalize_text(data.get("supporting_quote") or "").lower(),
+            )
+            if key in seen:
+                continue
+            seen.add(key)
+            unique.append(data)
+        return unique
+
+    def _merge_extractions(
+        self,
+        entries: List[Dict[str, Any]],
+        fallback: Optional[RevenueSignalExtraction] = None,
+    ) -> RevenueSignalExtraction:
+        observations: List[Dict[str, Any]] = []
+        notes: List[str] = []
+        for entry in entries:
+            observations.extend(entry.get("observations") or [])
+            notes.extend(entry.get("synthesis_notes") or [])
+        if fallback is not None:
+            observations.extend(item.model_dump() for item in fallback.observations)
+            notes.extend(fallback.synthesis_notes)
+        return RevenueSignalExtraction.model_validate(
+            {"observations": self._dedupe_observations(observations), "synthesis_notes": list(dict.fromkeys(notes))[:8]}
+        )
+
+    def _run_extraction_batches(
+        self, batches: List[List[Tuple[RevenueWedgeInputRecord, str]]]
+    ) -> List[Optional[Tuple[List[Dict[str, Any]], List[str]]]]:
+        """Extract every batch with bounded parallelism; failed batches come back as ``None``."""
+        chain, parser = self._extraction_chain()
+
+        def run(batch):
+            try:
+                return self._extract_batch(chain, parser, batch)
+            except Exception:
+                return None
+
+        if len(batches) == 1:
+            return [run(batches[0])]
+        # Each batch runs in a copy of the caller's context so its spans reach the request recorder.
+        with ThreadPoolExecutor(max_workers=min(EXTRACTION_MAX_WORKERS, len(batches))) as pool:
+            futures = [pool.submit(contextvars.copy_context().run, run, batch) for batch in batches]
+            return [future.result() for future in futures]
+
+    async def _arun_extraction_batches(
+        self, batches: List[List[Tuple[RevenueWedgeInputRecord, str]]]
+    ) -> List[Optional[Tuple[List[Dict[str, Any]], List[str]]]]:
+        """Async ``_run_extraction_batches``: at most ``EXTRACTION_MAX_WORKERS`` requests in flight."""
+        chain, parser = self._extraction_chain()
+        semaphore = asyncio.Semaphore(EXTRACTION_MAX_WORKERS)
+
+        async def run(batch):
+            async with semaphore:
+                try:
+                    return await self._aextract_batch(chain, parser, batch)
+                except Exception:
+                    return None
+
+        return list(await asyncio.gather(*(run(batch) for batch in batches)))
+
+    def _reduce_extraction_batches(
+        self,
+        batches: List[List[Tuple[RevenueWedgeInputRecord, str]]],
+        results: List[Optional[Tuple[List[Dict[str, Any]], List[str]]]],
+        cache_scope: str,
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]], List[RevenueWedgeInputRecord]]:
+        """Group batch results per input; inputs whose chunks all succeeded become cache entries.
+
+        The run entries keep this run's notes; the cache entries keep only unattributed observations.
+        """
+        observations: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        notes: Dict[str, List[str]] = defaultdict(list)
+        failed_ids = set()
+        failed_segments: List[RevenueWedgeInputRecord] = []
+        inputs: Dict[str, RevenueWedgeInputRecord] = {}
+        for batch, result in zip(batches, results):
+            for item, text in batch:
+                inputs[item.input_id] = item
+                if result is None:
+                    failed_ids.add(item.input_id)
+                    failed_segments.append(item.model_copy(update={"raw_text": text}))
+                else:
+                    notes[item.input_id].extend(result[1])
+            for data in (result or ([], []))[0]:
+                observations[data["input_id"]].append(data)
+
+        entries: List[Dict[str, Any]] = []
+        fresh: Dict[str, Dict[str, Any]] = {}
+        for input_id, item in inputs.items():
+            input_observations = self._dedupe_observations(observations.get(input_id, []))
+            entries.append(
+                {"observations": input_observations, "synthesis_notes": list(dict.fromkeys(notes.get(input_id, [])))}
+            )
+            if input_id not in failed_ids:
+                fresh[input_id] = self._cache_entry(self._cache_key(item, cache_scope), input_observations)
+        return entries, fresh, failed_segments
+
+    def _split_cached_inputs(
+        self, inputs: List[RevenueWedgeInputRecord], cache_scope: str
+    ) -> Tuple[List[Dict[str, Any]], List[RevenueWedgeInputRecord]]:
+        cached_entries: List[Dict[str, Any]] = []
+        pending: List[RevenueWedgeInputRecord] = []
+        for item in inputs:
+            cached = extraction_cache.get(self._cache_key(item, cache_scope))
+            if cached is not None:
+                cached_entries.append(self._cached_run_entry(cached, item))
+            else:
+                pending.append(item)
+        return cached_entries, pending
+
+    def _complete_extraction(
+        self,
+        cached_entries: List[Dict[str, Any]],
+        batches: List[List[Tuple[RevenueWedgeInputRecord, str]]],
+        results: List[Optional[Tuple[List[Dict[str, Any]], List[str]]]],
+        cache_scope: str = "",
+        overflow: Optional[List[Tuple[RevenueWedgeInputRecord, str]]] = None,
+    ) -> Tuple[RevenueSignalExtraction, str, Dict[str, Dict[str, Any]], Dict[str, Any]]:
+        overflow = overflow or []
+        entries, fresh, failed_segments = self._reduce_extraction_batches(batches, results, cache_scope)
+        # An input only partly read by the LLM is not cached, so a later run with budget to spare re-reads it.
+        for item, _chunk in overflow:
+            fresh.pop(item.input_id, None)
+        for entry in fresh.values():
+            extraction_cache.set(entry["key"], entry)
+        budget = {
+            "llm_batches": len(batches),
+            "overflow_chunks": len(overflow),
+            "overflow_tokens": sum(count_tokens(chunk) for _item, chunk in overflow),
+            "overflow_input_ids": list(dict.fromkeys(item.input_id for item, _chunk in overflow)),
+        }
+        heuristic_segments = failed_segments + [item.model_copy(update={"raw_text": chunk}) for item, chunk in overflow]
+        fallback = self._fallback_extraction(heuristic_segments) if heuristic_segments else None
+        extraction = self._merge_extractions(cached_entries + entries, fallback)
+        if overflow:
+            extraction.synthesis_notes.insert(
+                0, f"{len(overflow)} input chunk(s) past the per-run extraction budget were read with fallback heuristics."
+            )
+        source = "fallback_heuristics" if failed_segments else "llm_extraction"
+        return extraction, source, fresh, budget
+
+    def _extract_signals(
+        self, inputs: List[RevenueWedgeInputRecord], cache_scope: str = ""
+    ) -> Tuple[RevenueSignalExtraction, str, Dict[str, Dict[str, Any]], Dict[str, Any]]:
+        """Map-reduce extraction over uncached inputs, reusing cached extractions for the rest.
+
+        Returns the merged extraction, its source, the fresh per-input extractions so the caller
+        can persist them next to the inputs, and how much of the run's extraction budget was used.
+        """
+        if not self.llm:
+            return self._fallback_extraction(inputs), "fallback_heuristics", {}, _empty_extraction_budget()
+
+        cached_entries, pending = self._split_cached_inputs(inputs, cache_scope)
+        if not pending:
+            return self._merge_extractions(cached_entries), "llm_extraction", {}, _empty_extraction_budget()
+
+        batches, overflow = self._plan_extraction_batches(pending)
+        results = self._run_extraction_batches(batches)
+        return self._complete_extraction(cached_entries, batches, results, cache_scope, overflow)
+
+    async def _aextract_signals(
+        self, inputs: List[RevenueWedgeInputRecord], cache_scope: str = ""
+    ) -> Tuple[RevenueSignalExtraction, str, Dict[str, Dict[str, Any]], Dict[str, Any]]:
+        """Async ``_extract_signals``; planning and merging run in a worker thread."""
+        if not self.llm:
+            extraction = await asyncio.to_thread(self._fallback_extraction, inputs)
+            return extraction, "fallback_heuristics", {}, _empty_extraction_budget()
+
+        cached_entries, pending = self._split_cached_inputs(inputs, cache_scope)
+        if not pending:
+            extraction = await asyncio.to_thread(self._merge_extractions, cached_entries)
+            return extraction, "llm_extraction", {}, _empty_extraction_budget()
+
+        batches, overflow = await asyncio.to_thread(self._plan_extraction_batches, pending)
+        results = await self._arun_extraction_batches(batches)
+        return await asyncio.to_thread(self._complete_extraction, cached_entries, batches, results, cache_scope, overflow)
 
     def _fallback_extraction(self, inputs: List[RevenueWedgeInputRecord]) -> RevenueSignalExtraction:
         observations = []
@@ -608,11 +1378,10 @@ Return valid JSON matching the schema.""",
         for item in inputs:
             sentences = _split_sentences(item.raw_text)
             matched = 0
-            for sentence in sentences:
-                lowered = sentence.lower()
-                stage = "evaluation" if item.tag in {"sales_call", "lost_deal", "crm_export"} else "discovery"
-                for category, keywords in CATEGORY_KEYWORDS.items():
-                    keyword = next((value for value in keywords if value in lowered), None)
+            stage = "evaluation" if item.tag in {"sales_call", "lost_deal", "crm_export"} else "discovery"
+            for sentence, hits in zip(sentences, CATEGORY_MATCHER.match_sentences(sentences)):
+                for category in CATEGORY_KEYWORDS:
+                    keyword = hits.get(category)
                     if not keyword:
                         continue
                     impact_direction = "negative" if category in {"pain", "objection", "blocker"} else "positive"
@@ -1180,26 +1949,28 @@ Return valid JSON matching the schema.""",
 
     def _brief_has_observable_change(
         self,
-        brief: RevenueWedgeDecisionBrief,
+        brief: Dict[str, Any],
         previous_run: Optional[Dict[str, Any]],
     ) -> bool:
         previous_brief = (previous_run or {}).get("decision_brief") or {}
         if not previous_brief:
             return True
         changed = 0
-        if _normalize_icp_text(brief.recommended_icp).strip().lower() != _normalize_icp_text(previous_brief.get("recommended_icp") or "").strip().lower():
+        icp_changed = _normalize_icp_text(brief["recommended_icp"]).strip().lower() != _normalize_icp_text(previous_brief.get("recommended_icp") or "").strip().lower()
+        if icp_changed:
             changed += 1
-        if (brief.decision or "").strip().lower() != (previous_brief.get("decision") or "").strip().lower():
+        if (brief["decision"] or "").strip().lower() != (previous_brief.get("decision") or "").strip().lower():
             changed += 1
-        if " ".join(brief.this_week_execution or []).strip().lower() != " ".join(previous_brief.get("this_week_execution") or []).strip().lower():
+        if " ".join(brief["this_week_execution"] or []).strip().lower() != " ".join(previous_brief.get("this_week_execution") or []).strip().lower():
             changed += 1
+        assets = brief["assets"]
         previous_assets = previous_brief.get("assets") or {}
         current_asset_text = " ".join(
             [
-                brief.assets.landing_page_headline,
-                brief.assets.landing_page_subheadline,
-                brief.assets.outbound_message,
-                " ".join(brief.assets.sales_talk_track or []),
+                assets["landing_page_headline"],
+                assets["landing_page_subheadline"],
+                assets["outbound_message"],
+                " ".join(assets["sales_talk_track"] or []),
             ]
         ).strip().lower()
         previous_asset_text = " ".join(
@@ -1212,24 +1983,24 @@ Return valid JSON matching the schema.""",
         ).strip().lower()
         if current_asset_text != previous_asset_text:
             changed += 1
-        icp_changed = _normalize_icp_text(brief.recommended_icp).strip().lower() != _normalize_icp_text(previous_brief.get("recommended_icp") or "").strip().lower()
         if icp_changed and current_asset_text == previous_asset_text:
             return False
         return changed >= 1
 
-    def _measure_change_is_testable(self, brief: RevenueWedgeDecisionBrief) -> bool:
-        combined = " ".join([brief.decision] + (brief.this_week_execution or []) + [brief.comparison_to_last_run]).lower()
+    def _measure_change_is_testable(self, brief: Dict[str, Any]) -> bool:
+        combined = " ".join([brief["decision"]] + (brief["this_week_execution"] or []) + [brief["comparison_to_last_run"]]).lower()
         return any(term in combined for term in ("measure", "log", "track", "reply", "call", "objection", "disqual", "deadline"))
 
-    def _assets_sound_human(self, brief: RevenueWedgeDecisionBrief) -> bool:
+    def _assets_sound_human(self, brief: Dict[str, Any]) -> bool:
+        assets = brief["assets"]
         asset_lines = [
-            brief.assets.landing_page_headline,
-            brief.assets.landing_page_subheadline,
-            brief.assets.landing_page_cta,
-            brief.assets.outbound_message,
-            *(brief.assets.sales_talk_track or []),
+            assets["landing_page_headline"],
+            assets["landing_page_subheadline"],
+            assets["landing_page_cta"],
+            assets["outbound_message"],
+            *(assets["sales_talk_track"] or []),
         ]
-        if len(brief.assets.sales_talk_track or []) > 3:
+        if len(assets["sales_talk_track"] or []) > 3:
             return False
         return all(_asset_copy_is_usable(line) for line in asset_lines)
 
@@ -1563,16 +2334,27 @@ Return valid JSON matching the schema.""",
             "same_problem_streak": adaptation.get("same_problem_streak", 0),
         }
 
+    @staticmethod
+    def _input_text_stats(item: RevenueWedgeInputRecord) -> Dict[str, Any]:
+        stats = item.text_stats
+        if stats and stats.get("version") == TEXT_STATS_VERSION and stats.get("chars") == len(item.raw_text or ""):
+            return stats
+        return compute_text_stats(item.raw_text)
+
     def _assess_signal_quality(
         self,
         inputs: List[RevenueWedgeInputRecord],
         extraction: RevenueSignalExtraction,
         summary: Dict[str, List[RevenueCluster]],
         extraction_source: str,
+        extraction_budget: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
-        total_text = " ".join(item.raw_text for item in inputs)
-        alpha_tokens = re.findall(r"[a-zA-Z]{3,}", total_text)
-        unique_alpha_tokens = {token.lower() for token in alpha_tokens}
+        text_stats = [self._input_text_stats(item) for item in inputs]
+        # Inputs are joined with spaces, so corpus tokens are the union of per-input tokens.
+        unique_token_count = max(
+            len({token for stats in text_stats for token in stats["unique_token_sample"]}),
+            max((stats["unique_token_count"] for stats in text_stats), default=0),
+        )
         commercial_categories = [
             category for category in ("segments", "pains", "objections", "conversion_blockers", "buying_triggers")
             if summary.get(category)
@@ -1580,12 +2362,12 @@ Return valid JSON matching the schema.""",
         evidence_count = sum(len(item.evidence_quotes) for values in summary.values() for item in values)
         observation_count = len(extraction.observations)
         input_count = len(inputs)
-        total_chars = len(_normalize_text(total_text))
+        non_empty_lengths = [stats["normalized_chars"] for stats in text_stats if stats["normalized_chars"]]
+        total_chars = sum(non_empty_lengths) + max(0, len(non_empty_lengths) - 1)
         meaningful_input_count = sum(
-            1 for item in inputs
-            if len(re.findall(r"[a-zA-Z]{3,}", item.raw_text or "")) >= 8 or len(_normalize_text(item.raw_text)) >= 80
+            1 for stats in text_stats if stats["alpha_token_count"] >= 8 or stats["normalized_chars"] >= 80
         )
-        structured_sections = [section for item in inputs for section in _parse_structured_sections(item.raw_text)]
+        structured_sections = [section for stats in text_stats for section in stats["structured_sections"]]
         structured_source_types = {section["mapped_source"] for section in structured_sections if section.get("mapped_source")}
         source_types_present = {item.tag for item in inputs if item.tag} | structured_source_types
         repeated_clusters = [
@@ -1662,9 +2444,9 @@ Return valid JSON matching the schema.""",
             score += 18
         elif total_chars >= 120:
             score += 10
-        if len(unique_alpha_tokens) >= 20:
+        if unique_token_count >= 20:
             score += 16
-        elif len(unique_alpha_tokens) >= 10:
+        elif unique_token_count >= 10:
             score += 8
         if len(commercial_categories) >= 3:
             score += 18
@@ -1736,6 +2518,8 @@ Return valid JSON matching the schema.""",
             "reasoning": insufficient_reasons[0] if insufficient_reasons else "Signal quality is sufficient for a weekly decision brief.",
             "details": insufficient_reasons,
             "extraction_source": extraction_source,
+            "extraction_budget": extraction_budget or _empty_extraction_budget(),
+            "extraction_truncated": bool((extraction_budget or {}).get("overflow_chunks")),
             "observation_count": observation_count,
             "commercial_categories": commercial_categories,
             "repeated_signal_count": len(repeated_clusters),
@@ -1793,51 +2577,16 @@ Return valid JSON matching the schema.""",
             },
         }
 
-    def _build_decision_brief(
-        self,
-        summary: Dict[str, List[RevenueCluster]],
-        extraction: RevenueSignalExtraction,
-        decision_context: Dict[str, Any],
-        previous_run: Optional[Dict[str, Any]] = None,
-    ):
-        fallback = self._fallback_brief(summary, decision_context, previous_run)
-        if not self.llm:
-            return self._rewrite_for_humans(fallback, decision_context), "fallback_heuristics"
+    def _decision_chain(self):
+        from langchain_core.output_parsers import PydanticOutputParser
+        from langchain_core.prompts import ChatPromptTemplate
 
         parser = PydanticOutputParser(pydantic_object=RevenueWedgeDecisionBrief)
-        compact_summary = {key: [item.model_dump() for item in value] for key, value in summary.items()}
-        previous_text = json.dumps(previous_run or {}, ensure_ascii=True)[:2000]
         prompt = ChatPromptTemplate.from_messages(
             [
                 (
                     "system",
-                    """You are HatchUp's Revenue Wedge Engine.
-You are not a brainstorming assistant. You are forcing one decision for the next 7 days.
-
-Hard rules:
-- Output exactly one ICP, one core problem, and one decision.
-- Every claim must be supported by the evidence bank. If you cannot support a claim, omit it.
-- Every evidence.quote must be verbatim from the evidence bank.
-- Interpret raw labels into natural operator language before writing.
-- Weight won-deal patterns at 3.0, lost-deal patterns at 1.5, and neutral evidence at 1.0.
-- Use patterns from won deals as the primary signal for ICP, pain, and decision speed.
-- Treat objections like trust, hesitation, and risk as symptoms, then name the deeper root problem.
-- If recent runs show no improvement for two consecutive runs, enter exploration mode.
-- In exploration mode, keep the ICP stable unless it is clearly wrong, generate 2-3 alternative root-cause hypotheses from the evidence, and choose exactly one new hypothesis to test this week.
-- Do not repeat the same core problem more than two runs in a row without measurable improvement.
-- Never expose internal labels, extraction tokens, or awkward shorthand in the final answer.
-- Use at most two short quotes for evidence, and never reuse raw quotes as landing page or outbound copy.
-- Keep the core brief product-neutral. Do not mention HatchUp in the decision, why, execution plan, evidence, or assets.
-- If you include product guidance, put it only in the optional how_to_use_hatchup field and keep it to 2-3 short lines.
-- Do not use generic startup language such as \"improve landing page\", \"increase engagement\", or \"optimize funnel\".
-- Write exact execution instructions and exact copy. No placeholders. No multiple options.
-- Resolve contradictions explicitly and explain why one signal won.
-- Before finalizing, check whether the core problem explains both the won-deal pattern and the lost-deal pattern. If not, rewrite it.
-- Make the run feel evolutionary. Clearly state the previous hypothesis, the lack of improvement, the new hypothesis, and that this week is a test when exploration mode is active.
-- If the copy does not sound like something a real founder would ship this week, rewrite it.
-- If your output can apply to any startup, it is wrong. Rewrite it.
-- confidence_score must be 0-100.
-Return valid JSON matching the schema.""",
+                    DECISION_SYSTEM_PROMPT,
                 ),
                 (
                     "user",
@@ -1845,68 +2594,119 @@ Return valid JSON matching the schema.""",
                 ),
             ]
         )
-        chain = prompt | self.llm | parser
+        return prompt | self.llm | parser, parser
+
+    @staticmethod
+    def _decision_payload(
+        parser,
+        signals: Dict[str, List[Dict[str, Any]]],
+        extraction: RevenueSignalExtraction,
+        decision_context: Dict[str, Any],
+        previous_run: Optional[Dict[str, Any]],
+    ) -> Dict[str, str]:
+        return {
+            "summary": json.dumps(signals, ensure_ascii=True),
+            "context": json.dumps(decision_context, ensure_ascii=True),
+            "notes": json.dumps(extraction.synthesis_notes, ensure_ascii=True),
+            "previous": json.dumps(previous_run or {}, ensure_ascii=True)[:2000],
+            "format_instructions": parser.get_format_instructions(),
+        }
+
+    def _request_decision_brief(
+        self,
+        signals: Dict[str, List[Dict[str, Any]]],
+        extraction: RevenueSignalExtraction,
+        decision_context: Dict[str, Any],
+        previous_run: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Draft brief from the LLM as a plain dict, or ``None`` when there is no LLM or the call fails."""
+        if not self.llm:
+            return None
         try:
-            brief = chain.invoke(
-                {
-                    "summary": json.dumps(compact_summary, ensure_ascii=True),
-                    "context": json.dumps(decision_context, ensure_ascii=True),
-                    "notes": json.dumps(extraction.synthesis_notes, ensure_ascii=True),
-                    "previous": previous_text,
-                    "format_instructions": parser.get_format_instructions(),
-                }
-            )
-            rewritten = self._rewrite_for_humans(brief, decision_context)
-            if (
-                self._brief_is_generic(rewritten)
-                or not self._brief_uses_context_evidence(rewritten, decision_context)
-                or not self._core_problem_explains_outcomes(rewritten.core_problem, summary)
-                or not self._brief_has_observable_change(rewritten, previous_run)
-                or not self._measure_change_is_testable(rewritten)
-                or not self._assets_sound_human(rewritten)
-            ):
-                repaired = self._rewrite_for_humans(fallback, decision_context)
+            chain, parser = self._decision_chain()
+            payload = self._decision_payload(parser, signals, extraction, decision_context, previous_run)
+            with track_llm_call("revenue_wedge.decide") as llm_config:
+                brief = chain.invoke(payload, config=llm_config)
+            return brief.model_dump()
+        except Exception:
+            return None
+
+    async def _arequest_decision_brief(
+        self,
+        signals: Dict[str, List[Dict[str, Any]]],
+        extraction: RevenueSignalExtraction,
+        decision_context: Dict[str, Any],
+        previous_run: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        if not self.llm:
+            return None
+        try:
+            chain, parser = self._decision_chain()
+            payload = self._decision_payload(parser, signals, extraction, decision_context, previous_run)
+            with track_llm_call("revenue_wedge.decide") as llm_config:
+                brief = await chain.ainvoke(payload, config=llm_config)
+            return brief.model_dump()
+        except Exception:
+            return None
+
+    def _finalize_decision_brief(
+        self,
+        draft: Optional[Dict[str, Any]],
+        summary: Dict[str, List[RevenueCluster]],
+        decision_context: Dict[str, Any],
+        previous_run: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Dict[str, Any], str]:
+        """Rewrite an LLM draft and keep it if it passes every check; otherwise use the heuristic brief.
+
+        The heuristic brief is only built when it is needed.
+        """
+        if draft is not None:
+            try:
+                rewritten = self._rewrite_for_humans(draft, decision_context)
                 if (
-                    not self._brief_has_observable_change(repaired, previous_run)
-                    or not self._measure_change_is_testable(repaired)
-                    or not self._assets_sound_human(repaired)
+                    not self._brief_is_generic(rewritten)
+                    and self._brief_uses_context_evidence(rewritten, decision_context)
+                    and self._core_problem_explains_outcomes(rewritten["core_problem"], summary)
+                    and self._brief_has_observable_change(rewritten, previous_run)
+                    and self._measure_change_is_testable(rewritten)
+                    and self._assets_sound_human(rewritten)
                 ):
-                    return repaired, "fallback_heuristics"
-                return repaired, "fallback_heuristics"
-            return rewritten, "llm_decision"
-        except Exception:
-            return self._rewrite_for_humans(fallback, decision_context), "fallback_heuristics"
+                    return rewritten, "llm_decision"
+            except Exception:
+                pass
+        fallback = self._fallback_brief(summary, decision_context, previous_run)
+        return self._rewrite_for_humans(fallback, decision_context), "fallback_heuristics"
 
-    def _brief_is_generic(self, brief: RevenueWedgeDecisionBrief) -> bool:
+    def _brief_is_generic(self, brief: Dict[str, Any]) -> bool:
+        assets = brief["assets"]
         combined = " ".join(
             [
-                brief.recommended_icp,
-                brief.core_problem,
-                brief.decision,
-                brief.confidence_reasoning,
-                brief.contradiction_resolution,
-                " ".join(brief.this_week_execution or []),
-                brief.assets.landing_page_headline,
-                brief.assets.landing_page_subheadline,
-                brief.assets.landing_page_cta,
-                brief.assets.outbound_message,
-                " ".join(brief.assets.sales_talk_track or []),
+                brief["recommended_icp"],
+                brief["core_problem"],
+                brief["decision"],
+                brief["confidence_reasoning"],
+                brief["contradiction_resolution"],
+                " ".join(brief["this_week_execution"] or []),
+                assets["landing_page_headline"],
+                assets["landing_page_subheadline"],
+                assets["landing_page_cta"],
+                assets["outbound_message"],
+                " ".join(assets["sales_talk_track"] or []),
             ]
         ).lower()
         if any(phrase in combined for phrase in GENERIC_PHRASES):
             return True
         if PRODUCT_NAME.lower() in combined:
             return True
-        if _has_repeated_tokens(brief.recommended_icp):
+        if _has_repeated_tokens(brief["recommended_icp"]):
             return True
-        if len((brief.recommended_icp or "").split()) > 20:
+        if len((brief["recommended_icp"] or "").split()) > 20:
             return True
-        return any(_sounds_like_raw_label(value) for value in (brief.recommended_icp, brief.core_problem, brief.decision))
+        return any(_sounds_like_raw_label(value) for value in (brief["recommended_icp"], brief["core_problem"], brief["decision"]))
 
-    def _rewrite_for_humans(self, brief: RevenueWedgeDecisionBrief, decision_context: Dict[str, Any]) -> RevenueWedgeDecisionBrief:
-        evidence_items = brief.evidence[:2]
-        clean_icp = decision_context.get("recommended_icp") or brief.recommended_icp
-        clean_problem = decision_context.get("core_problem") or brief.core_problem
+    def _rewrite_for_humans(self, brief: Dict[str, Any], decision_context: Dict[str, Any]) -> Dict[str, Any]:
+        clean_icp = decision_context.get("recommended_icp") or brief["recommended_icp"]
+        clean_problem = decision_context.get("core_problem") or brief["core_problem"]
         clean_trigger = decision_context.get("buying_trigger") or "the team has a near-term reason to act"
         trigger_clause = _trigger_to_clause(clean_trigger)
         previous_hypothesis = (decision_context.get("previous_hypothesis") or "").strip()
@@ -1933,7 +2733,7 @@ Return valid JSON matching the schema.""",
             _founder_line("What is actually blocking the deal right now?", 9),
             _founder_line("Pick one fix and test it this week.", 9),
         ]
-        comparison_to_last_run = brief.comparison_to_last_run
+        comparison_to_last_run = brief["comparison_to_last_run"]
         if exploration_mode:
             landing_headline = _clean_copy(variation.get("headline") or landing_headline)
             landing_subheadline = _clean_copy(variation.get("subheadline") or landing_subheadline)
@@ -1947,76 +2747,75 @@ Return valid JSON matching the schema.""",
                 f"{comparison_seed} "
                 f"Alternative hypotheses considered: {', '.join(alternative_hypotheses[:3])}."
             )
-        return RevenueWedgeDecisionBrief.model_validate(
-            {
-                **brief.model_dump(),
-                "recommended_icp": clean_icp,
-                "core_problem": clean_problem,
-                "decision": _clean_copy(
-                    (
-                        variation.get("decision")
-                        if exploration_mode and previous_hypothesis
-                        else f"Focus on {clean_icp.lower()} this week and anchor the message on one promise: buyers will understand exactly what the product does, what output they get, and how it helps them decide."
+        return {
+            **brief,
+            "recommended_icp": clean_icp,
+            "core_problem": clean_problem,
+            "decision": _clean_copy(
+                (
+                    variation.get("decision")
+                    if exploration_mode and previous_hypothesis
+                    else f"Focus on {clean_icp.lower()} this week and anchor the message on one promise: buyers will understand exactly what the product does, what output they get, and how it helps them decide."
+                )
+            ),
+            "this_week_execution": [
+                *[
+                    _clean_copy(item)
+                    for item in (
+                        variation.get("execution")
+                        if exploration_mode
+                        else [
+                            f"Update the homepage hero to speak directly to {clean_icp.lower()} and make the decision output concrete in the first screen.",
+                            "Use the outbound message below only for active deals with this problem.",
+                            "Run sales calls with the talk track below and log what breaks first.",
+                            "Review replies and call notes after seven days before widening the ICP or changing the promise.",
+                        ]
                     )
-                ),
-                "this_week_execution": [
-                    *[
-                        _clean_copy(item)
-                        for item in (
-                            variation.get("execution")
-                            if exploration_mode
-                            else [
-                                f"Update the homepage hero to speak directly to {clean_icp.lower()} and make the decision output concrete in the first screen.",
-                                "Use the outbound message below only for active deals with this problem.",
-                                "Run sales calls with the talk track below and log what breaks first.",
-                                "Review replies and call notes after seven days before widening the ICP or changing the promise.",
-                            ]
-                        )
-                    ],
                 ],
-                "assets": {
-                    "landing_page_headline": landing_headline,
-                    "landing_page_subheadline": landing_subheadline,
-                    "landing_page_cta": cta,
-                    "outbound_message": outbound,
-                    "sales_talk_track": talk_track,
-                },
-                "evidence": [item.model_dump() if hasattr(item, "model_dump") else item for item in evidence_items],
-                "comparison_to_last_run": comparison_to_last_run,
-                "run_to_run_intelligence": {
-                    **(brief.run_to_run_intelligence.model_dump() if hasattr(brief.run_to_run_intelligence, "model_dump") else {}),
-                    "previous_hypothesis": previous_hypothesis,
-                    "new_hypothesis": clean_problem,
-                    "alternative_hypotheses": alternative_hypotheses[:3],
-                    "exploration_mode": exploration_mode,
-                },
-                "how_to_use_hatchup": [
-                    "Use HatchUp to collect the next round of call notes and objections in one workspace.",
-                    "Log replies, booked calls, closed deals, and the top objection so the next run adapts automatically.",
-                ],
-            }
-        )
+            ],
+            "assets": {
+                "landing_page_headline": landing_headline,
+                "landing_page_subheadline": landing_subheadline,
+                "landing_page_cta": cta,
+                "outbound_message": outbound,
+                "sales_talk_track": talk_track,
+            },
+            "evidence": list(brief["evidence"][:2]),
+            "comparison_to_last_run": comparison_to_last_run,
+            "run_to_run_intelligence": {
+                **(brief.get("run_to_run_intelligence") or {}),
+                "previous_hypothesis": previous_hypothesis,
+                "new_hypothesis": clean_problem,
+                "alternative_hypotheses": alternative_hypotheses[:3],
+                "exploration_mode": exploration_mode,
+            },
+            "how_to_use_hatchup": [
+                "Use HatchUp to collect the next round of call notes and objections in one workspace.",
+                "Log replies, booked calls, closed deals, and the top objection so the next run adapts automatically.",
+            ],
+        }
 
-    def _brief_uses_context_evidence(self, brief: RevenueWedgeDecisionBrief, decision_context: Dict[str, Any]) -> bool:
+    def _brief_uses_context_evidence(self, brief: Dict[str, Any], decision_context: Dict[str, Any]) -> bool:
         allowed_quotes = {item.get("quote") for item in (decision_context.get("evidence") or [])}
-        if not brief.evidence:
+        evidence = brief["evidence"]
+        if not evidence:
             return False
-        if not any(item.quote in allowed_quotes for item in brief.evidence):
+        if not any(item.get("quote") in allowed_quotes for item in evidence):
             return False
-        if _normalize_icp_text(brief.recommended_icp).strip().lower() != _normalize_icp_text(decision_context.get("recommended_icp", "")).strip().lower():
+        if _normalize_icp_text(brief["recommended_icp"]).strip().lower() != _normalize_icp_text(decision_context.get("recommended_icp", "")).strip().lower():
             return False
-        if _has_repeated_tokens(brief.recommended_icp):
+        if _has_repeated_tokens(brief["recommended_icp"]):
             return False
-        if len((brief.recommended_icp or "").split()) > 20:
+        if len((brief["recommended_icp"] or "").split()) > 20:
             return False
-        return len(brief.evidence) <= 2
+        return len(evidence) <= 2
 
     def _fallback_brief(
         self,
         summary: Dict[str, List[RevenueCluster]],
         decision_context: Dict[str, Any],
         previous_run: Optional[Dict[str, Any]] = None,
-    ) -> RevenueWedgeDecisionBrief:
+    ) -> Dict[str, Any]:
         icp = decision_context["recommended_icp"]
         problem = decision_context["core_problem"]
         trigger = decision_context["buying_trigger"]
@@ -2032,9 +2831,9 @@ Return valid JSON matching the schema.""",
             icp = variation.get("recommended_icp") or icp
         icp = _normalize_icp_text(icp)
         evidence_payload = decision_context.get("evidence") or []
-        evidence = [RevenueEvidenceItem.model_validate(item) for item in evidence_payload[:4]]
-        proof_quote = evidence[0].quote if evidence else problem
-        secondary_quote = evidence[1].quote if len(evidence) > 1 else proof_quote
+        evidence = [dict(item) for item in evidence_payload[:4]]
+        proof_quote = evidence[0]["quote"] if evidence else problem
+        secondary_quote = evidence[1]["quote"] if len(evidence) > 1 else proof_quote
 
         comparison = "No previous run available yet."
         if previous_run and previous_run.get("decision_brief"):
@@ -2096,42 +2895,40 @@ Return valid JSON matching the schema.""",
         if top_problem_cluster:
             confidence_base += min(18, top_problem_cluster.score // 6)
 
-        return RevenueWedgeDecisionBrief.model_validate(
-            {
-                "recommended_icp": icp,
-                "core_problem": problem,
-                "decision": decision,
-                "this_week_execution": execution,
-                "assets": {
-                    "landing_page_headline": headline,
-                    "landing_page_subheadline": subheadline,
-                    "landing_page_cta": cta,
-                    "outbound_message": outbound,
-                    "sales_talk_track": talk_track,
-                },
-                "confidence_score": min(95, max(58, confidence_base)),
-                "confidence_reasoning": (
-                    f"Confidence is based on repeated evidence for {icp} and {problem}, weighted first toward won-deal patterns, then lost deals, sales calls, CRM exports, "
-                    "and the exact quotes surfaced in the selected evidence bank."
-                ),
-                "evidence": [item.model_dump() for item in evidence[:2]],
-                "contradiction_resolution": contradiction_resolution,
-                "comparison_to_last_run": comparison,
-                "run_to_run_intelligence": {
-                    "previous_run_id": (previous_run or {}).get("run_id") or "",
-                    "what_changed": [],
-                    "what_improved": [],
-                    "what_failed": [],
-                    "next_move": decision,
-                    "adaptation_reasoning": adaptation_instruction,
-                    "previous_hypothesis": previous_hypothesis,
-                    "new_hypothesis": problem,
-                    "alternative_hypotheses": alternative_hypotheses[:3],
-                    "exploration_mode": exploration_mode,
-                },
-                "how_to_use_hatchup": [
-                    "Use HatchUp to store this run, then log replies, calls, deals, and objections against the run ID.",
-                    "Run it again after the next batch of conversations so the recommendation sharpens based on real outcomes.",
-                ],
-            }
-        )
+        return {
+            "recommended_icp": icp,
+            "core_problem": problem,
+            "decision": decision,
+            "this_week_execution": execution,
+            "assets": {
+                "landing_page_headline": headline,
+                "landing_page_subheadline": subheadline,
+                "landing_page_cta": cta,
+                "outbound_message": outbound,
+                "sales_talk_track": talk_track,
+            },
+            "confidence_score": min(95, max(58, confidence_base)),
+            "confidence_reasoning": (
+                f"Confidence is based on repeated evidence for {icp} and {problem}, weighted first toward won-deal patterns, then lost deals, sales calls, CRM exports, "
+                "and the exact quotes surfaced in the selected evidence bank."
+            ),
+            "evidence": evidence[:2],
+            "contradiction_resolution": contradiction_resolution,
+            "comparison_to_last_run": comparison,
+            "run_to_run_intelligence": {
+                "previous_run_id": (previous_run or {}).get("run_id") or "",
+                "what_changed": [],
+                "what_improved": [],
+                "what_failed": [],
+                "next_move": decision,
+                "adaptation_reasoning": adaptation_instruction,
+                "previous_hypothesis": previous_hypothesis,
+                "new_hypothesis": problem,
+                "alternative_hypotheses": alternative_hypotheses[:3],
+                "exploration_mode": exploration_mode,
+            },
+            "how_to_use_hatchup": [
+                "Use HatchUp to store this run, then log replies, calls, deals, and objections against the run ID.",
+                "Run it again after the next batch of conversations so the recommendation sharpens based on real outcomes.",
+            ],
+        }
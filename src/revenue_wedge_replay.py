@@ -0,0 +1,239 @@
+"""Offline replay of Revenue Wedge LLM calls plus synthetic founder workspaces.
+
+``ReplayChatModel`` stands in for ``ChatGroq``: responses are looked up by a hash of the
+rendered prompt, recorded from a real model when one is wrapped, and otherwise produced by an
+optional ``responder`` so the LLM code paths still run without network access.
+"""
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.output_parsers import PydanticOutputParser
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+from src.models import RevenueCluster, RevenueSignalExtraction, RevenueWedgeInputRecord
+from src.revenue_wedge_engine import compute_text_stats
+
+REPLAY_FORMAT_VERSION = 1
+FOUNDER_TAGS = ("sales_call", "customer_interview", "lost_deal", "support", "landing_page", "pitch_deck", "crm_export")
+
+SYNTHETIC_SEGMENTS = (
+    "finance team at a 40 person startup",
+    "revops lead at a series A SaaS company",
+    "agency founder running outbound for clients",
+    "ops manager at a logistics SMB",
+)
+SYNTHETIC_SENTENCES = (
+    "The {segment} said the manual pipeline review is slow and messy every Monday.",
+    "Budget approval stalled in procurement after the demo.",
+    "They need a dashboard export before the renewal this week.",
+    "Pricing felt expensive compared with the spreadsheet they use now.",
+    "Legal asked for a security review before any pilot.",
+    "The buyer said it is urgent because quota resets at the end of the month.",
+    "Integration with the CRM was the first question on the call.",
+    "They described the current process as broken and hard to trust.",
+    "Support tickets mention the same reporting delay three times.",
+    "The champion wants reporting now but cannot get buy-in from the team.",
+    "We closed the deal once they saw the weekly decision output.",
+    "The prospect went quiet after asking about accuracy.",
+)
+
+
+def prompt_hash(messages: List[BaseMessage]) -> str:
+    payload = json.dumps([[message.type, message.content] for message in messages], ensure_ascii=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ReplayMiss(KeyError):
+    pass
+
+
+class ReplayStore:
+    """JSON file of recorded LLM responses keyed by ``prompt_hash``."""
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        self.path = path
+        self.responses: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        if path and os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as handle:
+                payload = json.load(handle)
+            if payload.get("version") != REPLAY_FORMAT_VERSION:
+                raise ValueError(f"Unsupported replay file version in {path}.")
+            self.responses = payload.get("responses") or {}
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self.responses.get(key)
+        return entry["text"] if entry else None
+
+    def put(self, key: str, text: str, model: str = "") -> None:
+        with self._lock:
+            self.responses[key] = {"text": text, "model": model}
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        with self._lock:
+            payload = {"version": REPLAY_FORMAT_VERSION, "responses": dict(sorted(self.responses.items()))}
+        with open(self.path, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, indent=1, ensure_ascii=True)
+
+
+class ReplayChatModel(BaseChatModel):
+    """Chat model that replays recorded responses, recording through ``inner`` on a miss.
+
+    Without ``inner`` a miss goes to ``responder(messages)``; without either it raises
+    ``ReplayMiss``, which the engine treats like any other LLM failure.
+    """
+
+    store: Any
+    inner: Any = None
+    responder: Optional[Callable[[List[BaseMessage]], str]] = None
+    stats: Dict[str, int] = {}
+
+    def __init__(self, **data: Any) -> None:
+        super().__init__(**data)
+        self.stats = {"hits": 0, "recorded": 0, "synthesized": 0, "misses": 0}
+
+    @property
+    def _llm_type(self) -> str:
+        return "hatchup-replay"
+
+    def _respond(self, messages: List[BaseMessage]) -> str:
+        key = prompt_hash(messages)
+        text = self.store.get(key)
+        if text is not None:
+            self.stats["hits"] += 1
+            return text
+        if self.inner is not None:
+            text = str(self.inner.invoke(messages).content or "")
+            self.store.put(key, text, getattr(self.inner, "model_name", "") or "")
+            self.stats["recorded"] += 1
+            return text
+        if self.responder is not None:
+            self.stats["synthesized"] += 1
+            return self.responder(messages)
+        self.stats["misses"] += 1
+        raise ReplayMiss(key)
+
+    def _generate(self, messages: List[BaseMessage], stop=None, run_manager=None, **kwargs: Any) -> ChatResult:
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=self._respond(messages)))])
+
+
+def _section(text: str, start: str, end: str) -> str:
+    match = re.search(re.escape(start) + r"\n(.*?)\n\n" + re.escape(end), text, flags=re.DOTALL)
+    return match.group(1) if match else ""
+
+
+def heuristic_responder(engine: Any) -> Callable[[List[BaseMessage]], str]:
+    """Deterministic stand-in answers built from the engine's own heuristics.
+
+    Extraction prompts get ``_fallback_extraction`` over the prompt corpus; decision prompts get
+    ``_fallback_brief`` for the summary and context embedded in the prompt.
+    """
+    extraction_instructions = "\n\n" + PydanticOutputParser(pydantic_object=RevenueSignalExtraction).get_format_instructions()
+
+    def respond(messages: List[BaseMessage]) -> str:
+        text = str(messages[-1].content)
+        if "Generate the weekly decision brief." in text:
+            signals = json.loads(_section(text, "Ranked signal summary:", "Decision context:") or "{}")
+            context = json.loads(_section(text, "Decision context:", "Synthesis notes:") or "{}")
+            summary = {key: [RevenueCluster.model_validate(item) for item in value] for key, value in signals.items()}
+            return json.dumps(engine._fallback_brief(summary, context, context.get("previous_run") or None))
+        corpus = text.split("\n\n", 1)[-1]
+        if corpus.endswith(extraction_instructions):
+            corpus = corpus[: -len(extraction_instructions)]
+        records = []
+        for block in corpus.split("\n\n---\n\n"):
+            header, _sep, content = block.partition("CONTENT:\n")
+            fields = dict(re.findall(r"^(INPUT_ID|TITLE|TAG|SOURCE_TYPE): (.*)$", header, flags=re.MULTILINE))
+            if not fields.get("INPUT_ID") or not content.strip():
+                continue
+            records.append(
+                RevenueWedgeInputRecord(
+                    input_id=fields["INPUT_ID"],
+                    title=fields.get("TITLE") or "",
+                    tag=fields.get("TAG") or "sales_call",
+                    source_type=fields.get("SOURCE_TYPE") or "paste",
+                    content_type="text/plain",
+                    raw_text=content,
+                    excerpt="",
+                    created_at="",
+                    updated_at="",
+                )
+            )
+        if not records:
+            return json.dumps({"observations": [], "synthesis_notes": []})
+        return engine._fallback_extraction(records).model_dump_json()
+
+    return respond
+
+
+def synthetic_workspace(input_count: int, run_count: int, seed: int = 11) -> Dict[str, Any]:
+    """Founder inputs and run history shaped like ``FounderWorkspaceService`` returns them."""
+    rng = random.Random(seed * 1000003 + input_count * 1009 + run_count)
+    inputs = []
+    for index in range(input_count):
+        segment = rng.choice(SYNTHETIC_SEGMENTS)
+        sentences = [rng.choice(SYNTHETIC_SENTENCES).format(segment=segment) for _line in range(rng.randint(6, 30))]
+        raw_text = " ".join(sentences)
+        inputs.append(
+            {
+                "input_id": f"input-{index:04d}",
+                "title": f"Synthetic note {index}",
+                "tag": FOUNDER_TAGS[index % len(FOUNDER_TAGS)],
+                "source_type": "paste",
+                "content_type": "text/plain",
+                "raw_text": raw_text,
+                "excerpt": "",
+                "created_at": f"2026-01-01T00:{index // 60 % 60:02d}:{index % 60:02d}+00:00",
+                "updated_at": "",
+                "text_stats": compute_text_stats(raw_text),
+            }
+        )
+
+    runs = []
+    for index in range(run_count):
+        segment = rng.choice(SYNTHETIC_SEGMENTS)
+        problem = rng.choice(("manual pipeline review", "procurement approval delays", "unclear reporting output"))
+        runs.append(
+            {
+                "run_id": f"run-{index:04d}",
+                "created_at": f"2026-02-01T{index // 60 % 24:02d}:{index % 60:02d}:00+00:00",
+                "decision_brief": {
+                    "recommended_icp": segment,
+                    "core_problem": problem,
+                    "decision": f"Focus this week on {segment} and remove {problem}.",
+                    "this_week_execution": ["Send the outbound message to ten accounts and track replies."],
+                    "assets": {"landing_page_headline": "See why deals stall", "sales_talk_track": []},
+                },
+                "outcome_log": {
+                    "outcome": rng.choice(("won", "lost", "no_change")),
+                    "replies": rng.randint(0, 6),
+                    "calls_booked": rng.randint(0, 3),
+                    "deals_closed": rng.randint(0, 1),
+                    "top_objection": rng.choice(("", "price", "security review")),
+                },
+            }
+        )
+    best = max(runs, key=lambda run: run["outcome_log"]["deals_closed"] * 10 + run["outcome_log"]["replies"], default=None)
+    learned_patterns = {}
+    if best:
+        learned_patterns = {
+            "best_icp": best["decision_brief"]["recommended_icp"],
+            "strongest_problem": best["decision_brief"]["core_problem"],
+            "winning_pattern_summary": f"{best['decision_brief']['recommended_icp']} moved fastest.",
+        }
+    return {
+        "inputs": inputs,
+        "runs": runs,
+        "latest_run": runs[-1] if runs else None,
+        "learned_patterns": learned_patterns,
+    }
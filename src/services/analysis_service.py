@@ -3,11 +3,15 @@ import uuid
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
+from src.instrumentation import instrument_methods
+from src.research_context import build_research_context, research_context_cache
+
 
 def _utc_now() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+@instrument_methods("db")
 class AnalysisService:
     FOUNDER_WORKSPACE_TYPE = "founder_revenue_wedge"
 
@@ -32,6 +36,7 @@ class AnalysisService:
             "research": row.get("deep_research") or [],
             "memo": row.get("memo") or {},
             "created_at": row.get("created_at"),
+            "updated_at": row.get("updated_at") or row.get("created_at"),
             "status": row.get("status") or "draft",
             "user_id": row.get("user_id"),
         }
@@ -140,6 +145,7 @@ class AnalysisService:
         row = (response.data or [None])[0]
         if not row:
             raise KeyError("analysis_id_not_found")
+        research_context_cache.invalidate(analysis_id)
         return self._row_to_analysis(row)
 
     def update_memo_and_insights(
@@ -169,7 +175,41 @@ class AnalysisService:
         row = (response.data or [None])[0]
         if not row:
             raise KeyError("analysis_id_not_found")
-        return self._row_to_analysis(row)
+        return self._cache_research_context(self._row_to_analysis(row))
+
+    def _cache_research_context(self, analysis: Dict[str, Any]) -> Dict[str, Any]:
+        if analysis.get("deck"):
+            research_context_cache.set(
+                analysis["analysis_id"],
+                analysis["updated_at"],
+                build_research_context(analysis.get("deck"), analysis.get("memo")),
+            )
+        return analysis
+
+    def get_research_context(self, user_id: str, analysis_id: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Return the compact research context for an analysis, rebuilding it only when the row changed."""
+        if not analysis_id:
+            return None
+        response = (
+            self.client.table("analyses")
+            .select("analysis_id,updated_at,created_at")
+            .eq("analysis_id", analysis_id)
+            .eq("user_id", user_id)
+            .limit(1)
+            .execute()
+        )
+        row = (response.data or [None])[0]
+        if not row:
+            return None
+        updated_at = row.get("updated_at") or row.get("created_at")
+        context = research_context_cache.get(analysis_id, updated_at)
+        if context is None:
+            analysis = self.get_analysis(user_id, analysis_id)
+            if not analysis or not analysis.get("deck"):
+                return None
+            self._cache_research_context(analysis)
+            context = research_context_cache.get(analysis_id, analysis["updated_at"])
+        return {"analysis_id": analysis_id, "context": context}
 
     def update_deep_research(self, user_id: str, analysis_id: str, deep_research: List[Dict[str, Any]]) -> Dict[str, Any]:
         update_payload = {
@@ -186,4 +226,5 @@ class AnalysisService:
         row = (response.data or [None])[0]
         if not row:
             raise KeyError("analysis_id_not_found")
-        return self._row_to_analysis(row)
+        # Saving chat history bumps updated_at, so re-key the context to keep research turns on the cache.
+        return self._cache_research_context(self._row_to_analysis(row))
@@ -0,0 +1,148 @@
+import logging
+import queue
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+QUEUE_MAX_ROWS = 2000
+FLUSH_BATCH_SIZE = 100
+FLUSH_INTERVAL_SECONDS = 0.5
+FLUSH_MAX_ATTEMPTS = 4
+FLUSH_RETRY_BASE_SECONDS = 0.5
+SHUTDOWN_FLUSH_TIMEOUT_SECONDS = 10.0
+
+
+class ChatPersistenceQueueFull(RuntimeError):
+    pass
+
+
+class ChatWriteBehindService:
+    """Queue chat rows and insert them in batches from a background thread.
+
+    ``store`` must expose ``save_messages(rows)`` (see ``ChatService``). Rows carry their
+    own ``id`` and ``created_at``, so batching does not change message order and a retried
+    write is idempotent. A batch that keeps failing is retried one turn at a time, so a bad
+    row only costs its own turn.
+    """
+
+    def __init__(
+        self,
+        store: Any,
+        max_rows: int = QUEUE_MAX_ROWS,
+        batch_size: int = FLUSH_BATCH_SIZE,
+        flush_interval: float = FLUSH_INTERVAL_SECONDS,
+    ) -> None:
+        self.store = store
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=max_rows)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+        self._failed_chats: Dict[str, str] = {}
+        self._failed_lock = threading.Lock()
+        # Row id -> key of the turn (``enqueue`` call) it was queued with.
+        self._turns: Dict[str, str] = {}
+
+    def start(self) -> None:
+        with self._thread_lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="chat-write-behind", daemon=True)
+            self._thread.start()
+
+    def enqueue(self, rows: List[Dict[str, Any]]) -> None:
+        """Queue all ``rows`` or none of them; raises ``ChatPersistenceQueueFull`` when saturated."""
+        if not rows:
+            return
+        self.start()
+        # Reserve space for the whole group so a turn is never half-queued.
+        if self._queue.maxsize and self._queue.qsize() + len(rows) > self._queue.maxsize:
+            raise ChatPersistenceQueueFull("Chat persistence queue is full.")
+        turn = str(rows[0].get("id") or id(rows[0]))
+        with self._failed_lock:
+            for row in rows:
+                if row.get("id"):
+                    self._turns[str(row["id"])] = turn
+        for row in rows:
+            self._queue.put_nowait(row)
+
+    def pop_failure(self, chat_id: str) -> Optional[str]:
+        """Return and clear the last write failure recorded for ``chat_id``."""
+        with self._failed_lock:
+            return self._failed_chats.pop(chat_id, None)
+
+    def _drain(self, first: Dict[str, Any]) -> List[Dict[str, Any]]:
+        batch = [first]
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _record_failure(self, rows: List[Dict[str, Any]], exc: Exception) -> None:
+        with self._failed_lock:
+            for row in rows:
+                self._failed_chats[str(row.get("chat_id"))] = str(exc) or exc.__class__.__name__
+
+    def _write(self, batch: List[Dict[str, Any]]) -> None:
+        for attempt in range(1, FLUSH_MAX_ATTEMPTS + 1):
+            try:
+                self.store.save_messages(batch)
+                return
+            except Exception:
+                if attempt == FLUSH_MAX_ATTEMPTS:
+                    logger.warning("chat batch persistence failed; retrying %s rows turn by turn", len(batch), exc_info=True)
+                    break
+                time.sleep(FLUSH_RETRY_BASE_SECONDS * (2 ** (attempt - 1)))
+        for turn_rows in self._group_by_turn(batch):
+            try:
+                self.store.save_messages(turn_rows)
+            except Exception as exc:
+                logger.exception("chat turn persistence failed; dropping %s rows", len(turn_rows))
+                self._record_failure(turn_rows, exc)
+
+    def _group_by_turn(self, batch: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        groups: Dict[str, List[Dict[str, Any]]] = {}
+        with self._failed_lock:
+            for row in batch:
+                row_id = str(row.get("id") or id(row))
+                groups.setdefault(self._turns.get(row_id, row_id), []).append(row)
+        return list(groups.values())
+
+    def _run(self) -> None:
+        while not self._stop.is_set() or not self._queue.empty():
+            try:
+                first = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            batch = self._drain(first)
+            try:
+                self._write(batch)
+            finally:
+                with self._failed_lock:
+                    for row in batch:
+                        self._turns.pop(str(row.get("id")), None)
+                for _row in batch:
+                    self._queue.task_done()
+
+    def flush(self, timeout: float = SHUTDOWN_FLUSH_TIMEOUT_SECONDS) -> bool:
+        """Block until queued rows are written; returns False on timeout."""
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.05)
+        return True
+
+    def stop(self, timeout: float = SHUTDOWN_FLUSH_TIMEOUT_SECONDS) -> None:
+        self._stop.set()
+        thread = self._thread
+        if thread and thread.is_alive():
+            thread.join(timeout)
+        if not self._queue.empty():
+            logger.warning("chat write-behind stopped with %s unsaved rows", self._queue.qsize())
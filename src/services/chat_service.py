@@ -1,9 +1,32 @@
 import os
 import uuid
-from typing import Any, Dict, List, Optional
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
 
+from src.instrumentation import instrument_methods
 
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def _utc_now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+@instrument_methods("db", exclude=("create_chat_id", "build_message_row"))
 class ChatService:
+    # Rolling conversation summaries live beside the `chats` rows:
+    #   CREATE TABLE IF NOT EXISTS public.chat_summaries (
+    #       chat_id uuid PRIMARY KEY,
+    #       user_id uuid NOT NULL,
+    #       summary text NOT NULL DEFAULT '',
+    #       summarized_through text,
+    #       updated_at timestamptz NOT NULL DEFAULT now()
+    #   );
+    SUMMARY_TABLE = "chat_summaries"
+    MESSAGE_COLUMNS = "id,user_id,chat_id,role,content,created_at"
+
     def __init__(self) -> None:
         try:
             from supabase import create_client
@@ -50,7 +73,7 @@ class ChatService:
             return []
         response = (
             self.client.table("chats")
-            .select("id,user_id,chat_id,role,content,created_at")
+            .select(self.MESSAGE_COLUMNS)
             .eq("user_id", user_id)
             .eq("chat_id", chat_id)
             .order("created_at", desc=False)
@@ -59,21 +82,184 @@ class ChatService:
         rows = response.data or []
         return [self._normalize_message_row(row) for row in rows]
 
-    def save_message(self, user_id: str, chat_id: str, role: str, content: str) -> Dict[str, Any]:
+    @staticmethod
+    def _is_timestamp_cursor(cursor: str) -> bool:
+        try:
+            datetime.fromisoformat(cursor.replace("Z", "+00:00"))
+            return True
+        except ValueError:
+            return False
+
+    def _resolve_cursor(self, user_id: str, cursor: Optional[str]) -> Optional[Tuple[str, Optional[str]]]:
+        """Turn a cursor into ``(created_at, id)``.
+
+        Accepts the ``created_at|id`` cursors returned by ``get_chat_page``, a bare message id, or
+        a bare ``created_at`` timestamp (no tiebreaker).
+        """
+        cursor = str(cursor or "").strip()
+        if not cursor:
+            return None
+        timestamp, separator, message_id = cursor.partition("|")
+        if separator and self._is_timestamp_cursor(timestamp) and message_id:
+            return timestamp, message_id
+        if self._is_timestamp_cursor(cursor):
+            return cursor, None
+        response = (
+            self.client.table("chats")
+            .select("id,created_at")
+            .eq("user_id", user_id)
+            .eq("id", cursor)
+            .limit(1)
+            .execute()
+        )
+        row = (response.data or [None])[0]
+        if not row or not row.get("created_at"):
+            raise ValueError("Unknown history cursor.")
+        return str(row["created_at"]), str(row.get("id") or cursor)
+
+    @staticmethod
+    def _keyset_filter(op: str, position: Tuple[str, Optional[str]]) -> str:
+        """PostgREST ``or`` filter for rows strictly before/after ``(created_at, id)``."""
+        timestamp, message_id = position
+        if not message_id:
+            return f'created_at.{op}."{timestamp}"'
+        return f'created_at.{op}."{timestamp}",and(created_at.eq."{timestamp}",id.{op}.{message_id})'
+
+    @staticmethod
+    def _cursor(message: Dict[str, Any]) -> str:
+        return f"{message['created_at']}|{message['id']}"
+
+    def get_chat_page(
+        self,
+        user_id: str,
+        chat_id: Optional[str] = None,
+        before: Optional[str] = None,
+        after: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> Dict[str, Any]:
+        """Return one page of a chat in ascending order.
+
+        ``before`` pages backwards from a cursor, ``after`` returns only newer messages.
+        Without ``chat_id`` the newest page of the user's most recent chat is returned
+        from the same query that discovers it. Pages are ordered by ``(created_at, id)`` so
+        messages written in the same batch with equal timestamps are neither skipped nor repeated.
+        """
+        if not user_id:
+            return {"chat_id": chat_id, "messages": [], "has_more": False}
+        limit = max(1, min(int(limit or DEFAULT_PAGE_SIZE), MAX_PAGE_SIZE))
+        before_position = self._resolve_cursor(user_id, before)
+        after_position = self._resolve_cursor(user_id, after)
+        ascending = bool(after_position) and not before_position
+
+        query = self.client.table("chats").select(self.MESSAGE_COLUMNS).eq("user_id", user_id)
+        if chat_id:
+            query = query.eq("chat_id", chat_id)
+        if before_position:
+            query = query.or_(self._keyset_filter("lt", before_position))
+        if after_position:
+            query = query.or_(self._keyset_filter("gt", after_position))
+        response = (
+            query.order("created_at", desc=not ascending)
+            .order("id", desc=not ascending)
+            .limit(limit + 1)
+            .execute()
+        )
+        rows = response.data or []
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        if not chat_id and rows:
+            chat_id = str(rows[0].get("chat_id") or "").strip() or None
+            same_chat = [row for row in rows if str(row.get("chat_id") or "").strip() == chat_id]
+            # Rows from another chat mean older messages of this chat may sit further back.
+            has_more = has_more or len(same_chat) < len(rows)
+            rows = same_chat
+        if not ascending:
+            rows.reverse()
+
+        messages = [self._normalize_message_row(row) for row in rows]
+        return {
+            "chat_id": chat_id,
+            "messages": messages,
+            "has_more": has_more,
+            "before": self._cursor(messages[0]) if messages else before,
+            "after": self._cursor(messages[-1]) if messages else after,
+        }
+
+    def build_message_row(
+        self,
+        user_id: str,
+        chat_id: str,
+        role: str,
+        content: str,
+        created_at: Optional[str] = None,
+    ) -> Dict[str, Any]:
         if not user_id:
             raise ValueError("user_id is required")
         if not chat_id:
             raise ValueError("chat_id is required")
         if role not in {"user", "assistant"}:
             raise ValueError("role must be user or assistant")
+        # The id is assigned here rather than by the database so a retried write is idempotent.
         payload = {
+            "id": str(uuid.uuid4()),
             "user_id": user_id,
             "chat_id": chat_id,
             "role": role,
             "content": content or "",
         }
+        if created_at:
+            payload["created_at"] = created_at
+        return payload
+
+    def save_message(self, user_id: str, chat_id: str, role: str, content: str) -> Dict[str, Any]:
+        payload = self.build_message_row(user_id, chat_id, role, content)
         response = self.client.table("chats").insert(payload).execute()
         row = (response.data or [None])[0]
         if not row:
             raise RuntimeError("Failed to save chat message.")
         return self._normalize_message_row(row)
+
+    def save_messages(self, rows: List[Dict[str, Any]]) -> int:
+        """Insert prepared rows (see ``build_message_row``) in a single request.
+
+        Rows that already exist (same ``id``) are skipped, so retrying a write whose response was
+        lost does not duplicate messages.
+        """
+        if not rows:
+            return 0
+        self.client.table("chats").upsert(rows, on_conflict="id", ignore_duplicates=True).execute()
+        return len(rows)
+
+    def get_chat_summary(self, user_id: str, chat_id: str) -> Optional[Dict[str, Any]]:
+        if not user_id or not chat_id:
+            return None
+        response = (
+            self.client.table(self.SUMMARY_TABLE)
+            .select("chat_id,summary,summarized_through,updated_at")
+            .eq("user_id", user_id)
+            .eq("chat_id", chat_id)
+            .limit(1)
+            .execute()
+        )
+        row = (response.data or [None])[0]
+        if not row:
+            return None
+        return {
+            "chat_id": row.get("chat_id"),
+            "summary": row.get("summary") or "",
+            "summarized_through": row.get("summarized_through") or None,
+            "updated_at": row.get("updated_at"),
+        }
+
+    def save_chat_summary(self, user_id: str, chat_id: str, summary: str, summarized_through: Optional[str]) -> None:
+        if not user_id or not chat_id:
+            raise ValueError("user_id and chat_id are required")
+        payload = {
+            "user_id": user_id,
+            "chat_id": chat_id,
+            "summary": summary or "",
+            "summarized_through": summarized_through or None,
+            "updated_at": _utc_now(),
+        }
+        self.client.table(self.SUMMARY_TABLE).upsert(payload, on_conflict="chat_id").execute()
@@ -0,0 +1,221 @@
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Set
+
+from src.metrics import track_llm_call
+from src.token_utils import clip_to_tokens, count_tokens
+
+logger = logging.getLogger(__name__)
+
+HISTORY_TOKEN_BUDGET = 1500
+SUMMARY_TOKEN_BUDGET = 400
+RECENT_TURNS_MIN = 2
+MEMORY_CACHE_SIZE = 512
+
+SUMMARY_SYSTEM_PROMPT = """You maintain a running summary of a conversation between a user and an assistant.
+Merge the new turns into the existing summary. Keep facts, decisions, names, numbers and open questions.
+Drop greetings and filler. Write plain sentences, no markdown, at most {max_words} words."""
+
+
+def _message_role(message: Any) -> str:
+    role = message.get("role") if isinstance(message, dict) else getattr(message, "role", "")
+    return str(role or "").strip().lower() or "user"
+
+
+def _message_content(message: Any) -> str:
+    content = message.get("content") if isinstance(message, dict) else getattr(message, "content", "")
+    return str(content or "").strip()
+
+
+def _format_turn(message: Any) -> str:
+    return f"{_message_role(message).upper()}: {_message_content(message)}"
+
+
+def _message_identity(message: Any) -> str:
+    """Stable identity for a message: its stored id, or a digest of role and content for unsaved turns."""
+    message_id = message.get("id") if isinstance(message, dict) else getattr(message, "id", None)
+    if message_id:
+        return str(message_id)
+    digest = hashlib.sha256(f"{_message_role(message)}\0{_message_content(message)}".encode("utf-8", "surrogatepass"))
+    return f"sha256:{digest.hexdigest()[:32]}"
+
+
+def _summarized_boundary(messages: Sequence[Any], summarized_through: Optional[str]) -> int:
+    """Index just past the last summarized message in ``messages``.
+
+    Progress is tracked by message identity rather than position because the client prepends
+    older pages to its history, which shifts every index. When the marker is not in the list it
+    is older than the loaded window, so none of the loaded messages are summarized yet.
+    """
+    if not summarized_through:
+        return 0
+    for index in range(len(messages) - 1, -1, -1):
+        if _message_identity(messages[index]) == summarized_through:
+            return index + 1
+    return 0
+
+
+class ConversationMemoryService:
+    """Rolling summary of older turns plus a verbatim window of recent ones.
+
+    ``store`` is optional; when given it must expose ``get_chat_summary`` and
+    ``save_chat_summary`` (see ``ChatService``). Summaries are folded in the
+    background after each assistant turn so the request path never waits on them.
+    """
+
+    def __init__(
+        self,
+        store: Any = None,
+        history_token_budget: int = HISTORY_TOKEN_BUDGET,
+        summary_token_budget: int = SUMMARY_TOKEN_BUDGET,
+    ) -> None:
+        self.store = store
+        self.history_token_budget = history_token_budget
+        self.summary_token_budget = summary_token_budget
+        self._states: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._states_lock = threading.Lock()
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    def _get_state(self, user_id: str, key: str, persist: bool) -> Dict[str, Any]:
+        with self._states_lock:
+            state = self._states.get(key)
+            if state is not None:
+                self._states.move_to_end(key)
+                return dict(state)
+        state = {"summary": "", "summarized_through": None}
+        if persist and self.store is not None:
+            try:
+                row = self.store.get_chat_summary(user_id, key)
+                if row:
+                    state = {"summary": row["summary"], "summarized_through": row.get("summarized_through")}
+            except Exception:
+                logger.warning("chat summary lookup failed for %s", key, exc_info=True)
+        self._set_state(key, state)
+        return dict(state)
+
+    def _set_state(self, key: str, state: Dict[str, Any]) -> None:
+        with self._states_lock:
+            self._states[key] = dict(state)
+            self._states.move_to_end(key)
+            while len(self._states) > MEMORY_CACHE_SIZE:
+                evicted, _state = self._states.popitem(last=False)
+                lock = self._locks.get(evicted)
+                if lock is not None and not lock.locked():
+                    self._locks.pop(evicted, None)
+
+    def _recent_window_start(self, messages: Sequence[Any], budget: int) -> int:
+        """Index of the oldest message that still fits verbatim in ``budget`` tokens."""
+        start = len(messages)
+        used = 0
+        for index in range(len(messages) - 1, -1, -1):
+            cost = count_tokens(_format_turn(messages[index])) + 1
+            if used + cost > budget and len(messages) - index > RECENT_TURNS_MIN:
+                break
+            used += cost
+            start = index
+        return start
+
+    def build_history(self, user_id: str, key: str, messages: Sequence[Any], persist: bool = True) -> str:
+        """Return summary plus recent turns, kept under ``history_token_budget`` tokens."""
+        if not messages:
+            return ""
+        state = self._get_state(user_id, key, persist) if key else {"summary": "", "summarized_through": None}
+        summary = clip_to_tokens(state["summary"], self.summary_token_budget) if state["summary"] else ""
+        budget = self.history_token_budget - (count_tokens(summary) + 8 if summary else 0)
+        start = self._recent_window_start(messages, budget)
+
+        recent: List[str] = []
+        remaining = budget
+        for message in messages[start:]:
+            line = _format_turn(message)
+            if count_tokens(line) > remaining:
+                line = clip_to_tokens(line, max(remaining, 32))
+            recent.append(line)
+            remaining -= count_tokens(line) + 1
+
+        # Turns that are neither summarized yet nor in the recent window get a clipped mention
+        # until the background update folds them in.
+        pending = messages[min(_summarized_boundary(messages, state["summarized_through"]), start):start]
+        if pending and remaining > 32:
+            pending_text = clip_to_tokens("\n".join(_format_turn(m) for m in pending), remaining)
+            recent.insert(0, pending_text)
+
+        parts = []
+        if summary:
+            parts.append(f"[Summary of earlier conversation]\n{summary}")
+        if recent:
+            parts.append("\n".join(recent))
+        return "\n\n".join(parts)
+
+    def _summarize(self, summary: str, turns: Sequence[Any]) -> str:
+        new_text = "\n".join(_format_turn(m) for m in turns)
+        api_key = os.environ.get("GROQ_API_KEY")
+        if api_key:
+            try:
+                from langchain_groq import ChatGroq
+                from langchain_core.prompts import ChatPromptTemplate
+
+                llm = ChatGroq(model="openai/gpt-oss-20b", temperature=0, groq_api_key=api_key)
+                prompt = ChatPromptTemplate.from_messages(
+                    [
+                        ("system", SUMMARY_SYSTEM_PROMPT),
+                        ("human", "Existing summary:\n{summary}\n\nNew turns:\n{turns}"),
+                    ]
+                )
+                with track_llm_call("conversation_summary") as llm_config:
+                    response = (prompt | llm).invoke(
+                        {
+                            "max_words": int(self.summary_token_budget * 0.7),
+                            "summary": summary or "(none)",
+                            "turns": clip_to_tokens(new_text, 3000),
+                        },
+                        config=llm_config,
+                    )
+                text = str(response.content or "").strip()
+                if text:
+                    return clip_to_tokens(text, self.summary_token_budget)
+            except Exception:
+                logger.warning("conversation summary generation failed; using extractive fallback", exc_info=True)
+        # Extractive fallback: keep the newest material when the budget overflows.
+        combined = "\n".join(part for part in (summary, new_text) if part)
+        while combined and count_tokens(combined) > self.summary_token_budget:
+            combined = combined[int(len(combined) * 0.1):].lstrip()
+        return combined
+
+    async def update_after_turn(self, user_id: str, key: str, messages: Sequence[Any], persist: bool = True) -> None:
+        """Fold turns that have fallen out of the recent window into the rolling summary."""
+        if not key or not messages:
+            return
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            state = self._get_state(user_id, key, persist)
+            summary_reserve = count_tokens(state["summary"]) + 8 if state["summary"] else 0
+            start = self._recent_window_start(messages, self.history_token_budget - summary_reserve)
+            boundary = _summarized_boundary(messages, state["summarized_through"])
+            if start <= boundary:
+                return
+            summary = await asyncio.to_thread(self._summarize, state["summary"], messages[boundary:start])
+            summarized_through = _message_identity(messages[start - 1])
+            state = {"summary": summary, "summarized_through": summarized_through}
+            self._set_state(key, state)
+            if persist and self.store is not None:
+                try:
+                    await asyncio.to_thread(self.store.save_chat_summary, user_id, key, summary, summarized_through)
+                except Exception:
+                    logger.warning("chat summary persistence failed for %s", key, exc_info=True)
+
+    def schedule_update(self, user_id: str, key: str, messages: Sequence[Any], persist: bool = True) -> Optional[asyncio.Task]:
+        if not key or not messages:
+            return None
+        snapshot = [
+            {"id": _message_identity(m), "role": _message_role(m), "content": _message_content(m)} for m in messages
+        ]
+        task = asyncio.create_task(self.update_after_turn(user_id, key, snapshot, persist=persist))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
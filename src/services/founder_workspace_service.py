@@ -1,17 +1,36 @@
 import os
 import uuid
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from src.instrumentation import instrument_methods
+
+RUN_PAGE_SIZE = 20
+MAX_RUN_PAGE_SIZE = 50
+# Conditional writes of the workspace row retry this many times before giving up on a conflict.
+WORKSPACE_WRITE_ATTEMPTS = 3
 
 def _utc_now() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+@instrument_methods("db")
 class FounderWorkspaceService:
     WORKSPACE_TYPE = "founder_revenue_wedge"
     WORKSPACE_STATUS = "draft"
     WORKSPACE_TITLE = "Revenue Wedge Engine"
+    INPUTS_TABLE = "founder_inputs"
+    RUNS_TABLE = "founder_runs"
+    # Version 1 kept inputs in `deck_data` and runs in `deep_research` on the analyses row.
+    STORAGE_VERSION = 2
+    INPUT_SUMMARY_COLUMNS = (
+        "input_id,created_at,title:record->>title,tag:record->>tag,source_type:record->>source_type,"
+        "filename:record->>filename,content_type:record->>content_type,excerpt:record->>excerpt,updated_at:record->>updated_at"
+    )
+    RUN_SUMMARY_COLUMNS = (
+        "run_id,created_at,input_ids,snapshot:record->snapshot,signal_quality:record->signal_quality,"
+        "generation_source:record->>generation_source,outcome_log:record->outcome_log"
+    )
 
     def __init__(self) -> None:
         try:
@@ -40,82 +59,356 @@ class FounderWorkspaceService:
             },
         }
 
-    def _normalize_workspace(self, row: Dict[str, Any]) -> Dict[str, Any]:
+    def _storage_migration_hint(self) -> str:
+        return (
+            "Founder workspace tables are missing. Run this SQL in Supabase SQL Editor:\n"
+            "CREATE TABLE IF NOT EXISTS public.founder_inputs (\n"
+            "  input_id text PRIMARY KEY,\n"
+            "  workspace_id uuid NOT NULL,\n"
+            "  user_id uuid NOT NULL,\n"
+            "  record jsonb NOT NULL,\n"
+            "  signal_cache jsonb,\n"
+            "  created_at timestamptz NOT NULL DEFAULT now(),\n"
+            "  updated_at timestamptz NOT NULL DEFAULT now()\n"
+            ");\n"
+            "ALTER TABLE public.founder_inputs ADD COLUMN IF NOT EXISTS signal_cache jsonb;\n"
+            "CREATE INDEX IF NOT EXISTS founder_inputs_workspace_idx ON public.founder_inputs (workspace_id, created_at);\n"
+            "CREATE TABLE IF NOT EXISTS public.founder_runs (\n"
+            "  run_id text PRIMARY KEY,\n"
+            "  workspace_id uuid NOT NULL,\n"
+            "  user_id uuid NOT NULL,\n"
+            "  input_ids jsonb NOT NULL DEFAULT '[]'::jsonb,\n"
+            "  record jsonb NOT NULL,\n"
+            "  created_at timestamptz NOT NULL DEFAULT now(),\n"
+            "  updated_at timestamptz NOT NULL DEFAULT now()\n"
+            ");\n"
+            "CREATE INDEX IF NOT EXISTS founder_runs_workspace_idx ON public.founder_runs (workspace_id, created_at);"
+        )
+
+    def _is_missing_table_error(self, exc: Exception) -> bool:
+        message = str(exc).lower()
+        return (self.INPUTS_TABLE in message or self.RUNS_TABLE in message or "signal_cache" in message) and (
+            "pgrst205" in message
+            or "pgrst204" in message
+            or "does not exist" in message
+            or "could not find the table" in message
+        )
+
+    def _execute(self, query):
+        try:
+            return query.execute()
+        except Exception as exc:
+            if self._is_missing_table_error(exc):
+                raise RuntimeError(self._storage_migration_hint()) from exc
+            raise
+
+    def _pointer_state(self, latest_run_id: Optional[str], aggregate: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        aggregate = aggregate or self._empty_aggregate()
+        return {
+            "workspace_type": self.WORKSPACE_TYPE,
+            "storage_version": self.STORAGE_VERSION,
+            "latest_run_id": latest_run_id,
+            "learned_patterns": self._patterns_from_aggregate(aggregate),
+            "pattern_aggregate": aggregate,
+        }
+
+    def _load_inputs(self, user_id: str, workspace_id: str) -> Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+        """Input records, plus their persisted extractions keyed by ``input_id``.
+
+        The extractions are kept apart from the records so they never reach API responses.
+        """
+        response = self._execute(
+            self.client.table(self.INPUTS_TABLE)
+            .select("input_id,record,signal_cache")
+            .eq("workspace_id", workspace_id)
+            .eq("user_id", user_id)
+            .order("created_at", desc=False)
+        )
+        inputs = []
+        signal_caches = {}
+        for row in response.data or []:
+            inputs.append(row.get("record") or {})
+            if row.get("signal_cache"):
+                signal_caches[row["input_id"]] = row["signal_cache"]
+        return inputs, signal_caches
+
+    def _load_runs(self, user_id: str, workspace_id: str) -> List[Dict[str, Any]]:
+        """Runs oldest first, matching the order of the legacy ``deep_research`` array."""
+        response = self._execute(
+            self.client.table(self.RUNS_TABLE)
+            .select("record")
+            .eq("workspace_id", workspace_id)
+            .eq("user_id", user_id)
+            .order("created_at", desc=False)
+        )
+        return [row.get("record") or {} for row in (response.data or [])]
+
+    def _get_run(self, user_id: str, run_id: str) -> Optional[Dict[str, Any]]:
+        response = self._execute(
+            self.client.table(self.RUNS_TABLE)
+            .select("record")
+            .eq("run_id", run_id)
+            .eq("user_id", user_id)
+            .limit(1)
+        )
+        row = (response.data or [None])[0]
+        return (row or {}).get("record") if row else None
+
+    def _run_row(self, user_id: str, workspace_id: str, run_record: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "run_id": run_record["run_id"],
+            "workspace_id": workspace_id,
+            "user_id": user_id,
+            "input_ids": run_record.get("input_ids") or [],
+            "record": run_record,
+            "created_at": run_record.get("created_at") or _utc_now(),
+            "updated_at": _utc_now(),
+        }
+
+    def _input_row(self, user_id: str, workspace_id: str, input_record: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "input_id": input_record["input_id"],
+            "workspace_id": workspace_id,
+            "user_id": user_id,
+            "record": input_record,
+            "created_at": input_record.get("created_at") or _utc_now(),
+            "updated_at": input_record.get("updated_at") or _utc_now(),
+        }
+
+    def _normalize_workspace(
+        self,
+        row: Dict[str, Any],
+        inputs: List[Dict[str, Any]],
+        runs: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
         state = row.get("deck_data") or {}
-        runs = row.get("deep_research") or []
         latest_run_id = state.get("latest_run_id")
         latest_run = None
         if latest_run_id:
             latest_run = next((run for run in runs if run.get("run_id") == latest_run_id), None)
         if not latest_run and runs:
             latest_run = runs[-1]
-            state["latest_run_id"] = latest_run.get("run_id")
+            latest_run_id = latest_run.get("run_id")
         return {
             "workspace_id": row["analysis_id"],
-            "inputs": state.get("inputs") or [],
-            "latest_run_id": state.get("latest_run_id"),
+            "inputs": inputs,
+            "latest_run_id": latest_run_id,
             "latest_run": latest_run,
             "runs": list(reversed(runs)),
             "learned_patterns": state.get("learned_patterns") or self._empty_state()["learned_patterns"],
             "updated_at": row.get("updated_at") or row.get("created_at"),
         }
 
-    def _build_learned_patterns(self, runs: List[Dict[str, Any]]) -> Dict[str, Any]:
-        if not runs:
-            return self._empty_state()["learned_patterns"]
+    def _load_workspace(self, user_id: str, row: Dict[str, Any], runs: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        workspace_id = row["analysis_id"]
+        if runs is None:
+            runs = self._load_runs(user_id, workspace_id)
+        inputs, signal_caches = self._load_inputs(user_id, workspace_id)
+        return {**self._normalize_workspace(row, inputs, runs), "signal_caches": signal_caches}
 
-        objection_counts: Dict[str, int] = {}
-        winning_messages: List[str] = []
-        best_icp = ""
-        best_score = -1
-        strongest_problem = ""
-        last_adaptation = ""
-        winning_pattern_summary = ""
+    def _load_input_summaries(self, user_id: str, workspace_id: str) -> List[Dict[str, Any]]:
+        response = self._execute(
+            self.client.table(self.INPUTS_TABLE)
+            .select(self.INPUT_SUMMARY_COLUMNS)
+            .eq("workspace_id", workspace_id)
+            .eq("user_id", user_id)
+            .order("created_at", desc=False)
+        )
+        return response.data or []
 
-        for run in runs:
-            brief = run.get("decision_brief") or {}
-            outcome = run.get("outcome_log") or run.get("result_log") or {}
-            comparison = run.get("comparison") or {}
-            replies = int(outcome.get("replies") or 0)
-            calls_booked = int(outcome.get("calls_booked") or 0)
-            deals_closed = int(outcome.get("deals_closed") or 0)
-            score = replies + (calls_booked * 3) + (deals_closed * 8)
-            if score > best_score and brief.get("recommended_icp"):
-                best_score = score
-                best_icp = brief.get("recommended_icp") or ""
-                strongest_problem = brief.get("core_problem") or strongest_problem
-                headline = (((brief.get("assets") or {}).get("landing_page_headline")) or "").strip()
-                if headline:
-                    winning_messages = [headline]
-                winning_pattern_summary = (
-                    f"Winning runs concentrated around {best_icp} when the message made the decision output clearer and the core problem was "
-                    f"{strongest_problem}."
-                ).strip()
-
-            objection = (outcome.get("top_objection") or "").strip()
+    def list_runs(
+        self,
+        user_id: str,
+        before: Optional[str] = None,
+        limit: int = RUN_PAGE_SIZE,
+        summary: bool = False,
+        workspace_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Newest-first page of runs; ``summary`` returns snapshots instead of full records."""
+        workspace_id = workspace_id or self._get_or_create_row(user_id)["analysis_id"]
+        limit = max(1, min(int(limit or RUN_PAGE_SIZE), MAX_RUN_PAGE_SIZE))
+        query = (
+            self.client.table(self.RUNS_TABLE)
+            .select(self.RUN_SUMMARY_COLUMNS if summary else "created_at,record")
+            .eq("workspace_id", workspace_id)
+            .eq("user_id", user_id)
+        )
+        if before:
+            query = query.lt("created_at", before)
+        response = self._execute(query.order("created_at", desc=True).limit(limit + 1))
+        rows = response.data or []
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        runs = rows if summary else [item.get("record") or {} for item in rows]
+        return {
+            "runs": runs,
+            "has_more": has_more,
+            "next_before": rows[-1].get("created_at") if rows and has_more else None,
+        }
+
+    def get_workspace_header(self, user_id: str) -> Dict[str, Any]:
+        """Workspace id and ``updated_at`` only, for cheap conditional requests."""
+        row = self._get_or_create_row(user_id)
+        return {"workspace_id": row["analysis_id"], "updated_at": row.get("updated_at") or row.get("created_at")}
+
+    def get_workspace_summary(self, user_id: str, row: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Input excerpts, run snapshots and the full latest run, without raw text or run history."""
+        row = row or self._get_or_create_row(user_id)
+        workspace_id = row["analysis_id"]
+        state = row.get("deck_data") or {}
+        runs_page = self.list_runs(user_id, summary=True, workspace_id=workspace_id)
+        latest_run_id = state.get("latest_run_id") or next((run.get("run_id") for run in runs_page["runs"]), None)
+        return {
+            "workspace_id": workspace_id,
+            "view": "summary",
+            "inputs": self._load_input_summaries(user_id, workspace_id),
+            "latest_run_id": latest_run_id,
+            "latest_run": self._get_run(user_id, latest_run_id) if latest_run_id else None,
+            "runs": runs_page["runs"],
+            "runs_has_more": runs_page["has_more"],
+            "runs_next_before": runs_page["next_before"],
+            "learned_patterns": state.get("learned_patterns") or self._empty_state()["learned_patterns"],
+            "updated_at": row.get("updated_at") or row.get("created_at"),
+        }
+
+    @staticmethod
+    def _run_score(outcome: Dict[str, Any]) -> int:
+        replies = int(outcome.get("replies") or 0)
+        calls_booked = int(outcome.get("calls_booked") or 0)
+        deals_closed = int(outcome.get("deals_closed") or 0)
+        return replies + (calls_booked * 3) + (deals_closed * 8)
+
+    def _empty_aggregate(self) -> Dict[str, Any]:
+        return {
+            "objection_counts": {},
+            "best_score": -1,
+            "best_run_id": None,
+            "best_run_created_at": "",
+            "best_icp": "",
+            "strongest_problem": "",
+            "winning_messages": [],
+            "last_adaptation": "",
+        }
+
+    def _apply_run(
+        self,
+        aggregate: Dict[str, Any],
+        run: Dict[str, Any],
+        previous_outcome: Optional[Dict[str, Any]] = None,
+        is_new: bool = True,
+    ) -> bool:
+        """Fold one run event into ``aggregate`` in place.
+
+        Returns False when the event cannot be applied incrementally (the best run's score
+        dropped) and the caller must rebuild from the full history.
+        """
+        brief = run.get("decision_brief") or {}
+        outcome = run.get("outcome_log") or run.get("result_log") or {}
+        score = self._run_score(outcome)
+        run_id = run.get("run_id")
+        created_at = str(run.get("created_at") or "")
+        is_best = bool(run_id) and run_id == aggregate.get("best_run_id")
+        best_score = int(aggregate.get("best_score", -1))
+        if is_best and score < best_score:
+            return False
+
+        # Ties go to the older run, matching a left-to-right scan over history.
+        takes_lead = score > best_score or (
+            score == best_score and not is_best and created_at and created_at < aggregate.get("best_run_created_at", "")
+        )
+        if brief.get("recommended_icp") and (takes_lead or is_best):
+            aggregate["best_score"] = score
+            aggregate["best_run_id"] = run_id
+            aggregate["best_run_created_at"] = created_at
+            aggregate["best_icp"] = brief.get("recommended_icp") or ""
+            aggregate["strongest_problem"] = brief.get("core_problem") or aggregate.get("strongest_problem", "")
+            headline = (((brief.get("assets") or {}).get("landing_page_headline")) or "").strip()
+            if headline:
+                aggregate["winning_messages"] = [headline]
+
+        counts = aggregate.setdefault("objection_counts", {})
+        previous_objection = ((previous_outcome or {}).get("top_objection") or "").strip()
+        objection = (outcome.get("top_objection") or "").strip()
+        if previous_objection != objection:
+            if previous_objection and counts.get(previous_objection):
+                counts[previous_objection] -= 1
+                if counts[previous_objection] <= 0:
+                    counts.pop(previous_objection)
             if objection:
-                objection_counts[objection] = objection_counts.get(objection, 0) + 1
+                counts[objection] = counts.get(objection, 0) + 1
 
-            next_move = (comparison.get("next_move") or "").strip()
+        if is_new:
+            next_move = ((run.get("comparison") or {}).get("next_move") or "").strip()
             if next_move:
-                last_adaptation = next_move
+                aggregate["last_adaptation"] = next_move
+        return True
 
-        recurring_objections = [
-            objection for objection, _count in sorted(objection_counts.items(), key=lambda item: item[1], reverse=True)[:3]
-        ]
+    def _rebuild_aggregate(self, runs: List[Dict[str, Any]]) -> Dict[str, Any]:
+        aggregate = self._empty_aggregate()
+        for run in runs:
+            self._apply_run(aggregate, run)
+        return aggregate
+
+    def _patterns_from_aggregate(self, aggregate: Dict[str, Any]) -> Dict[str, Any]:
+        counts = aggregate.get("objection_counts") or {}
+        best_icp = aggregate.get("best_icp") or ""
+        strongest_problem = aggregate.get("strongest_problem") or ""
+        winning_pattern_summary = ""
+        if best_icp:
+            winning_pattern_summary = (
+                f"Winning runs concentrated around {best_icp} when the message made the decision output clearer and the core problem was "
+                f"{strongest_problem}."
+            ).strip()
         return {
             "best_icp": best_icp,
-            "recurring_objections": recurring_objections,
-            "winning_messages": winning_messages[:3],
-            "last_adaptation": last_adaptation,
+            "recurring_objections": [
+                objection for objection, _count in sorted(counts.items(), key=lambda item: item[1], reverse=True)[:3]
+            ],
+            "winning_messages": (aggregate.get("winning_messages") or [])[:3],
+            "last_adaptation": aggregate.get("last_adaptation") or "",
             "strongest_problem": strongest_problem,
             "winning_pattern_summary": winning_pattern_summary,
         }
 
-    def get_or_create_workspace(self, user_id: str) -> Dict[str, Any]:
+    def _current_aggregate(self, user_id: str, row: Dict[str, Any]) -> Dict[str, Any]:
+        aggregate = (row.get("deck_data") or {}).get("pattern_aggregate")
+        if isinstance(aggregate, dict):
+            return {**aggregate, "objection_counts": dict(aggregate.get("objection_counts") or {})}
+        return self._rebuild_aggregate(self._load_runs(user_id, row["analysis_id"]))
+
+    def _migrate_legacy_row(self, user_id: str, row: Dict[str, Any]) -> Dict[str, Any]:
+        """Move inputs and runs embedded in the ``analyses`` row into their own tables."""
+        state = row.get("deck_data") or {}
+        workspace_id = row["analysis_id"]
+        inputs = state.get("inputs") or []
+        runs = row.get("deep_research") or []
+        if inputs:
+            self._execute(
+                self.client.table(self.INPUTS_TABLE).upsert(
+                    [self._input_row(user_id, workspace_id, item) for item in inputs if item.get("input_id")],
+                    on_conflict="input_id",
+                )
+            )
+        if runs:
+            self._execute(
+                self.client.table(self.RUNS_TABLE).upsert(
+                    [self._run_row(user_id, workspace_id, run) for run in runs if run.get("run_id")],
+                    on_conflict="run_id",
+                )
+            )
+        return self._update_row(
+            user_id=user_id,
+            workspace_id=workspace_id,
+            payload={
+                "deck_data": self._pointer_state(state.get("latest_run_id"), self._rebuild_aggregate(runs)),
+                "deep_research": [],
+            },
+        )
+
+    def _get_or_create_row(self, user_id: str) -> Dict[str, Any]:
         response = (
             self.client.table("analyses")
-            .select("*")
+            .select("analysis_id,user_id,title,deck_data,created_at,updated_at")
             .eq("user_id", user_id)
             .eq("title", self.WORKSPACE_TITLE)
             .execute()
@@ -129,13 +422,22 @@ class FounderWorkspaceService:
             None,
         )
         if row:
-            return self._normalize_workspace(row)
+            if (row.get("deck_data") or {}).get("storage_version") != self.STORAGE_VERSION:
+                legacy = (
+                    self.client.table("analyses")
+                    .select("*")
+                    .eq("analysis_id", row["analysis_id"])
+                    .eq("user_id", user_id)
+                    .execute()
+                )
+                row = self._migrate_legacy_row(user_id, (legacy.data or [row])[0])
+            return row
 
         insert_payload = {
             "analysis_id": str(uuid.uuid4()),
             "user_id": user_id,
             "title": self.WORKSPACE_TITLE,
-            "deck_data": self._empty_state(),
+            "deck_data": self._pointer_state(None, None),
             "insights": {},
             "memo": {},
             "deep_research": [],
@@ -145,12 +447,16 @@ class FounderWorkspaceService:
         created = (create_response.data or [None])[0]
         if not created:
             raise RuntimeError("Failed to create founder workspace.")
-        return self._normalize_workspace(created)
+        return created
+
+    def get_or_create_workspace(self, user_id: str) -> Dict[str, Any]:
+        row = self._get_or_create_row(user_id)
+        return self._load_workspace(user_id, row)
 
     def _update_row(self, user_id: str, workspace_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
         response = (
             self.client.table("analyses")
-            .update(payload)
+            .update({**payload, "updated_at": _utc_now()})
             .eq("analysis_id", workspace_id)
             .eq("user_id", user_id)
             .execute()
@@ -158,73 +464,124 @@ class FounderWorkspaceService:
         row = (response.data or [None])[0]
         if not row:
             raise RuntimeError("Founder workspace update failed.")
-        return self._normalize_workspace(row)
+        return row
+
+    def _update_row_if_unchanged(
+        self, user_id: str, row: Dict[str, Any], payload: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Update the workspace row only if its ``updated_at`` still matches ``row``; None on conflict."""
+        query = (
+            self.client.table("analyses")
+            .update({**payload, "updated_at": _utc_now()})
+            .eq("analysis_id", row["analysis_id"])
+            .eq("user_id", user_id)
+        )
+        if row.get("updated_at"):
+            query = query.eq("updated_at", row["updated_at"])
+        response = query.execute()
+        return (response.data or [None])[0]
+
+    def _commit_state(
+        self,
+        user_id: str,
+        row: Dict[str, Any],
+        build_payload: Callable[[Dict[str, Any], Dict[str, Any]], Dict[str, Any]],
+        aggregate: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Write ``build_payload(row, aggregate)`` unless another request changed the row first.
+
+        Runs are stored before this is called, so on a conflict the row is re-read and the
+        aggregate rebuilt from the runs table, which already holds both writers' changes. Without
+        ``aggregate`` it is rebuilt up front.
+        """
+        for _attempt in range(WORKSPACE_WRITE_ATTEMPTS):
+            if aggregate is None:
+                aggregate = self._rebuild_aggregate(self._load_runs(user_id, row["analysis_id"]))
+            updated = self._update_row_if_unchanged(user_id, row, build_payload(row, aggregate))
+            if updated:
+                return updated
+            row = self._get_or_create_row(user_id)
+            aggregate = None
+        raise RuntimeError("Founder workspace was updated concurrently. Please retry.")
 
     def save_input(self, user_id: str, input_record: Dict[str, Any]) -> Dict[str, Any]:
-        workspace = self.get_or_create_workspace(user_id)
-        inputs = workspace["inputs"]
-        existing_index = next((index for index, item in enumerate(inputs) if item.get("input_id") == input_record["input_id"]), None)
-        if existing_index is None:
-            inputs.append(input_record)
-        else:
-            inputs[existing_index] = input_record
-        return self._update_row(
-            user_id=user_id,
-            workspace_id=workspace["workspace_id"],
-            payload={
-                "deck_data": {
-                    "workspace_type": self.WORKSPACE_TYPE,
-                    "inputs": inputs,
-                    "latest_run_id": workspace.get("latest_run_id"),
-                    "learned_patterns": workspace.get("learned_patterns") or self._empty_state()["learned_patterns"],
-                },
-                "updated_at": _utc_now(),
+        row = self._get_or_create_row(user_id)
+        workspace_id = row["analysis_id"]
+        self._execute(
+            self.client.table(self.INPUTS_TABLE).upsert(
+                self._input_row(user_id, workspace_id, input_record),
+                on_conflict="input_id",
+            )
+        )
+        row = self._commit_state(
+            user_id,
+            row,
+            lambda current, aggregate: {
+                "deck_data": self._pointer_state((current.get("deck_data") or {}).get("latest_run_id"), aggregate)
             },
+            aggregate=self._current_aggregate(user_id, row),
         )
+        return self.get_workspace_summary(user_id, row)
+
+    def save_input_signal_caches(self, user_id: str, extractions: Dict[str, Dict[str, Any]]) -> None:
+        """Persist per-input LLM extractions so later runs skip unchanged inputs."""
+        for input_id, entry in (extractions or {}).items():
+            self._execute(
+                self.client.table(self.INPUTS_TABLE)
+                .update({"signal_cache": entry})
+                .eq("input_id", input_id)
+                .eq("user_id", user_id)
+            )
 
     def delete_input(self, user_id: str, input_id: str) -> Dict[str, Any]:
-        workspace = self.get_or_create_workspace(user_id)
-        filtered_inputs = [item for item in workspace["inputs"] if item.get("input_id") != input_id]
-        filtered_runs = []
-        for run in workspace["runs"]:
-            if input_id in (run.get("input_ids") or []):
-                run = {**run, "input_ids": [value for value in (run.get("input_ids") or []) if value != input_id]}
-            filtered_runs.append(run)
-        latest_run_id = workspace.get("latest_run_id")
-        if latest_run_id and not any(run.get("run_id") == latest_run_id for run in filtered_runs):
-            latest_run_id = filtered_runs[0].get("run_id") if filtered_runs else None
-        return self._update_row(
-            user_id=user_id,
-            workspace_id=workspace["workspace_id"],
-            payload={
-                "deck_data": {
-                    "workspace_type": self.WORKSPACE_TYPE,
-                    "inputs": filtered_inputs,
-                    "latest_run_id": latest_run_id,
-                    "learned_patterns": self._build_learned_patterns(list(reversed(filtered_runs))),
-                },
-                "deep_research": list(reversed(filtered_runs)),
-                "updated_at": _utc_now(),
+        row = self._get_or_create_row(user_id)
+        workspace_id = row["analysis_id"]
+        self._execute(
+            self.client.table(self.INPUTS_TABLE)
+            .delete()
+            .eq("input_id", input_id)
+            .eq("workspace_id", workspace_id)
+            .eq("user_id", user_id)
+        )
+        affected = self._execute(
+            self.client.table(self.RUNS_TABLE)
+            .select("run_id,record")
+            .eq("workspace_id", workspace_id)
+            .eq("user_id", user_id)
+            .contains("input_ids", [input_id])
+        )
+        for run_row in affected.data or []:
+            run = run_row.get("record") or {}
+            input_ids = [value for value in (run.get("input_ids") or []) if value != input_id]
+            self._execute(
+                self.client.table(self.RUNS_TABLE)
+                .update({"input_ids": input_ids, "record": {**run, "input_ids": input_ids}, "updated_at": _utc_now()})
+                .eq("run_id", run_row["run_id"])
+                .eq("user_id", user_id)
+            )
+        row = self._commit_state(
+            user_id,
+            row,
+            lambda current, aggregate: {
+                "deck_data": self._pointer_state((current.get("deck_data") or {}).get("latest_run_id"), aggregate)
             },
         )
+        return self.get_workspace_summary(user_id, row)
 
     def save_run(self, user_id: str, run_record: Dict[str, Any]) -> Dict[str, Any]:
-        workspace = self.get_or_create_workspace(user_id)
-        runs = list(reversed(workspace["runs"]))
-        runs.append(run_record)
-        learned_patterns = self._build_learned_patterns(runs)
+        row = self._get_or_create_row(user_id)
+        workspace_id = row["analysis_id"]
+        self._execute(self.client.table(self.RUNS_TABLE).insert(self._run_row(user_id, workspace_id, run_record)))
+        aggregate = self._current_aggregate(user_id, row)
+        if (row.get("deck_data") or {}).get("pattern_aggregate") is not None:
+            self._apply_run(aggregate, run_record)
         brief = run_record.get("decision_brief") or {}
         signal_quality = run_record.get("signal_quality") or {}
-        return self._update_row(
-            user_id=user_id,
-            workspace_id=workspace["workspace_id"],
-            payload={
-                "deck_data": {
-                    "workspace_type": self.WORKSPACE_TYPE,
-                    "inputs": workspace["inputs"],
-                    "latest_run_id": run_record.get("run_id"),
-                    "learned_patterns": learned_patterns,
-                },
+
+        def build_payload(_current: Dict[str, Any], aggregate: Dict[str, Any]) -> Dict[str, Any]:
+            learned_patterns = self._patterns_from_aggregate(aggregate)
+            return {
+                "deck_data": self._pointer_state(run_record.get("run_id"), aggregate),
                 "insights": {
                     "recommended_icp": brief.get("recommended_icp"),
                     "confidence_score": brief.get("confidence_score") or signal_quality.get("score"),
@@ -236,43 +593,46 @@ class FounderWorkspaceService:
                     "insufficient_signal": signal_quality.get("insufficient_signal", False),
                 },
                 "memo": brief,
-                "deep_research": runs,
-                "updated_at": _utc_now(),
-            },
-        )
+            }
+
+        row = self._commit_state(user_id, row, build_payload, aggregate=aggregate)
+        return self.get_workspace_summary(user_id, row)
 
     def log_run_result(self, user_id: str, run_id: str, result_log: Dict[str, Any]) -> Dict[str, Any]:
-        workspace = self.get_or_create_workspace(user_id)
-        runs = list(reversed(workspace["runs"]))
-        updated = False
-        for index, run in enumerate(runs):
-            if run.get("run_id") == run_id:
-                runs[index] = {
-                    **run,
-                    "outcome_log": {
-                        **(run.get("outcome_log") or run.get("result_log") or {}),
-                        **result_log,
-                        "logged_at": _utc_now(),
-                    },
-                }
-                updated = True
-                break
-        if not updated:
+        row = self._get_or_create_row(user_id)
+        workspace_id = row["analysis_id"]
+        run = self._get_run(user_id, run_id)
+        if not run:
             raise KeyError("run_not_found")
-        learned_patterns = self._build_learned_patterns(runs)
-        latest_run = next((run for run in runs if run.get("run_id") == workspace.get("latest_run_id")), runs[-1] if runs else {})
-        latest_brief = (latest_run or {}).get("decision_brief") or {}
-        return self._update_row(
-            user_id=user_id,
-            workspace_id=workspace["workspace_id"],
-            payload={
-                "deck_data": {
-                    "workspace_type": self.WORKSPACE_TYPE,
-                    "inputs": workspace["inputs"],
-                    "latest_run_id": workspace.get("latest_run_id"),
-                    "learned_patterns": learned_patterns,
-                },
-                "deep_research": runs,
+        previous_outcome = run.get("outcome_log") or run.get("result_log") or {}
+        run = {
+            **run,
+            "outcome_log": {
+                **previous_outcome,
+                **result_log,
+                "logged_at": _utc_now(),
+            },
+        }
+        self._execute(
+            self.client.table(self.RUNS_TABLE)
+            .update({"record": run, "updated_at": _utc_now()})
+            .eq("run_id", run_id)
+            .eq("user_id", user_id)
+        )
+        state = row.get("deck_data") or {}
+        aggregate = self._current_aggregate(user_id, row)
+        if state.get("pattern_aggregate") is not None and not self._apply_run(
+            aggregate, run, previous_outcome=previous_outcome, is_new=False
+        ):
+            aggregate = self._rebuild_aggregate(self._load_runs(user_id, workspace_id))
+
+        def build_payload(current: Dict[str, Any], aggregate: Dict[str, Any]) -> Dict[str, Any]:
+            learned_patterns = self._patterns_from_aggregate(aggregate)
+            latest_run_id = (current.get("deck_data") or {}).get("latest_run_id")
+            latest_run = run if latest_run_id in (None, run_id) else self._get_run(user_id, latest_run_id)
+            latest_brief = (latest_run or {}).get("decision_brief") or {}
+            return {
+                "deck_data": self._pointer_state(latest_run_id, aggregate),
                 "insights": {
                     "recommended_icp": latest_brief.get("recommended_icp"),
                     "confidence_score": latest_brief.get("confidence_score"),
@@ -281,6 +641,7 @@ class FounderWorkspaceService:
                     "best_icp": learned_patterns.get("best_icp"),
                     "recurring_objections": learned_patterns.get("recurring_objections"),
                 },
-                "updated_at": _utc_now(),
-            },
-        )
+            }
+
+        row = self._commit_state(user_id, row, build_payload, aggregate=aggregate)
+        return self.get_workspace_summary(user_id, row)
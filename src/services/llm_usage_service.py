@@ -0,0 +1,285 @@
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+USAGE_FLUSH_INTERVAL_SECONDS = 60.0
+# While the usage table is missing, flushes back off exponentially up to this interval.
+MAX_USAGE_BACKOFF_SECONDS = 3600.0
+USAGE_TABLE = "llm_usage"
+MAX_USAGE_KEYS = 5000
+OVERFLOW_USER = "other"
+SYSTEM_USER = "system"
+GROUP_FIELDS = ("user_id", "route", "model", "site")
+# USD per million (input, output) tokens at Groq list prices; override with HATCHUP_LLM_PRICES,
+# e.g. '{"openai/gpt-oss-20b": [0.075, 0.30]}'. Unknown models are counted at zero cost.
+DEFAULT_MODEL_PRICES: Dict[str, Tuple[float, float]] = {
+    "openai/gpt-oss-20b": (0.075, 0.30),
+    "openai/gpt-oss-120b": (0.15, 0.60),
+    "llama-3.3-70b-versatile": (0.59, 0.79),
+    "llama-3.1-8b-instant": (0.05, 0.08),
+}
+
+
+def _utc_now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+@lru_cache(maxsize=1)
+def model_prices() -> Dict[str, Tuple[float, float]]:
+    prices = dict(DEFAULT_MODEL_PRICES)
+    raw = (os.environ.get("HATCHUP_LLM_PRICES") or "").strip()
+    if raw:
+        try:
+            prices.update({str(model): (float(value[0]), float(value[1])) for model, value in json.loads(raw).items()})
+        except Exception:
+            logger.warning("ignoring malformed HATCHUP_LLM_PRICES", exc_info=True)
+    return prices
+
+
+def estimate_cost_usd(model: str, input_tokens: int, output_tokens: int) -> float:
+    input_price, output_price = model_prices().get(model, (0.0, 0.0))
+    return (input_tokens * input_price + output_tokens * output_price) / 1_000_000
+
+
+def _empty_totals() -> Dict[str, float]:
+    return {"calls": 0, "estimated_calls": 0, "input_tokens": 0, "output_tokens": 0, "cost_usd": 0.0}
+
+
+class UsageTableMissing(RuntimeError):
+    """The usage table does not exist; retrying every flush interval will not help."""
+
+
+class SupabaseUsageSink:
+    """Append flushed usage rows to the ``llm_usage`` table, one row per key and flush period."""
+
+    # Usage rows are written to:
+    #   CREATE TABLE IF NOT EXISTS public.llm_usage (
+    #       id bigint GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    #       user_id text NOT NULL,
+    #       route text NOT NULL,
+    #       model text NOT NULL,
+    #       site text NOT NULL,
+    #       calls integer NOT NULL DEFAULT 0,
+    #       estimated_calls integer NOT NULL DEFAULT 0,
+    #       input_tokens bigint NOT NULL DEFAULT 0,
+    #       output_tokens bigint NOT NULL DEFAULT 0,
+    #       cost_usd numeric(14, 6) NOT NULL DEFAULT 0,
+    #       period_start timestamptz NOT NULL,
+    #       period_end timestamptz NOT NULL
+    #   );
+    #   CREATE INDEX IF NOT EXISTS llm_usage_user_period_idx ON public.llm_usage (user_id, period_start);
+
+    def __init__(self) -> None:
+        try:
+            from supabase import create_client
+        except Exception as exc:
+            raise RuntimeError("Supabase client is not installed. Add `supabase` to dependencies.") from exc
+
+        supabase_url = os.environ.get("SUPABASE_URL")
+        supabase_key = os.environ.get("SUPABASE_SERVICE_ROLE_KEY") or os.environ.get("SUPABASE_ANON_KEY")
+        if not supabase_url or not supabase_key:
+            raise RuntimeError("Supabase is not configured. Set SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY or SUPABASE_ANON_KEY.")
+        self.client = create_client(supabase_url, supabase_key)
+
+    @staticmethod
+    def _is_missing_table_error(exc: Exception) -> bool:
+        message = str(exc).lower()
+        return USAGE_TABLE in message and (
+            "pgrst205" in message or "does not exist" in message or "could not find the table" in message
+        )
+
+    def write(self, rows: List[Dict[str, Any]]) -> None:
+        try:
+            self.client.table(USAGE_TABLE).insert(rows).execute()
+        except Exception as exc:
+            if self._is_missing_table_error(exc):
+                raise UsageTableMissing(
+                    f"Table public.{USAGE_TABLE} is missing; create it with the DDL on SupabaseUsageSink."
+                ) from exc
+            raise
+
+
+class LocalUsageSink:
+    """Append flushed usage rows to a JSON Lines file."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def write(self, rows: List[Dict[str, Any]]) -> None:
+        with open(self.path, "a", encoding="utf-8") as handle:
+            for row in rows:
+                handle.write(json.dumps(row, ensure_ascii=True) + "\n")
+
+
+class LLMUsageLedger:
+    """Token and cost totals per ``(user_id, route, model, site)`` since the process started.
+
+    Usage recorded since the last flush is also kept as a delta and written to ``sink`` from a
+    background thread every ``flush_interval`` seconds; without a sink the ledger is memory-only.
+    """
+
+    def __init__(self, sink: Any = None, flush_interval: float = USAGE_FLUSH_INTERVAL_SECONDS, max_keys: int = MAX_USAGE_KEYS) -> None:
+        self.sink = sink
+        self.flush_interval = flush_interval
+        self.max_keys = max_keys
+        self._totals: Dict[Tuple[str, str, str, str], Dict[str, float]] = {}
+        self._pending: Dict[Tuple[str, str, str, str], Dict[str, float]] = {}
+        self._pending_since = _utc_now()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._missing_table_failures = 0
+        self._next_flush_at = 0.0
+        self.last_flush: Dict[str, Any] = {"at": None, "rows": 0, "error": None}
+
+    def start(self) -> None:
+        if self.sink is None:
+            return
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="llm-usage-flush", daemon=True)
+            self._thread.start()
+
+    def record(
+        self,
+        *,
+        user_id: Optional[str],
+        route: Optional[str],
+        model: Optional[str],
+        site: str,
+        input_tokens: int,
+        output_tokens: int,
+        estimated: bool = False,
+    ) -> None:
+        key = (user_id or SYSTEM_USER, route or "background", model or "unknown", site)
+        cost = estimate_cost_usd(key[2], input_tokens, output_tokens)
+        with self._lock:
+            if key not in self._totals and len(self._totals) >= self.max_keys:
+                key = (OVERFLOW_USER, *key[1:])
+            for bucket in (self._totals, self._pending):
+                totals = bucket.setdefault(key, _empty_totals())
+                totals["calls"] += 1
+                totals["estimated_calls"] += 1 if estimated else 0
+                totals["input_tokens"] += input_tokens
+                totals["output_tokens"] += output_tokens
+                totals["cost_usd"] += cost
+        self.start()
+
+    def _grouped(self, group_by: Sequence[str], user_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        indexes = [GROUP_FIELDS.index(field) for field in group_by]
+        grouped: Dict[Tuple[str, ...], Dict[str, float]] = {}
+        with self._lock:
+            items = [(key, dict(totals)) for key, totals in self._totals.items()]
+        for key, totals in items:
+            if user_id and key[0] != user_id:
+                continue
+            group = tuple(key[index] for index in indexes)
+            target = grouped.setdefault(group, _empty_totals())
+            for field, value in totals.items():
+                target[field] += value
+        rows = [{**dict(zip(group_by, group)), **totals} for group, totals in grouped.items()]
+        for row in rows:
+            row["cost_usd"] = round(row["cost_usd"], 6)
+        return sorted(rows, key=lambda row: (row["cost_usd"], row["input_tokens"] + row["output_tokens"]), reverse=True)
+
+    def snapshot(self, group_by: Sequence[str] = GROUP_FIELDS, user_id: Optional[str] = None, limit: int = 100) -> Dict[str, Any]:
+        fields = [field for field in GROUP_FIELDS if field in set(group_by)] or list(GROUP_FIELDS)
+        rows = self._grouped(fields, user_id=user_id)
+        totals = _empty_totals()
+        for row in rows:
+            for field in totals:
+                totals[field] += row[field]
+        totals["cost_usd"] = round(totals["cost_usd"], 6)
+        return {"group_by": fields, "totals": totals, "rows": rows[: max(1, limit)], "last_flush": dict(self.last_flush)}
+
+    def user_totals(self, user_id: str) -> Dict[str, float]:
+        rows = self._grouped(("user_id",), user_id=user_id)
+        return rows[0] if rows else {"user_id": user_id, **_empty_totals()}
+
+    def flush(self) -> int:
+        """Write usage recorded since the last flush to the sink; on failure it is kept for the next one."""
+        if self.sink is None:
+            return 0
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+                period_start, self._pending_since = self._pending_since, _utc_now()
+            if not pending:
+                return 0
+            period_end = _utc_now()
+            rows = [
+                {
+                    **dict(zip(GROUP_FIELDS, key)),
+                    **totals,
+                    "cost_usd": round(totals["cost_usd"], 6),
+                    "period_start": period_start,
+                    "period_end": period_end,
+                }
+                for key, totals in pending.items()
+            ]
+            try:
+                self.sink.write(rows)
+            except Exception as exc:
+                if isinstance(exc, UsageTableMissing):
+                    # Log once and back off instead of failing the same insert every interval.
+                    if not self._missing_table_failures:
+                        logger.error("llm usage flush failed: %s", exc)
+                    self._missing_table_failures += 1
+                    backoff = min(self.flush_interval * 2 ** self._missing_table_failures, MAX_USAGE_BACKOFF_SECONDS)
+                    self._next_flush_at = time.monotonic() + backoff
+                else:
+                    logger.exception("llm usage flush failed; keeping %s rows for the next flush", len(rows))
+                with self._lock:
+                    for key, totals in pending.items():
+                        target = self._pending.setdefault(key, _empty_totals())
+                        for field, value in totals.items():
+                            target[field] += value
+                    self._pending_since = period_start
+                self.last_flush = {"at": period_end, "rows": 0, "error": str(exc) or exc.__class__.__name__}
+                return 0
+            self._missing_table_failures = 0
+            self._next_flush_at = 0.0
+            self.last_flush = {"at": period_end, "rows": len(rows), "error": None}
+            return len(rows)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            if time.monotonic() >= self._next_flush_at:
+                self.flush()
+
+    def stop(self) -> None:
+        self._stop.set()
+        thread = self._thread
+        if thread and thread.is_alive():
+            thread.join(self.flush_interval)
+        self.flush()
+
+
+def _build_sink() -> Any:
+    """``HATCHUP_LLM_USAGE_STORE`` is ``supabase``, a JSON Lines file path, or unset for memory only."""
+    store = (os.environ.get("HATCHUP_LLM_USAGE_STORE") or "").strip()
+    if not store:
+        return None
+    if store.lower() == "supabase":
+        try:
+            return SupabaseUsageSink()
+        except RuntimeError:
+            logger.warning("llm usage store unavailable; keeping usage in memory only", exc_info=True)
+            return None
+    return LocalUsageSink(store)
+
+
+@lru_cache(maxsize=1)
+def get_llm_usage_ledger() -> LLMUsageLedger:
+    interval = float(os.environ.get("HATCHUP_LLM_USAGE_FLUSH_SECONDS") or USAGE_FLUSH_INTERVAL_SECONDS)
+    return LLMUsageLedger(sink=_build_sink(), flush_interval=interval)
@@ -0,0 +1,136 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Awaitable, Dict, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+JOB_TTL_SECONDS = 3600
+MAX_JOBS = 500
+EVENT_KEEPALIVE_SECONDS = 15.0
+TERMINAL_STATUSES = {"completed", "failed"}
+
+
+def _utc_now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class RevenueWedgeJobRegistry:
+    """In-process registry of background Revenue Wedge runs and their progress events.
+
+    Jobs live in memory on the worker that started them and expire after ``JOB_TTL_SECONDS``;
+    the finished run itself is persisted by ``FounderWorkspaceService``.
+    """
+
+    def __init__(self, ttl_seconds: int = JOB_TTL_SECONDS, max_jobs: int = MAX_JOBS) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_jobs = max_jobs
+        self._jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._signals: Dict[str, asyncio.Event] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    def _prune(self) -> None:
+        """Drop expired finished jobs, then the oldest finished ones while over ``max_jobs``.
+
+        Queued and running jobs are never evicted: their tasks still report progress and clients
+        are still polling them. Admission control bounds how many of those can exist.
+        """
+        cutoff = time.monotonic() - self.ttl_seconds
+        finished = [run_id for run_id, job in self._jobs.items() if job["status"] in TERMINAL_STATUSES]
+        overflow = len(self._jobs) - self.max_jobs
+        for run_id in finished:
+            if self._jobs[run_id]["_touched"] >= cutoff and overflow <= 0:
+                continue
+            self._jobs.pop(run_id, None)
+            self._signals.pop(run_id, None)
+            overflow -= 1
+
+    def create(self, user_id: str, run_id: str, fingerprint: Optional[str] = None) -> Dict[str, Any]:
+        self._prune()
+        now = _utc_now()
+        self._jobs[run_id] = {
+            "run_id": run_id,
+            "user_id": user_id,
+            "_fingerprint": fingerprint,
+            "status": "queued",
+            "stage": "queued",
+            "events": [{"stage": "queued", "at": now}],
+            "error": None,
+            "created_at": now,
+            "updated_at": now,
+            "_touched": time.monotonic(),
+        }
+        self._signals[run_id] = asyncio.Event()
+        return self.snapshot(run_id)
+
+    def update(self, run_id: str, stage: str, status: Optional[str] = None, error: Optional[str] = None) -> None:
+        job = self._jobs.get(run_id)
+        if job is None:
+            return
+        now = _utc_now()
+        job["stage"] = stage
+        job["status"] = status or ("running" if stage not in TERMINAL_STATUSES else stage)
+        job["error"] = error
+        job["updated_at"] = now
+        job["_touched"] = time.monotonic()
+        job["events"].append({"stage": stage, "at": now, **({"error": error} if error else {})})
+        # Wake every waiting stream, then arm a fresh event for the next update.
+        signal = self._signals.get(run_id)
+        if signal is not None:
+            signal.set()
+        self._signals[run_id] = asyncio.Event()
+
+    def snapshot(self, run_id: str) -> Dict[str, Any]:
+        job = self._jobs[run_id]
+        return {key: (list(value) if key == "events" else value) for key, value in job.items() if not key.startswith("_")}
+
+    def get(self, user_id: str, run_id: str) -> Optional[Dict[str, Any]]:
+        job = self._jobs.get(run_id)
+        if job is None or job["user_id"] != user_id:
+            return None
+        return self.snapshot(run_id)
+
+    def find_active(self, user_id: str, fingerprint: str) -> Optional[Dict[str, Any]]:
+        """Snapshot of this user's unfinished job started from the same request, if any."""
+        for run_id, job in self._jobs.items():
+            if job["user_id"] == user_id and job["_fingerprint"] == fingerprint and job["status"] not in TERMINAL_STATUSES:
+                return self.snapshot(run_id)
+        return None
+
+    def start(self, run_id: str, work: Awaitable[Any]) -> asyncio.Task:
+        async def runner():
+            try:
+                await work
+            except Exception as exc:
+                logger.exception("revenue wedge job %s failed", run_id)
+                self.update(run_id, "failed", error=str(exc) or exc.__class__.__name__)
+            else:
+                self.update(run_id, "completed")
+
+        task = asyncio.create_task(runner())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def stream(self, user_id: str, run_id: str) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """Yield each progress event once, ending after a terminal one; ``None`` is a keepalive tick."""
+        sent = 0
+        while True:
+            job = self._jobs.get(run_id)
+            if job is None or job["user_id"] != user_id:
+                return
+            signal = self._signals.get(run_id)
+            events = job["events"]
+            while sent < len(events):
+                yield {**events[sent], "run_id": run_id}
+                sent += 1
+            if job["status"] in TERMINAL_STATUSES:
+                return
+            if signal is None:
+                return
+            try:
+                await asyncio.wait_for(signal.wait(), timeout=EVENT_KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                yield None
@@ -5,15 +5,20 @@ import re
 import threading
 import time
 from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
 
 import requests
-from langchain_core.output_parsers import PydanticOutputParser
-from langchain_core.prompts import ChatPromptTemplate
 from pydantic import BaseModel, Field
 
+from src.circuit_breaker import CircuitOpenError, check_circuit, is_failure
+from src.deadlines import call_timeout
 from src.env_utils import normalize_secret
+from src.metrics import cache_events, error_outcome, record_provider_outcome, track_llm_call
 from src.talent_scout_models import InstagramEnrichment, TalentProfile, TalentScoutResponse, TalentSignals
 
+# Share circuit breakers (and metric labels) with the chat router's calls to the same providers.
+PROVIDER_HOSTS = {"api.github.com": "github", "api.twitter.com": "x", "api.x.com": "x"}
+
 
 class _LLMTalentAnalysis(BaseModel):
     inferred_role: str = Field(default="Unknown")
@@ -32,11 +37,15 @@ class _TTLCache:
         with self._lock:
             entry = self._data.get(key)
             if not entry:
+                cache_events.inc(cache="talent_scout", event="miss")
                 return None
             expires_at, value = entry
             if now > expires_at:
                 self._data.pop(key, None)
+                cache_events.inc(cache="talent_scout", event="eviction")
+                cache_events.inc(cache="talent_scout", event="miss")
                 return None
+            cache_events.inc(cache="talent_scout", event="hit")
             return value
 
     def set(self, key: str, value: Dict[str, Any]) -> None:
@@ -133,17 +142,36 @@ class TalentScoutService:
         timeout: int = 20,
     ) -> Any:
         last_error: Optional[Exception] = None
+        hostname = urlparse(url).hostname or "unknown"
+        provider = PROVIDER_HOSTS.get(hostname, hostname)
         for attempt in range(3):
+            # Checked before every attempt so a provider that trips, or a request that runs out of
+            # budget, mid-retry stops being retried.
+            request_timeout = call_timeout(timeout)
+            try:
+                breaker = check_circuit(provider)
+            except CircuitOpenError as exc:
+                raise RuntimeError(str(exc)) from exc
             try:
-                response = self.session.request(method, url, headers=headers, params=params, timeout=timeout)
+                response = self.session.request(method, url, headers=headers, params=params, timeout=request_timeout)
                 if response.status_code == 429:
+                    breaker.record_failure()
+                    record_provider_outcome(provider, "rate_limited")
                     retry_after = response.headers.get("Retry-After")
                     delay = min(5, int(retry_after)) if retry_after and retry_after.isdigit() else attempt + 1
                     time.sleep(delay)
                     continue
                 response.raise_for_status()
-                return response.json()
+                payload = response.json()
+                breaker.record_success()
+                record_provider_outcome(provider, "ok")
+                return payload
             except Exception as exc:
+                if is_failure(exc):
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+                record_provider_outcome(provider, error_outcome(exc))
                 last_error = exc
                 if attempt < 2:
                     time.sleep(attempt + 1)
@@ -532,6 +560,9 @@ class TalentScoutService:
                     model_name=self.groq_model_name,
                     groq_api_key=self.groq_api_key,
                 )
+            from langchain_core.output_parsers import PydanticOutputParser
+            from langchain_core.prompts import ChatPromptTemplate
+
             parser = PydanticOutputParser(pydantic_object=_LLMTalentAnalysis)
             prompt = ChatPromptTemplate.from_messages(
                 [
@@ -548,7 +579,11 @@ class TalentScoutService:
                 ]
             )
             chain = prompt | self._llm | parser
-            return chain.invoke({"profile": profile_text, "format_instructions": parser.get_format_instructions()})
+            with track_llm_call("talent_scout") as llm_config:
+                return chain.invoke(
+                    {"profile": profile_text, "format_instructions": parser.get_format_instructions()},
+                    config=llm_config,
+                )
         except Exception:
             return self._heuristic_analysis(candidate, role, instagram)
 
@@ -5,11 +5,14 @@ from datetime import datetime, timezone
 from functools import lru_cache
 from typing import Dict, Optional
 
+from src.instrumentation import instrument_methods
+
 
 def _utc_now() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+@instrument_methods("db")
 class UserService:
     def __init__(self) -> None:
         try:
@@ -0,0 +1,66 @@
+from functools import lru_cache
+from typing import List
+
+
+@lru_cache(maxsize=1)
+def _get_encoder():
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        return None
+
+
+def count_tokens(text: str) -> int:
+    encoder = _get_encoder()
+    if encoder is None:
+        return max(1, len(text or "") // 4)
+    return len(encoder.encode(text or "", disallowed_special=()))
+
+
+def clip_to_tokens(text: str, max_tokens: int) -> str:
+    value = text or ""
+    if max_tokens <= 0:
+        return ""
+    if count_tokens(value) <= max_tokens:
+        return value
+    encoder = _get_encoder()
+    if encoder is None:
+        return value[: max_tokens * 4].rstrip() + " ..."
+    return encoder.decode(encoder.encode(value, disallowed_special=())[:max_tokens]).rstrip() + " ..."
+
+
+def split_to_token_chunks(text: str, max_tokens: int) -> List[str]:
+    """Split ``text`` on line boundaries into pieces of at most ``max_tokens`` tokens."""
+    value = (text or "").strip()
+    if not value:
+        return []
+    if count_tokens(value) <= max_tokens:
+        return [value]
+    chunks: List[str] = []
+    current: List[str] = []
+    used = 0
+    for line in value.splitlines():
+        cost = count_tokens(line) + 1
+        if cost > max_tokens:
+            # A single oversized line (CSV blobs, pasted transcripts) is cut by tokens.
+            if current:
+                chunks.append("\n".join(current))
+                current, used = [], 0
+            encoder = _get_encoder()
+            if encoder is None:
+                step = max_tokens * 4
+                chunks.extend(line[index:index + step] for index in range(0, len(line), step))
+            else:
+                tokens = encoder.encode(line, disallowed_special=())
+                chunks.extend(encoder.decode(tokens[index:index + max_tokens]) for index in range(0, len(tokens), max_tokens))
+            continue
+        if current and used + cost > max_tokens:
+            chunks.append("\n".join(current))
+            current, used = [], 0
+        current.append(line)
+        used += cost
+    if current:
+        chunks.append("\n".join(current))
+    return [chunk for chunk in chunks if chunk.strip()]
@@ -5,6 +5,9 @@ let chatHistory = [];
 let currentChatId = "";
 let activeUserId = "";
 let isSending = false;
+let historyCursor = "";
+let hasOlderHistory = false;
+let isLoadingOlder = false;
 
 const DEFAULT_ASSISTANT_TEXT = "Hi! I am HatchUp Chat. Ask about markets, trends, or startups and I will pull live context.";
 
@@ -30,6 +33,8 @@ function renderDefaultAssistantMessage() {
 function clearLocalChatState() {
     chatHistory = [];
     currentChatId = "";
+    historyCursor = "";
+    hasOlderHistory = false;
     renderDefaultAssistantMessage();
 }
 
@@ -40,10 +45,13 @@ function setComposerEnabled(enabled) {
     });
 }
 
-async function loadServerHistory(chatId) {
-    if (!messagesDiv) return;
-    const query = chatId ? `?chat_id=${encodeURIComponent(chatId)}` : "";
-    const res = await fetch(`/api/chat/hatchup/history${query}`, {
+async function fetchHistoryPage(params) {
+    const query = new URLSearchParams();
+    Object.entries(params || {}).forEach(([key, value]) => {
+        if (value) query.set(key, value);
+    });
+    const suffix = query.toString() ? `?${query.toString()}` : "";
+    const res = await fetch(`/api/chat/hatchup/history${suffix}`, {
         method: "GET",
         headers: window.getHatchupSessionHeaders ? window.getHatchupSessionHeaders() : {},
         credentials: "same-origin",
@@ -51,11 +59,19 @@ async function loadServerHistory(chatId) {
     });
     if (!res.ok) throw new Error(await res.text());
     const data = await res.json();
-    currentChatId = data && data.chat_id ? String(data.chat_id) : "";
     if (data && data.storage_warning) {
         console.warn(data.storage_warning);
     }
-    const messages = Array.isArray(data && data.messages) ? data.messages : [];
+    return data || {};
+}
+
+async function loadServerHistory(chatId) {
+    if (!messagesDiv) return;
+    const data = await fetchHistoryPage({ chat_id: chatId });
+    currentChatId = data.chat_id ? String(data.chat_id) : "";
+    const messages = Array.isArray(data.messages) ? data.messages : [];
+    historyCursor = data.before ? String(data.before) : "";
+    hasOlderHistory = Boolean(data.has_more);
 
     messagesDiv.innerHTML = "";
     chatHistory = [];
@@ -64,10 +80,30 @@ async function loadServerHistory(chatId) {
         return;
     }
     messages.forEach((msg) => {
-        appendMessage(msg.role, msg.content, false);
+        appendMessage(msg.role, msg.content, false, msg.id);
     });
 }
 
+async function loadOlderHistory() {
+    if (!messagesDiv || isLoadingOlder || !hasOlderHistory || !currentChatId || !historyCursor) return;
+    isLoadingOlder = true;
+    try {
+        const data = await fetchHistoryPage({ chat_id: currentChatId, before: historyCursor });
+        const messages = Array.isArray(data.messages) ? data.messages : [];
+        historyCursor = data.before ? String(data.before) : historyCursor;
+        hasOlderHistory = Boolean(data.has_more) && messages.length > 0;
+        const previousHeight = messagesDiv.scrollHeight;
+        messages.slice().reverse().forEach((msg) => {
+            prependMessage(msg.role, msg.content, msg.id);
+        });
+        messagesDiv.scrollTop = messagesDiv.scrollHeight - previousHeight;
+    } catch (error) {
+        console.error("Failed to load older chat history", error);
+    } finally {
+        isLoadingOlder = false;
+    }
+}
+
 async function bootstrapChatForCurrentUser() {
     if (!window.waitForAuthReady) return;
     await window.waitForAuthReady();
@@ -100,6 +136,8 @@ window.sendMessage = async function () {
     setComposerEnabled(false);
     input.value = "";
     appendMessage("user", text);
+    // Kept by reference so the stored id can be attached once the server has assigned it.
+    const userEntry = chatHistory[chatHistory.length - 1];
     const thinkingId = appendMessage("assistant", "Thinking (Checking Live Tools)...", true);
 
     try {
@@ -124,7 +162,10 @@ window.sendMessage = async function () {
 
         const thinkingEl = document.getElementById(thinkingId);
         if (thinkingEl) thinkingEl.remove();
-        appendMessage("assistant", data.response);
+        if (data && data.user_message_id) {
+            userEntry.id = String(data.user_message_id);
+        }
+        appendMessage("assistant", data.response, false, data.assistant_message_id);
     } catch (err) {
         const thinkingEl = document.getElementById(thinkingId);
         if (thinkingEl) {
@@ -141,10 +182,12 @@ window.clearChat = function () {
     if (!confirm("Start a new chat session?")) return;
     chatHistory = [];
     currentChatId = crypto.randomUUID();
+    historyCursor = "";
+    hasOlderHistory = false;
     renderDefaultAssistantMessage();
 };
 
-function appendMessage(role, content, isTemporary = false) {
+function appendMessage(role, content, isTemporary = false, messageId = null) {
     const div = document.createElement("div");
     div.className = `message msg-${role}`;
     div.innerHTML = marked.parse(content || "");
@@ -153,11 +196,20 @@ function appendMessage(role, content, isTemporary = false) {
     messagesDiv.appendChild(div);
     messagesDiv.scrollTop = messagesDiv.scrollHeight;
     if (!isTemporary) {
-        chatHistory.push({ role, content });
+        chatHistory.push(messageId ? { id: String(messageId), role, content } : { role, content });
     }
     return id;
 }
 
+function prependMessage(role, content, messageId = null) {
+    const div = document.createElement("div");
+    div.className = `message msg-${role}`;
+    div.innerHTML = marked.parse(content || "");
+    div.id = `msg-${Date.now()}-${Math.random()}`;
+    messagesDiv.insertBefore(div, messagesDiv.firstChild);
+    chatHistory.unshift(messageId ? { id: String(messageId), role, content } : { role, content });
+}
+
 window.addEventListener("hatchup:authchange", (event) => {
     const detail = event && event.detail ? event.detail : {};
     const currentUser = detail.currentUser || null;
@@ -177,6 +229,11 @@ window.addEventListener("hatchup:authchange", (event) => {
 window.addEventListener("DOMContentLoaded", () => {
     renderDefaultAssistantMessage();
     setComposerEnabled(false);
+    if (messagesDiv) {
+        messagesDiv.addEventListener("scroll", () => {
+            if (messagesDiv.scrollTop <= 0) void loadOlderHistory();
+        });
+    }
     void bootstrapChatForCurrentUser().catch((error) => {
         console.error("Failed to bootstrap chat history", error);
     });
@@ -1,6 +1,10 @@
 (function () {
+    const WORKSPACE_POLL_MS = 30000;
     const state = {
         workspace: null,
+        etag: "",
+        olderRuns: [],
+        loadingOlderRuns: false,
         loading: false,
         savingInput: false,
         running: false,
@@ -274,8 +278,12 @@ ${escapeHtml((brief.assets || {}).landing_page_cta || "")}</pre>
             return;
         }
 
-        runsEl.innerHTML = runs.map((run) => {
-            const brief = run.decision_brief || {};
+        const allRuns = runs.concat(state.olderRuns);
+        const hasMore = state.olderRuns.length ? state.olderRunsHasMore : Boolean(state.workspace && state.workspace.runs_has_more);
+        runsEl.innerHTML = allRuns.map((run) => {
+            // Summary responses carry the run snapshot; paged run history carries the full brief.
+            const brief = run.decision_brief || run.snapshot || {};
+            const firstAction = (brief.this_week_execution || brief.actions || [])[0];
             const resultLog = run.outcome_log || {};
             const signalQuality = run.signal_quality || {};
             const logging = state.loggingRunId === run.run_id;
@@ -289,7 +297,7 @@ ${escapeHtml((brief.assets || {}).landing_page_cta || "")}</pre>
                         </div>
                         <span class="revenue-run-confidence">${escapeHtml(signalQuality.insufficient_signal ? `Low ${signalQuality.score || "--"}` : (brief.confidence_score || signalQuality.score || "--"))}</span>
                     </div>
-                    <p class="revenue-run-summary">${escapeHtml(signalQuality.insufficient_signal ? (signalQuality.reasoning || "Not enough signal yet.") : (brief.decision || ((brief.this_week_execution || [])[0] || "No action recorded.")))}</p>
+                    <p class="revenue-run-summary">${escapeHtml(signalQuality.insufficient_signal ? (signalQuality.reasoning || "Not enough signal yet.") : (brief.decision || firstAction || "No action recorded."))}</p>
                     ${canLogResult ? `
                     <form class="revenue-run-result-form" data-run-id="${escapeHtml(run.run_id)}">
                         <label>Experiment result</label>
@@ -309,7 +317,11 @@ ${escapeHtml((brief.assets || {}).landing_page_cta || "")}</pre>
                     ` : `<p class="revenue-inline-label">No experiment logging for this run because the engine intentionally stopped at signal validation.</p>`}
                 </article>
             `;
-        }).join("");
+        }).join("") + (hasMore ? `
+            <button class="btn-reset revenue-load-runs-btn" type="button" data-load-older-runs ${state.loadingOlderRuns ? "disabled" : ""}>
+                ${state.loadingOlderRuns ? "Loading..." : "Load older runs"}
+            </button>
+        ` : "");
     }
 
     function renderWorkspace() {
@@ -318,18 +330,77 @@ ${escapeHtml((brief.assets || {}).landing_page_cta || "")}</pre>
         renderRuns();
     }
 
+    function applyWorkspaceResponse(response, workspace) {
+        state.workspace = workspace;
+        state.etag = response.headers.get("ETag") || "";
+        state.olderRuns = [];
+        state.olderRunsHasMore = false;
+    }
+
     async function fetchWorkspace() {
+        const headers = buildHeaders();
+        if (state.etag) headers["If-None-Match"] = state.etag;
         const response = await fetch("/api/founder/revenue-wedge/workspace", {
             method: "GET",
-            headers: buildHeaders(),
+            headers,
             credentials: "same-origin",
             cache: "no-store",
         });
+        if (response.status === 304) return;
         if (!response.ok) throw new Error(await response.text());
-        state.workspace = await response.json();
+        applyWorkspaceResponse(response, await response.json());
         renderWorkspace();
     }
 
+    async function loadOlderRuns() {
+        if (state.loadingOlderRuns) return;
+        const visible = ((state.workspace && state.workspace.runs) || []).concat(state.olderRuns);
+        const before = state.olderRuns.length
+            ? state.olderRunsNextBefore
+            : (state.workspace && state.workspace.runs_next_before) || (visible.length ? visible[visible.length - 1].created_at : "");
+        if (!before) return;
+        state.loadingOlderRuns = true;
+        renderRuns();
+        try {
+            const response = await fetch(`/api/founder/revenue-wedge/runs?before=${encodeURIComponent(before)}&limit=10`, {
+                method: "GET",
+                headers: buildHeaders(),
+                credentials: "same-origin",
+                cache: "no-store",
+            });
+            if (!response.ok) throw new Error(await response.text());
+            const page = await response.json();
+            state.olderRuns = state.olderRuns.concat(page.runs || []);
+            state.olderRunsHasMore = Boolean(page.has_more);
+            state.olderRunsNextBefore = page.next_before || "";
+        } catch (error) {
+            setFeedback(error.message || "Failed to load older runs.", "error");
+        } finally {
+            state.loadingOlderRuns = false;
+            renderRuns();
+        }
+    }
+
+    function isEditingWorkspace() {
+        const active = document.activeElement;
+        return Boolean(
+            state.savingInput
+            || state.running
+            || state.loggingRunId
+            || state.olderRuns.length
+            || (active && active.closest && active.closest(".revenue-run-result-form, #revenue-input-form"))
+        );
+    }
+
+    function startWorkspacePolling() {
+        window.setInterval(() => {
+            if (document.hidden || isEditingWorkspace()) return;
+            void fetchWorkspace().catch((error) => {
+                console.warn("Revenue wedge workspace refresh failed", error);
+            });
+        }, WORKSPACE_POLL_MS);
+    }
+
     async function handleInputSubmit(event) {
         event.preventDefault();
         if (state.savingInput) return;
@@ -365,7 +436,7 @@ ${escapeHtml((brief.assets || {}).landing_page_cta || "")}</pre>
                 }
                 throw new Error(message);
             }
-            state.workspace = await response.json();
+            applyWorkspaceResponse(response, await response.json());
             form.reset();
             setFeedback("Input added to the founder workspace.", "success");
             renderWorkspace();
@@ -389,7 +460,7 @@ ${escapeHtml((brief.assets || {}).landing_page_cta || "")}</pre>
                 credentials: "same-origin",
             });
             if (!response.ok) throw new Error(await response.text());
-            state.workspace = await response.json();
+            applyWorkspaceResponse(response, await response.json());
             renderWorkspace();
         } catch (error) {
             setFeedback(error.message || "Failed to remove founder input.", "error");
@@ -398,6 +469,55 @@ ${escapeHtml((brief.assets || {}).landing_page_cta || "")}</pre>
         }
     }
 
+    const RUN_STAGE_MESSAGES = {
+        queued: "Queued your weekly decision brief...",
+        extracting: "Extracting revenue signals from your inputs...",
+        clustering: "Clustering repeated signals...",
+        deciding: "Deciding this week's wedge...",
+        validating: "Validating the decision brief...",
+    };
+
+    async function readErrorMessage(response) {
+        let message = await response.text();
+        try {
+            const payload = JSON.parse(message);
+            message = payload.detail || message;
+        } catch (_) {
+            // Keep plain text fallback.
+        }
+        return message;
+    }
+
+    async function followRunEvents(eventsUrl) {
+        // EventSource cannot send session headers, so read the SSE stream through fetch.
+        const response = await fetch(eventsUrl, {
+            method: "GET",
+            headers: buildHeaders(),
+            credentials: "same-origin",
+            cache: "no-store",
+        });
+        if (!response.ok || !response.body) throw new Error(await readErrorMessage(response));
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = "";
+        while (true) {
+            const { value, done } = await reader.read();
+            if (done) break;
+            buffer += decoder.decode(value, { stream: true });
+            const frames = buffer.split("\n\n");
+            buffer = frames.pop();
+            for (const frame of frames) {
+                const dataLine = frame.split("\n").find((line) => line.startsWith("data: "));
+                if (!dataLine) continue;
+                const event = JSON.parse(dataLine.slice(6));
+                if (event.stage === "completed") return;
+                if (event.stage === "failed") throw new Error(event.error || "Revenue Wedge Engine failed.");
+                if (RUN_STAGE_MESSAGES[event.stage]) setFeedback(RUN_STAGE_MESSAGES[event.stage], "neutral");
+            }
+        }
+        throw new Error("Lost the connection to the Revenue Wedge run. Refresh to see whether it finished.");
+    }
+
     async function handleRun() {
         if (state.running) return;
         const inputCount = ((state.workspace && state.workspace.inputs) || []).length;
@@ -406,27 +526,19 @@ ${escapeHtml((brief.assets || {}).landing_page_cta || "")}</pre>
             return;
         }
         setRunBusy(true);
-        setFeedback("Generating your weekly decision brief...", "neutral");
+        setFeedback(RUN_STAGE_MESSAGES.queued, "neutral");
         try {
             const response = await fetch("/api/founder/revenue-wedge/run", {
                 method: "POST",
                 headers: buildJsonHeaders(),
                 credentials: "same-origin",
-                body: JSON.stringify({}),
+                body: JSON.stringify({ mode: "job" }),
             });
-            if (!response.ok) {
-                let message = await response.text();
-                try {
-                    const payload = JSON.parse(message);
-                    message = payload.detail || message;
-                } catch (_) {
-                    // Keep plain text fallback.
-                }
-                throw new Error(message);
-            }
-            state.workspace = await response.json();
+            if (!response.ok) throw new Error(await readErrorMessage(response));
+            const job = await response.json();
+            await followRunEvents(job.events_url);
+            await fetchWorkspace();
             setFeedback("Weekly decision brief generated.", "success");
-            renderWorkspace();
         } catch (error) {
             setFeedback(error.message || "Revenue Wedge Engine failed.", "error");
         } finally {
@@ -460,7 +572,7 @@ ${escapeHtml((brief.assets || {}).landing_page_cta || "")}</pre>
                 body: JSON.stringify(payload),
             });
             if (!response.ok) throw new Error(await response.text());
-            state.workspace = await response.json();
+            applyWorkspaceResponse(response, await response.json());
             state.loggingRunId = "";
             setFeedback("Experiment result logged.", "success");
             renderWorkspace();
@@ -481,6 +593,11 @@ ${escapeHtml((brief.assets || {}).landing_page_cta || "")}</pre>
         if (runButton) runButton.addEventListener("click", handleRun);
         if (inputsList) inputsList.addEventListener("click", handleInputDelete);
         if (runsList) runsList.addEventListener("submit", handleRunResultSubmit);
+        if (runsList) {
+            runsList.addEventListener("click", (event) => {
+                if (event.target.closest("[data-load-older-runs]")) void loadOlderRuns();
+            });
+        }
     }
 
     window.addEventListener("DOMContentLoaded", () => {
@@ -489,5 +606,6 @@ ${escapeHtml((brief.assets || {}).landing_page_cta || "")}</pre>
         void fetchWorkspace().catch((error) => {
             setFeedback(error.message || "Failed to load revenue wedge workspace.", "error");
         });
+        startWorkspacePolling();
     });
 })();